@@ -3,11 +3,19 @@ Video analyzer for social media content
 """
 
 import json
+import re
 import time
 from typing import Dict, List, Any, Optional
 from datetime import datetime
 
 
+# Sentiment keywords, matched anywhere in the lowercased caption. The lookahead
+# finds overlapping occurrences, so one scan per polarity gives the same
+# distinct-keyword counts as testing each word with `in`.
+_POSITIVE_RE = re.compile('(?=(amazing|awesome|great|love|best|fantastic|wonderful|excellent))')
+_NEGATIVE_RE = re.compile('(?=(terrible|awful|bad|worst|hate|horrible|disappointing))')
+
+
 class VideoAnalyzer:
     """
     Analyzer for social media videos/reels
@@ -53,6 +61,27 @@ class VideoAnalyzer:
         
         return results
     
+    def split_batch_result(self, batch_result: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """
+        Split a batch analysis into one single-reel result per analyzed reel
+        
+        Args:
+            batch_result: Result returned by analyze_reels_batch
+            
+        Returns:
+            List of results shaped like analyze_reels_batch output for one reel
+        """
+        return [
+            {
+                'total_reels': 1,
+                'analysis_type': batch_result.get('analysis_type'),
+                'timestamp': batch_result.get('timestamp'),
+                'reels_analysis': [analysis],
+                'summary': self._generate_summary([analysis])
+            }
+            for analysis in batch_result.get('reels_analysis', [])
+        ]
+    
     def _analyze_single_reel(self, reel_data: Dict[str, Any], analysis_type: str) -> Dict[str, Any]:
         """
         Analyze a single reel
@@ -153,11 +182,8 @@ class VideoAnalyzer:
         caption = reel_data.get('caption', '').lower()
         
         # Simple keyword-based sentiment analysis
-        positive_words = ['amazing', 'awesome', 'great', 'love', 'best', 'fantastic', 'wonderful', 'excellent']
-        negative_words = ['terrible', 'awful', 'bad', 'worst', 'hate', 'horrible', 'disappointing']
-        
-        positive_count = sum(1 for word in positive_words if word in caption)
-        negative_count = sum(1 for word in negative_words if word in caption)
+        positive_count = len(set(_POSITIVE_RE.findall(caption)))
+        negative_count = len(set(_NEGATIVE_RE.findall(caption)))
         
         if positive_count > negative_count:
             sentiment = 'positive'
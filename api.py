@@ -4,6 +4,10 @@ import json
 import time
 import os
 import re
+import hashlib
+import atexit
+import itertools
+import threading
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
@@ -19,6 +23,8 @@ from datetime import datetime
 import instaloader
 from instaloader import Profile, Hashtag, Post
 import requests
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
 
 # Import platform resolver
 from platform_resolver import PlatformResolver, detect_platform, get_platform_info
@@ -63,12 +69,32 @@ load_dotenv()
 # Mistral API Configuration
 MISTRAL_API_URL = "https://api.mistral.ai/v1/chat/completions"
 MISTRAL_API_KEY = os.getenv('MISTRAL_API_KEY', '')  # Load from environment variable
+AI_MAX_WORKERS = int(os.getenv('AI_MAX_WORKERS', '8'))  # Concurrent Mistral completion requests
 
 # Instagram credentials (load from environment variables)
 INSTA_USER = os.getenv('INSTAGRAM_USERNAME', '')  # Load from environment variable
 INSTA_PASS = os.getenv('INSTAGRAM_PASSWORD', '')  # Load from environment variable
 
 
+# Instagram target forms accepted by /api/analyze, classified in a single match
+INSTAGRAM_TARGET_PATTERN = re.compile(
+    r'^(?:(?P<url>https?://(?:www\.)?instagram\.com/\S+)'
+    r'|@(?P<profile>[\w.]+)'
+    r'|#(?P<hashtag>\w+)'
+    r'|(?P<username>[\w.]+))$',
+    re.IGNORECASE
+)
+
+
+def classify_instagram_target(target):
+    """Classify an analyze target as 'url', 'profile', 'hashtag' or 'username'
+
+    Returns None when the target is none of the accepted Instagram forms.
+    """
+    match = INSTAGRAM_TARGET_PATTERN.match(target.strip()) if target else None
+    return match.lastgroup if match else None
+
+
 # Setup Chrome options for Selenium
 def get_chrome_options():
     chrome_options = Options()
@@ -92,6 +118,11 @@ def login_to_instagram(driver):
         print("Logging in to Instagram...")
         driver.get("https://www.instagram.com/accounts/login/")
 
+        # An authenticated session is sent away from the login form
+        if driver.get_cookie("sessionid") or "/accounts/login" not in driver.current_url:
+            print("Already logged in to Instagram")
+            return True
+
         # Wait for login page to load with retry mechanism
         loaded = False
         for attempt in range(3):
@@ -168,6 +199,7 @@ def login_to_instagram(driver):
             
             if not login_success:
                 print("Could not confirm successful login, but continuing...")
+            return login_success
                 
         except Exception as e:
             print(f"Error during login form interaction: {str(e)}")
@@ -226,6 +258,47 @@ def get_webdriver():
         return None
 
 
+# Chrome is expensive to start, so one browser is shared by all Selenium
+# requests. The lock serializes access since a WebDriver is not thread-safe.
+_shared_driver = None
+_driver_lock = threading.Lock()
+# Whether the shared browser holds an Instagram login; guarded by _driver_lock
+_driver_logged_in = False
+
+
+def get_shared_webdriver():
+    """Return the shared Chrome WebDriver, (re)starting it when needed.
+
+    Callers must hold _driver_lock.
+    """
+    global _shared_driver
+    if _shared_driver is not None:
+        try:
+            _shared_driver.current_url  # Raises if the browser session died
+            return _shared_driver
+        except Exception:
+            print("Shared WebDriver is no longer responsive, restarting it")
+            quit_shared_webdriver()
+
+    _shared_driver = get_webdriver()
+    return _shared_driver
+
+
+def quit_shared_webdriver():
+    """Shut down the shared Chrome WebDriver if it is running"""
+    global _shared_driver, _driver_logged_in
+    if _shared_driver is not None:
+        try:
+            _shared_driver.quit()
+        except Exception as e:
+            print(f"Error closing WebDriver: {str(e)}")
+        _shared_driver = None
+    _driver_logged_in = False
+
+
+atexit.register(quit_shared_webdriver)
+
+
 def call_mistral_api(prompt):
     """Call Mistral AI API for text generation"""
     if not MISTRAL_API_KEY:
@@ -481,67 +554,151 @@ def parse_count(count_text):
         return 0
 
 
-def analyze_reel_with_ai(reel_data):
-    """Analyze reel data using Mistral AI"""
+def prepare_prompts(reel_data):
+    """Build the Mistral prompts used to analyze a single reel"""
+    caption = reel_data.get("caption", "")
+    comments = reel_data.get("top_comments", [])
+
+    # Prepare comments text for analysis
+    comments_text = "\n".join([f"{c.get('user', '')}: {c.get('comment', '')}" for c in comments])
+
+    return {
+        "summary": f"Summarize this Instagram reel content in one sentence: {caption}\n\nComments:\n{comments_text}",
+        "category": f"Classify this Instagram reel content into one or more categories: {caption}. "
+                    "Options: Comedy, Animals, Skits, Fails, Dance, Kids, Acting. "
+                    "Return only the category names separated by commas.",
+        "sentiment": f"Analyze the sentiment of this Instagram content: {caption}. "
+                     "Return only one of these: Positive, Negative, Funny, Relatable, Trolling.",
+        "comments": f"Summarize the theme of these Instagram comments: {comments_text}. "
+                    "Return a one-sentence summary."
+    }
+
+
+def _encode_embeddings(texts):
+    """Encode all texts in a single embedder call, falling back to zero vectors"""
+    if embedder is None:
+        print("Embedder not initialized, using zero vector fallback")
+        return [[0.0] * 384 for _ in texts]  # Standard dimension for all-MiniLM-L6-v2
+
     try:
-        caption = reel_data.get("caption", "")
-        comments = reel_data.get("top_comments", [])
-        
-        # Prepare comments text for analysis
-        comments_text = "\n".join([f"{c.get('user', '')}: {c.get('comment', '')}" for c in comments])
-        
-        # Generate AI summary
-        summary_prompt = f"Summarize this Instagram reel content in one sentence: {caption}\n\nComments:\n{comments_text}"
-        ai_summary = call_mistral_api(summary_prompt) or "Summary unavailable"
-
-        # Categorization
-        category_prompt = f"Classify this Instagram reel content into one or more categories: {caption}. " \
-                          "Options: Comedy, Animals, Skits, Fails, Dance, Kids, Acting. " \
-                          "Return only the category names separated by commas."
-        category_result = call_mistral_api(category_prompt) or ""
-        category_list = [cat.strip() for cat in category_result.split(",") if cat.strip()]
-
-        # Sentiment analysis
-        sentiment_prompt = f"Analyze the sentiment of this Instagram content: {caption}. " \
-                           "Return only one of these: Positive, Negative, Funny, Relatable, Trolling."
-        sentiment = call_mistral_api(sentiment_prompt) or "Unknown"
-
-        # Comment summary
-        comment_prompt = f"Summarize the theme of these Instagram comments: {comments_text}. " \
-                         "Return a one-sentence summary."
-        comment_summary = call_mistral_api(comment_prompt) or "No comment summary"
-
-        # Embeddings
-        embeddings = []
-        if embedder is not None:
-            try:
-                embedding_text = f"{caption} {ai_summary}"
-                embeddings = embedder.encode(embedding_text).tolist()
-            except Exception as e:
-                print(f"Embedding generation failed: {str(e)}")
-                # Create a fallback embedding with correct dimensions
-                embeddings = [0.0] * 384  # Standard dimension for all-MiniLM-L6-v2
+        return embedder.encode(texts).tolist()
+    except Exception as e:
+        print(f"Embedding generation failed: {str(e)}")
+        # Create a fallback embedding with correct dimensions
+        return [[0.0] * 384 for _ in texts]
+
+
+def _caption_key(reel_data):
+    """Return a hash key for a reel's normalized caption, or None if it has no caption"""
+    caption = (reel_data.get("caption") or "").strip().lower()
+    if not caption:
+        return None
+    return hashlib.blake2b(caption.encode("utf-8"), digest_size=16).digest()
+
+
+def batch_analyze(reels):
+    """Analyze a list of reels using Mistral AI
+
+    Reels sharing the same caption (reposts) are analyzed once and the
+    result is copied to every duplicate. Completion prompts are sent
+    concurrently and all embeddings are computed in one batched encode call.
+    """
+    if not reels:
+        return []
+
+    # Group duplicate captions so only one representative per group is analyzed
+    representatives = []
+    representative_index = {}
+    reel_slots = []
+    for reel in reels:
+        key = _caption_key(reel)
+        if key is None or key not in representative_index:
+            if key is not None:
+                representative_index[key] = len(representatives)
+            reel_slots.append(len(representatives))
+            representatives.append(reel)
         else:
-            print("Embedder not initialized, using zero vector fallback")
-            embeddings = [0.0] * 384  # Standard dimension for all-MiniLM-L6-v2
-
-        return {
-            "ai_summary": ai_summary,
-            "category": category_list,
-            "sentiment": sentiment,
-            "top_comment_summary": comment_summary,
-            "embeddings": embeddings[:10]  # First 10 dimensions
-        }
+            reel_slots.append(representative_index[key])
 
-    except Exception as e:
-        print(f"AI analysis error: {str(e)}")
-        return {
+    if len(representatives) < len(reels):
+        print(f"Skipping AI analysis for {len(reels) - len(representatives)} duplicate reels")
+
+    analyses = _analyze_unique_reels(representatives)
+    return [
+        {**analyses[slot], "category": list(analyses[slot]["category"]), "embeddings": list(analyses[slot]["embeddings"])}
+        for slot in reel_slots
+    ]
+
+
+def _analyze_unique_reels(reels):
+    """Run the AI analysis for reels that are known to be distinct"""
+    prompts = [prepare_prompts(reel) for reel in reels]
+
+    # Chat completions cannot be batched, so fan them out over a thread pool
+    with ThreadPoolExecutor(max_workers=AI_MAX_WORKERS) as executor:
+        futures = [
+            {kind: executor.submit(call_mistral_api, prompt) for kind, prompt in reel_prompts.items()}
+            for reel_prompts in prompts
+        ]
+
+    analyses = []
+    for reel_futures in futures:
+        try:
+            category_result = reel_futures["category"].result() or ""
+            analyses.append({
+                "ai_summary": reel_futures["summary"].result() or "Summary unavailable",
+                "category": [cat.strip() for cat in category_result.split(",") if cat.strip()],
+                "sentiment": reel_futures["sentiment"].result() or "Unknown",
+                "top_comment_summary": reel_futures["comments"].result() or "No comment summary"
+            })
+        except Exception as e:
+            print(f"AI analysis error: {str(e)}")
+            analyses.append(None)
+
+    # Embeddings for every successfully analyzed reel in one call
+    analyzed = [(reel, analysis) for reel, analysis in zip(reels, analyses) if analysis is not None]
+    embeddings = _encode_embeddings([f"{reel.get('caption', '')} {analysis['ai_summary']}" for reel, analysis in analyzed])
+    for (_, analysis), embedding in zip(analyzed, embeddings):
+        analysis["embeddings"] = embedding[:10]  # First 10 dimensions
+
+    return [
+        analysis if analysis is not None else {
             "ai_summary": "Analysis failed",
             "category": [],
             "sentiment": "Unknown",
             "top_comment_summary": "Analysis failed",
             "embeddings": []
         }
+        for analysis in analyses
+    ]
+
+
+def quantize_embedding(embedding):
+    """Quantize a float embedding to int8 values and the scale needed to restore it"""
+    values = np.asarray(embedding, dtype=np.float32)
+    max_abs = float(np.abs(values).max()) if values.size else 0.0
+    scale = max_abs / 127 if max_abs else 1.0
+    return (values / scale).round().astype(np.int8).tolist(), scale
+
+
+def dequantize_embedding(quantized, scale):
+    """Restore an approximate float embedding from its int8 values and scale"""
+    return (np.asarray(quantized, dtype=np.int8).astype(np.float32) * scale).tolist()
+
+
+def analyze_reel_with_ai(reel_data):
+    """Analyze reel data using Mistral AI"""
+    return batch_analyze([reel_data])[0]
+
+
+def parse_upload_date(date_text):
+    """Parse an ISO 8601 upload date (optionally 'Z' suffixed) into a datetime"""
+    if not date_text:
+        return None
+    try:
+        return datetime.fromisoformat(date_text.rstrip('Z'))
+    except (TypeError, ValueError):
+        return None
 
 
 def scrape_instagram_reels(driver, target: str, max_reels: int = 10) -> list:
@@ -1022,7 +1179,9 @@ def scrape_with_instaloader(target: str, max_reels: int = 10) -> list:
                     # Get comments with error handling
                     top_comments = []
                     try:
-                        comments = list(post.get_comments())[:5]  # Top 5 comments
+                        # Stop the paginated comment iterator after 5 comments instead of
+                        # fetching every page and slicing afterwards
+                        comments = itertools.islice(post.get_comments(), 5)  # Top 5 comments
                         for comment in comments:
                             try:
                                 top_comments.append({
@@ -1086,6 +1245,7 @@ def scrape_with_instaloader(target: str, max_reels: int = 10) -> list:
 # API Routes
 @app.route('/api/analyze', methods=['POST'])
 def analyze_reels():
+    global _driver_logged_in
     data = request.json
     if not data or 'target' not in data:
         return jsonify({'error': 'Missing target parameter'}), 400
@@ -1094,14 +1254,15 @@ def analyze_reels():
     max_reels = data.get('max_reels', 10)
     use_login = data.get('use_login', True)
     scraping_method = data.get('scraping_method', 'instaloader')  # 'selenium' or 'instaloader'
+    embedding_format = data.get('embedding_format', 'float')  # 'float' or 'int8'
     
     # Detect platform from target URL
     detected_platform = platform_resolver.detect_platform(target)
     
     # If platform is unknown, try to detect from target format
     if detected_platform == 'unknown':
-        # Check if it's a username (no URL indicators)
-        if not target.startswith(('http://', 'https://', 'www.')) and '/' not in target:
+        # Check if it's a username, @profile or #hashtag (no URL indicators)
+        if classify_instagram_target(target) in ('profile', 'hashtag', 'username'):
             # Assume Instagram username for backward compatibility
             detected_platform = 'instagram'
             print(f"Assuming Instagram platform for target: {target}")
@@ -1140,30 +1301,30 @@ def analyze_reels():
         
         if scraping_method.lower() == 'selenium':
             print(f"Using Selenium method for target: {target}")
-            driver = get_webdriver()
-            if not driver:
-                return jsonify({'error': 'Failed to initialize browser'}), 500
-            
-            try:
-                # Login if requested
-                if use_login:
-                    login_success = login_to_instagram(driver)
-                    if not login_success:
+            with _driver_lock:
+                driver = get_shared_webdriver()
+                if not driver:
+                    return jsonify({'error': 'Failed to initialize browser'}), 500
+                
+                # Login if requested, once per browser session
+                if use_login and not _driver_logged_in:
+                    _driver_logged_in = bool(login_to_instagram(driver))
+                    if not _driver_logged_in:
                         print("Proceeding without login - some content might be unavailable")
                 
                 reels = scrape_instagram_reels(driver, target, max_reels=max_reels)
-                
-            finally:
-                if driver:
-                    driver.quit()
         
         # Process the reels through AI analysis
         if reels:
             print(f"Processing {len(reels)} reels through AI analysis")
-            for reel in reels:
+            ai_analyses = batch_analyze(reels)
+            # Preallocate so each reel is written to its own slot in scrape order
+            results = [None] * len(reels)
+            for i, (reel, ai_analysis) in enumerate(zip(reels, ai_analyses)):
                 try:
-                    ai_analysis = analyze_reel_with_ai(reel)
-                    
+                    # Parse the upload date once here so clients only have to display it
+                    upload_dt = parse_upload_date(reel.get("upload_date", ""))
+
                     # Create final output structure
                     full_result = {
                         "reel_id": reel.get("reel_id", ""),
@@ -1174,16 +1335,25 @@ def analyze_reels():
                         "category": ai_analysis.get("category", []),
                         "likes": reel.get("likes", 0),
                         "views": reel.get("views", 0),
+                        "upload_date": reel.get("upload_date", ""),
+                        "upload_date_display": f"{upload_dt:%Y-%m-%d %H:%M:%S}" if upload_dt else "",
                         "sentiment": ai_analysis.get("sentiment", ""),
                         "top_comment_summary": ai_analysis.get("top_comment_summary", ""),
                         "embeddings": ai_analysis.get("embeddings", []),
                         "top_comments": reel.get("top_comments", [])
                     }
+
+                    # Compact int8 embeddings (4x smaller) for clients that store them
+                    if embedding_format == 'int8' and full_result["embeddings"]:
+                        full_result["embeddings"], full_result["embeddings_scale"] = quantize_embedding(full_result["embeddings"])
                     
-                    results.append(full_result)
+                    results[i] = full_result
                 except Exception as e:
                     print(f"Error analyzing reel: {str(e)}")
                     continue
+
+            # Drop the slots of reels that failed to process
+            results = [result for result in results if result is not None]
         else:
             print("No reels found to analyze")
         
@@ -3,6 +3,7 @@ Dependencies and shared objects for the API
 """
 
 import os
+import time
 import torch
 from sentence_transformers import SentenceTransformer
 from typing import Optional
@@ -10,6 +11,11 @@ from typing import Optional
 # Global instances
 _embedder: Optional[SentenceTransformer] = None
 
+# Seconds to wait before retrying a failed embedder load, so /health polling
+# doesn't reload the model on every request while it is unavailable
+EMBEDDER_RETRY_INTERVAL = 60
+_embedder_failed_at: Optional[float] = None
+
 
 def get_embedder() -> Optional[SentenceTransformer]:
     """
@@ -18,9 +24,11 @@ def get_embedder() -> Optional[SentenceTransformer]:
     Returns:
         Optional[SentenceTransformer]: The embedder instance or None if initialization fails
     """
-    global _embedder
+    global _embedder, _embedder_failed_at
     
     if _embedder is None:
+        if _embedder_failed_at is not None and time.monotonic() - _embedder_failed_at < EMBEDDER_RETRY_INTERVAL:
+            return None
         try:
             # Fix for 'Cannot copy out of meta tensor' error
             device = 'cuda' if torch.cuda.is_available() else 'cpu'
@@ -41,6 +49,7 @@ def get_embedder() -> Optional[SentenceTransformer]:
             print(f"Error initializing SentenceTransformer: {str(e)}")
             # Fallback to simple embedding if model fails to load
             _embedder = None
+            _embedder_failed_at = time.monotonic()
     
     return _embedder
 
@@ -0,0 +1,144 @@
+"""
+Two-tier (memory + SQLite) cache for LLM responses keyed on a prompt hash
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+from utils.sqlite import open_sqlite
+
+
+class LLMResponseCache:
+    """
+    Cache of LLM completions keyed by sha256(provider, model, prompt, sampling params)
+
+    Lookups hit a small in-process LRU first and fall back to a SQLite file, so
+    responses survive app restarts and are shared between the Streamlit app and
+    the API server. Entries expire after `ttl` seconds. The SQLite connection is
+    shared across worker threads and guarded by a lock.
+    """
+
+    def __init__(self, path: str, ttl: int = 86400, memory_size: int = 256):
+        """
+        Initialize the cache
+
+        Args:
+            path: SQLite database file
+            ttl: Seconds an entry stays valid
+            memory_size: Maximum number of entries kept in the in-memory tier
+        """
+        self.path = path
+        self.ttl = ttl
+        self.memory_size = memory_size
+        self.hits = 0
+        self.misses = 0
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+
+        self._conn = open_sqlite(path)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS llm_responses "
+            "(key TEXT PRIMARY KEY, response TEXT NOT NULL, expires_at REAL NOT NULL)"
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def make_key(provider: str, model: str, prompt: str, temperature: float, max_tokens: int) -> str:
+        """Hash everything that determines the completion into a cache key"""
+        payload = json.dumps({
+            'p': provider,
+            'm': model,
+            't': temperature,
+            'mt': max_tokens,
+            'prompt': prompt
+        }, sort_keys=True)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached response for key, or None on a miss"""
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None and entry[0] > now:
+                self._memory.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+
+            row = self._conn.execute(
+                "SELECT response, expires_at FROM llm_responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is not None and row[1] > now:
+                self._remember(key, row[1], row[0])
+                self.hits += 1
+                return row[0]
+
+            self.misses += 1
+            return None
+
+    def set(self, key: str, response: str):
+        """Store a response under key"""
+        expires_at = time.time() + self.ttl
+        with self._lock:
+            self._remember(key, expires_at, response)
+            self._conn.execute(
+                "INSERT OR REPLACE INTO llm_responses (key, response, expires_at) VALUES (?, ?, ?)",
+                (key, response, expires_at)
+            )
+            self._conn.commit()
+
+    def _remember(self, key: str, expires_at: float, response: str):
+        """Put an entry in the memory tier, evicting the least recently used one"""
+        self._memory[key] = (expires_at, response)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_size:
+            self._memory.popitem(last=False)
+
+    def purge_expired(self) -> int:
+        """Delete expired rows from the database, returning how many were removed"""
+        with self._lock:
+            cursor = self._conn.execute("DELETE FROM llm_responses WHERE expires_at <= ?", (time.time(),))
+            self._conn.commit()
+            return cursor.rowcount
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters for display"""
+        with self._lock:
+            entries = self._conn.execute("SELECT COUNT(*) FROM llm_responses").fetchone()[0]
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'entries': entries,
+            'path': self.path
+        }
+
+
+_response_cache = None
+_response_cache_lock = threading.Lock()
+
+
+def get_response_cache() -> Optional[LLMResponseCache]:
+    """
+    Return the process-wide response cache, or None when caching is disabled
+
+    Configured with LLM_CACHE_PATH (default ~/.shorty/llm_cache.db) and
+    LLM_CACHE_TTL in seconds (default 86400, 0 disables the cache).
+    """
+    global _response_cache
+    ttl = int(os.getenv('LLM_CACHE_TTL', '86400'))
+    if ttl <= 0:
+        return None
+    with _response_cache_lock:
+        if _response_cache is None:
+            path = os.getenv('LLM_CACHE_PATH', os.path.join(os.path.expanduser('~'), '.shorty', 'llm_cache.db'))
+            try:
+                _response_cache = LLMResponseCache(path, ttl=ttl)
+            except (sqlite3.Error, OSError) as e:
+                print(f"LLM response cache unavailable: {e}")
+                return None
+        return _response_cache
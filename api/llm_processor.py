@@ -2,28 +2,134 @@
 LLM Processing Service for video analysis
 """
 
+import asyncio
 import requests
+from requests.adapters import HTTPAdapter
 import json
+import random
+import re
+import threading
 import time
-from typing import Dict, Any, Optional, List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Optional, List, Iterator, Tuple
 from datetime import datetime
 import os
 from flask_sqlalchemy import SQLAlchemy
 from api.models import db, LLMAnalysisResult
+from api.llm_cache import get_response_cache
+from utils.circuit_breaker import CircuitBreaker
+from utils.rate_limiter import RateLimiter
+
+try:
+    # Faster JSON for request bodies, provider responses and stream chunks
+    import orjson
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:
+    _json_loads = json.loads
+
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode('utf-8')
+
+# Fallback sentiment keywords, matched anywhere in the lowercased content. The
+# lookahead finds overlapping occurrences, so one C-level scan per polarity
+# gives the same distinct-keyword counts as testing each word with `in`.
+_POSITIVE_WORDS = ('amazing', 'awesome', 'great', 'love', 'best', 'fantastic', 'wonderful', 'excellent', 'good', 'happy', 'nice')
+_NEGATIVE_WORDS = ('terrible', 'awful', 'bad', 'worst', 'hate', 'horrible', 'disappointing', 'sad', 'angry', 'poor')
+_POSITIVE_RE = re.compile('(?=(' + '|'.join(_POSITIVE_WORDS) + '))')
+_NEGATIVE_RE = re.compile('(?=(' + '|'.join(_NEGATIVE_WORDS) + '))')
+
+# Provider responses worth retrying; other 4xx (bad key, invalid request) fail immediately
+RETRY_STATUS_CODES = {408, 429, 500, 502, 503, 504}
+# Upper bound in seconds on a single backoff sleep
+RETRY_MAX_DELAY = 8.0
+
+# One breaker per provider, shared by every processor instance in the process
+_circuit_breakers: Dict[str, CircuitBreaker] = {}
+# Per-provider (requests/minute, tokens/minute) limiters, None when not configured
+_rate_limiters: Dict[str, Tuple[Optional[RateLimiter], Optional[RateLimiter]]] = {}
+# Guards creation of the per-provider breakers and limiters
+_provider_lock = threading.Lock()
+
+
+class ProviderUnavailableError(requests.exceptions.RequestException):
+    """Raised instead of calling a provider whose circuit breaker is open"""
+
+
+def get_circuit_breaker(provider: str) -> CircuitBreaker:
+    """
+    Return the process-wide circuit breaker for provider
+
+    Opens after LLM_BREAKER_FAILURES consecutive failures (default 5) and
+    probes again after LLM_BREAKER_TIMEOUT seconds (default 60).
+    """
+    with _provider_lock:
+        breaker = _circuit_breakers.get(provider)
+        if breaker is None:
+            breaker = _circuit_breakers[provider] = CircuitBreaker(
+                failure_threshold=int(os.getenv('LLM_BREAKER_FAILURES', '5')),
+                recovery_timeout=float(os.getenv('LLM_BREAKER_TIMEOUT', '60'))
+            )
+        return breaker
+
+
+def get_rate_limiters(provider: str) -> Tuple[Optional[RateLimiter], Optional[RateLimiter]]:
+    """
+    Return the process-wide (requests/minute, tokens/minute) limiters for provider
+
+    Budgets come from <PROVIDER>_RPM and <PROVIDER>_TPM, e.g. MISTRAL_RPM=60;
+    a missing or zero budget leaves that limit off.
+    """
+    with _provider_lock:
+        limiters = _rate_limiters.get(provider)
+        if limiters is None:
+            rpm = float(os.getenv(f'{provider.upper()}_RPM', '0'))
+            tpm = float(os.getenv(f'{provider.upper()}_TPM', '0'))
+            limiters = _rate_limiters[provider] = (
+                RateLimiter.per_minute(rpm, burst=max(1, int(rpm // 10))) if rpm > 0 else None,
+                RateLimiter.per_minute(tpm, burst=max(1, int(tpm // 10))) if tpm > 0 else None
+            )
+        return limiters
+
 
 class LLMProcessor:
     """
     Service for processing video content using LLM APIs
     """
     
-    def __init__(self, provider: str = 'mistral'):
+    def __init__(self, provider: str = 'mistral', api_key: Optional[str] = None, api_url: Optional[str] = None):
         self.provider = provider
-        self.api_key = self._get_api_key()
-        self.api_url = self._get_api_url()
+        # Explicit values (e.g. from a user's app session) take precedence over the environment
+        self.api_key = api_key if api_key is not None else self._get_api_key()
+        self.api_url = api_url if api_url is not None else self._get_api_url()
         self.model = self._get_model()
         self.temperature = float(os.getenv('LLM_TEMPERATURE', '0.7'))
         self.max_tokens = int(os.getenv('LLM_MAX_TOKENS', '1000'))
         self.timeout = int(os.getenv('LLM_TIMEOUT', '30'))
+        self.max_prompt_chars = int(os.getenv('LLM_MAX_PROMPT_CHARS', '8000'))
+        # Only deterministic completions are reused unless sampled ones are opted in
+        self.cache_sampled = os.getenv('LLM_CACHE_SAMPLED', 'false').lower() == 'true'
+        self.response_cache = get_response_cache()
+        # One prompt per video returning summary, sentiment and topics as JSON,
+        # instead of three prompts that each resend the content
+        self.use_combined = os.getenv('LLM_COMBINED_PROMPT', 'true').lower() == 'true'
+        # Keep connections to the provider alive instead of a new TCP+TLS handshake per call
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self.max_retries = int(os.getenv('LLM_RETRY_MAX', '3'))
+        self.retry_base = float(os.getenv('LLM_RETRY_BASE', '0.5'))
+        self.circuit_breaker = get_circuit_breaker(self.provider)
+        self.request_limiter, self.token_limiter = get_rate_limiters(self.provider)
+        # Reused for every concurrent round instead of a new pool per complete_many call
+        self.executor = ThreadPoolExecutor(max_workers=int(os.getenv('LLM_MAX_CONCURRENCY', '8')),
+                                           thread_name_prefix='llm')
+    
+    def close(self):
+        """Release the worker threads and pooled connections; the processor must not be used afterwards"""
+        self.executor.shutdown(wait=False)
+        self.session.close()
     
     def _get_api_key(self) -> str:
         """Get API key based on provider"""
@@ -56,7 +162,8 @@ class LLMProcessor:
         return 'mistral-tiny'
     
     def process_video(self, video_id: str, video_url: str, platform: str, 
-                     transcript: Optional[str] = None, metadata: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+                     transcript: Optional[str] = None, metadata: Optional[Dict[str, Any]] = None,
+                     summary: Optional[str] = None) -> Dict[str, Any]:
         """
         Process a video using LLM
         
@@ -66,97 +173,175 @@ class LLMProcessor:
             platform: Platform name
             transcript: Optional transcript text
             metadata: Optional metadata
+            summary: Optional summary already generated (e.g. by stream_process_video)
             
         Returns:
             Dictionary with analysis results
         """
+        return self.process_videos_batch([{
+            'video_id': video_id,
+            'video_url': video_url,
+            'platform': platform,
+            'transcript': transcript,
+            'metadata': metadata,
+            'summary': summary
+        }])[0]
+    
+    def process_videos_batch(self, videos: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Process several videos, sending every LLM prompt of the batch concurrently
+        
+        Args:
+            videos: Dictionaries with the process_video arguments (video_id,
+                video_url, platform and optionally transcript, metadata, summary)
+            
+        Returns:
+            List of analysis results in the same order as videos
+        """
         start_time = time.time()
+        results: List[Optional[Dict[str, Any]]] = [None] * len(videos)
+        # (index, analysis_result, content, offset of the video's first prompt)
+        pending = []
+        prompts = []
         
         try:
-            # Check if we already have cached results
-            cached_result = self._get_cached_result(video_id)
-            if cached_result:
-                cached_result['cached'] = True
-                return cached_result
-            
-            # Create new analysis result
-            analysis_result = LLMAnalysisResult(
-                video_id=video_id,
-                video_url=video_url,
-                platform=platform,
-                llm_provider=self.provider
-            )
-            
-            # Add to database session
-            db.session.add(analysis_result)
-            db.session.flush()  # Get the ID without committing
-            
-            # Prepare content for analysis
-            content = self._prepare_content(transcript, metadata)
-            
-            # Generate summary
-            summary = self._generate_summary(content, platform)
-            analysis_result.summary = summary
-            
-            # Analyze sentiment
-            sentiment_result = self._analyze_sentiment(content)
-            analysis_result.sentiment = sentiment_result['sentiment']
-            analysis_result.confidence_score = sentiment_result['confidence']
-            
-            # Extract topics
-            topics = self._extract_topics(content)
-            analysis_result.set_topics(topics)
-            
-            # Store transcript if available
-            if transcript:
-                analysis_result.transcript_used = transcript[:1000]  # Limit transcript length
-            
-            # Calculate processing duration
-            analysis_result.processing_duration_seconds = time.time() - start_time
+            # Look up every video's earlier result in one query rather than one per video
+            cached_results = self._get_cached_results([video['video_id'] for video in videos])
+            for index, video in enumerate(videos):
+                # Check if we already have cached results
+                cached_result = cached_results.get(video['video_id'])
+                if cached_result:
+                    cached_result = dict(cached_result)
+                    cached_result['cached'] = True
+                    results[index] = cached_result
+                    continue
+                
+                # Create new analysis result
+                analysis_result = LLMAnalysisResult(
+                    video_id=video['video_id'],
+                    video_url=video['video_url'],
+                    platform=video['platform'],
+                    llm_provider=self.provider
+                )
+                db.session.add(analysis_result)
+                
+                # Prepare content for analysis
+                content = self._prepare_content(video.get('transcript'), video.get('metadata'))
+                
+                pending.append((index, analysis_result, content, len(prompts)))
+                if self.use_combined:
+                    # Generate summary unless it was already streamed to the caller
+                    prompts.append(self._combined_prompt(content, include_summary=not video.get('summary')))
+                    continue
+                # The summary, sentiment and topic prompts are independent, so send them concurrently
+                prompts.extend([self._sentiment_prompt(content), self._topics_prompt(content)])
+                if not video.get('summary'):
+                    # Generate summary unless it was already streamed to the caller
+                    prompts.append(self._summary_prompt(content, video['platform']))
+            
+            if not pending:
+                return results
+            
+            db.session.flush()  # Get the IDs without committing
+            
+            # One round of concurrent requests for the whole batch instead of one per video
+            responses = self.complete_many(prompts)
+            
+            for index, analysis_result, content, offset in pending:
+                video = videos[index]
+                if self.use_combined:
+                    summary, sentiment_result, topics = self._parse_combined(responses[offset], content)
+                else:
+                    summary = responses[offset + 2] if not video.get('summary') else None
+                    sentiment_result = self._parse_sentiment(responses[offset], content)
+                    topics = self._parse_topics(responses[offset + 1])
+                analysis_result.summary = video.get('summary') or summary or "Summary unavailable"
+                
+                # Analyze sentiment
+                analysis_result.sentiment = sentiment_result['sentiment']
+                analysis_result.confidence_score = sentiment_result['confidence']
+                
+                # Extract topics
+                analysis_result.set_topics(topics)
+                
+                # Store transcript if available
+                if video.get('transcript'):
+                    analysis_result.transcript_used = video['transcript'][:1000]  # Limit transcript length
+                
+                # Calculate processing duration
+                analysis_result.processing_duration_seconds = time.time() - start_time
             
-            # Commit to database
+            # Commit the whole batch to the database at once
             db.session.commit()
             
-            return analysis_result.to_dict()
+            for index, analysis_result, _, _ in pending:
+                results[index] = analysis_result.to_dict()
+            return results
             
         except Exception as e:
             # Handle errors
             error_message = f"Unexpected error: {str(e)}"
             
-            # Try to save error to database if we have an analysis result
+            # Try to save the error to the database for the results we created
             try:
-                if 'analysis_result' in locals():
+                for _, analysis_result, _, _ in pending:
                     analysis_result.error_message = error_message
                     analysis_result.processing_duration_seconds = time.time() - start_time
-                    db.session.commit()
+                db.session.commit()
             except:
                 pass  # Don't let database errors mask the original error
             
-            # Return error response
-            return {
-                'video_id': video_id,
-                'video_url': video_url,
-                'platform': platform,
-                'llm_provider': self.provider,
-                'summary': None,
-                'sentiment': None,
-                'confidence_score': 0,
-                'topics': [],
-                'transcript_used': transcript,
-                'processing_duration_seconds': time.time() - start_time,
-                'error_message': error_message,
-                'cached': False
-            }
+            # Return error responses for every video without a result
+            return [
+                result or {
+                    'video_id': video['video_id'],
+                    'video_url': video['video_url'],
+                    'platform': video['platform'],
+                    'llm_provider': self.provider,
+                    'summary': None,
+                    'sentiment': None,
+                    'confidence_score': 0,
+                    'topics': [],
+                    'transcript_used': video.get('transcript'),
+                    'processing_duration_seconds': time.time() - start_time,
+                    'error_message': error_message,
+                    'cached': False
+                }
+                for result, video in zip(results, videos)
+            ]
+    
+    def stream_process_video(self, video_id: str, video_url: str, platform: str,
+                             transcript: Optional[str] = None, metadata: Optional[Dict[str, Any]] = None) -> Iterator[str]:
+        """
+        Stream the summary for a video as the LLM generates it
+        
+        Args:
+            video_id: Unique video identifier
+            video_url: Video URL
+            platform: Platform name
+            transcript: Optional transcript text
+            metadata: Optional metadata
+            
+        Yields:
+            Summary text chunks
+        """
+        content = self._prepare_content(transcript, metadata)
+        yield from self._stream_llm_api(self._summary_prompt(content, platform))
     
-    def _get_cached_result(self, video_id: str) -> Optional[Dict[str, Any]]:
-        """Get cached analysis result"""
+    def _get_cached_results(self, video_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Get cached analysis results for several videos, keyed by video ID"""
+        cached = {}
         try:
-            cached_result = LLMAnalysisResult.query.filter_by(video_id=video_id).first()
-            if cached_result:
-                return cached_result.to_dict()
+            rows = (LLMAnalysisResult.query
+                    .filter(LLMAnalysisResult.video_id.in_(set(video_ids)))
+                    .order_by(LLMAnalysisResult.id)
+                    .all())
+            for row in rows:
+                if row.video_id not in cached:
+                    cached[row.video_id] = row.to_dict()
         except Exception as e:
-            print(f"Error retrieving cached result: {e}")
-        return None
+            print(f"Error retrieving cached results: {e}")
+        return cached
     
     def _prepare_content(self, transcript: Optional[str], metadata: Optional[Dict[str, Any]]) -> str:
         """Prepare content for analysis"""
@@ -205,10 +390,22 @@ class LLMProcessor:
         if transcript:
             content_parts.append(f"Transcript: {transcript}")
         
-        return "\n\n".join(content_parts) if content_parts else "No content available for analysis."
+        if not content_parts:
+            return "No content available for analysis."
+        content = "\n\n".join(content_parts)
+        # Keep long transcripts within the provider's context window; the
+        # transcript comes last, so it is the part that gets cut
+        if len(content) > self.max_prompt_chars:
+            print(f"Truncating {len(content)} characters of content to {self.max_prompt_chars}")
+            content = content[:self.max_prompt_chars]
+        return content
     
     def _generate_summary(self, content: str, platform: str) -> str:
         """Generate content summary using LLM"""
+        return self._call_llm_api(self._summary_prompt(content, platform)) or "Summary unavailable"
+    
+    def _summary_prompt(self, content: str, platform: str) -> str:
+        """Build the summary prompt for video or channel/profile content"""
         # Check if this is channel/profile content
         if "Channel/Profile Information:" in content:
             prompt = f"""
@@ -238,7 +435,7 @@ class LLMProcessor:
             Summary:
             """
         
-        return self._call_llm_api(prompt) or "Summary unavailable"
+        return prompt
     
     def test_connection(self) -> bool:
         """Test the LLM API connection"""
@@ -257,6 +454,10 @@ class LLMProcessor:
     
     def _analyze_sentiment(self, content: str) -> Dict[str, Any]:
         """Analyze sentiment using LLM"""
+        return self._parse_sentiment(self._call_llm_api(self._sentiment_prompt(content)), content)
+    
+    def _sentiment_prompt(self, content: str) -> str:
+        """Build the sentiment prompt for video or channel/profile content"""
         # Check if this is channel/profile content
         if "Channel/Profile Information:" in content:
             prompt = f"""
@@ -285,21 +486,47 @@ class LLMProcessor:
             }}
             """
         
-        response = self._call_llm_api(prompt)
-        
+        return prompt
+    
+    def _parse_sentiment(self, response: str, content: str) -> Dict[str, Any]:
+        """Parse the sentiment JSON, falling back to keyword analysis of the content"""
+        result = self._parse_json_object(response)
         try:
-            # Try to parse JSON response
-            result = json.loads(response)
             return {
                 'sentiment': result.get('sentiment', 'neutral'),
                 'confidence': float(result.get('confidence', 0.5))
             }
-        except:
+        except (AttributeError, TypeError, ValueError):
             # Fallback to keyword-based analysis
             return self._fallback_sentiment_analysis(content)
     
+    @staticmethod
+    def _parse_json_object(response: Optional[str]) -> Optional[Dict[str, Any]]:
+        """
+        Parse a JSON object from an LLM response, or return None
+        
+        The whole response is parsed first; only if that fails is the text
+        between the outermost braces tried, for objects wrapped in prose or a
+        code fence.
+        """
+        try:
+            result = _json_loads(response)
+        except (json.JSONDecodeError, TypeError):
+            start, end = (response or '').find('{'), (response or '').rfind('}')
+            if not 0 <= start < end:
+                return None
+            try:
+                result = _json_loads(response[start:end + 1])
+            except json.JSONDecodeError:
+                return None
+        return result if isinstance(result, dict) else None
+    
     def _extract_topics(self, content: str) -> List[str]:
         """Extract topics using LLM"""
+        return self._parse_topics(self._call_llm_api(self._topics_prompt(content)))
+    
+    def _topics_prompt(self, content: str) -> str:
+        """Build the topic extraction prompt for video or channel/profile content"""
         # Check if this is channel/profile content
         if "Channel/Profile Information:" in content:
             prompt = f"""
@@ -320,8 +547,10 @@ class LLMProcessor:
             Topics:
             """
         
-        response = self._call_llm_api(prompt)
-        
+        return prompt
+    
+    def _parse_topics(self, response: str) -> List[str]:
+        """Split the comma-separated topic response"""
         if response and response != "Topics unavailable":
             # Split by comma and clean up
             topics = [topic.strip() for topic in response.split(',') if topic.strip()]
@@ -329,15 +558,56 @@ class LLMProcessor:
         
         return []
     
+    def _combined_prompt(self, content: str, include_summary: bool = True) -> str:
+        """Build one prompt asking for the summary, sentiment and topics as a JSON object"""
+        if "Channel/Profile Information:" in content:
+            subject = "channel/profile"
+            summary_spec = "overview of the channel/profile, its key themes, audience engagement potential and brand personality (3-5 sentences)"
+        else:
+            subject = "video"
+            summary_spec = "brief summary with key themes and overall tone (2-4 sentences)"
+        summary_field = f'"summary": "{summary_spec}",\n                ' if include_summary else ''
+        
+        prompt = f"""
+            Analyze the following {subject} content:
+            
+            {content}
+            
+            Respond with ONLY a JSON object in this exact format:
+            {{
+                {summary_field}"sentiment": "positive|negative|neutral",
+                "confidence": 0.0-1.0,
+                "topics": ["3-5 main topics or themes"]
+            }}
+            """
+        
+        return prompt
+    
+    def _parse_combined(self, response: str, content: str) -> Tuple[Optional[str], Dict[str, Any], List[str]]:
+        """Parse the combined JSON response into (summary, sentiment result, topics)"""
+        result = self._parse_json_object(response)
+        if result is None:
+            return None, self._fallback_sentiment_analysis(content), []
+        
+        try:
+            sentiment_result = {
+                'sentiment': result.get('sentiment', 'neutral'),
+                'confidence': float(result.get('confidence', 0.5))
+            }
+        except (TypeError, ValueError):
+            sentiment_result = self._fallback_sentiment_analysis(content)
+        topics = result.get('topics') or []
+        if isinstance(topics, str):
+            topics = self._parse_topics(topics)
+        topics = [str(topic).strip() for topic in topics if str(topic).strip()][:5]
+        return result.get('summary') or None, sentiment_result, topics
+    
     def _fallback_sentiment_analysis(self, content: str) -> Dict[str, Any]:
         """Fallback sentiment analysis using keywords"""
-        positive_words = ['amazing', 'awesome', 'great', 'love', 'best', 'fantastic', 'wonderful', 'excellent', 'good', 'happy', 'nice']
-        negative_words = ['terrible', 'awful', 'bad', 'worst', 'hate', 'horrible', 'disappointing', 'sad', 'angry', 'poor']
-        
         content_lower = content.lower()
         
-        positive_count = sum(1 for word in positive_words if word in content_lower)
-        negative_count = sum(1 for word in negative_words if word in content_lower)
+        positive_count = len(set(_POSITIVE_RE.findall(content_lower)))
+        negative_count = len(set(_NEGATIVE_RE.findall(content_lower)))
         
         if positive_count > negative_count:
             sentiment = 'positive'
@@ -354,18 +624,58 @@ class LLMProcessor:
             'confidence': confidence
         }
     
+    async def acomplete(self, prompt: str) -> str:
+        """Call the LLM API without blocking the event loop"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, self._call_llm_api, prompt)
+    
+    async def acomplete_many(self, prompts: List[str]) -> List[str]:
+        """Call the LLM API for several prompts concurrently, returning responses in order"""
+        return list(await asyncio.gather(*(self.acomplete(prompt) for prompt in prompts)))
+    
+    def complete_many(self, prompts: List[str]) -> List[str]:
+        """Call the LLM API for several prompts concurrently on the processor's thread pool"""
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            # No event loop (or per-call default executor) needed, just the shared pool
+            return list(self.executor.map(self._call_llm_api, prompts))
+        # Already inside a running loop (callers there should await acomplete_many)
+        return [self._call_llm_api(prompt) for prompt in prompts]
+    
+    def _cache_key(self, prompt: str) -> Optional[str]:
+        """Response cache key for prompt, or None when the response must not be cached"""
+        if self.response_cache is None:
+            return None
+        if self.temperature != 0 and not self.cache_sampled:
+            return None
+        return self.response_cache.make_key(self.provider, self.model, prompt, self.temperature, self.max_tokens)
+    
+    def _throttle(self, prompt: str):
+        """Wait for the provider's request and token budgets before sending prompt"""
+        if self.request_limiter:
+            self.request_limiter.wait()
+        if self.token_limiter:
+            # Rough estimate: about 4 characters per prompt token, plus the completion budget
+            self.token_limiter.wait(len(prompt) // 4 + self.max_tokens)
+    
     def _call_llm_api(self, prompt: str) -> str:
         """Call the LLM API"""
         if not self.api_key and self.provider != 'ollama':
             return f"{self.provider.capitalize()} API key not configured"
         
+        cache_key = self._cache_key(prompt)
+        if cache_key:
+            cached = self.response_cache.get(cache_key)
+            if cached is not None:
+                return cached
+        
+        self._throttle(prompt)
         try:
-            if self.provider == 'mistral':
-                return self._call_mistral_api(prompt)
-            elif self.provider == 'openrouter':
-                return self._call_openrouter_api(prompt)
+            if self.provider in ('mistral', 'openrouter'):
+                response = self._call_chat_completions(prompt)
             elif self.provider == 'ollama':
-                return self._call_ollama_api(prompt)
+                response = self._call_ollama_api(prompt)
             else:
                 return "Unsupported LLM provider"
         except requests.exceptions.RequestException as e:
@@ -380,47 +690,154 @@ class LLMProcessor:
         except Exception as e:
             print(f"Error calling {self.provider} API: {e}")
             return f"{self.provider.capitalize()} API error: {str(e)}"
+        
+        # Error paths return above, so only real completions are cached
+        if cache_key:
+            self.response_cache.set(cache_key, response)
+        return response
+    
+    def _stream_llm_api(self, prompt: str) -> Iterator[str]:
+        """Call the LLM API in streaming mode, yielding text chunks as they arrive"""
+        if not self.api_key and self.provider != 'ollama':
+            yield f"{self.provider.capitalize()} API key not configured"
+            return
+        
+        cache_key = self._cache_key(prompt)
+        if cache_key:
+            cached = self.response_cache.get(cache_key)
+            if cached is not None:
+                yield cached
+                return
+        
+        self._throttle(prompt)
+        try:
+            if self.provider in ('mistral', 'openrouter'):
+                chunks = self._stream_chat_completions(prompt)
+            elif self.provider == 'ollama':
+                chunks = self._stream_ollama_api(prompt)
+            else:
+                yield "Unsupported LLM provider"
+                return
+            streamed = []
+            for chunk in chunks:
+                streamed.append(chunk)
+                yield chunk
+            if cache_key and streamed:
+                self.response_cache.set(cache_key, ''.join(streamed).strip())
+        except requests.exceptions.RequestException as e:
+            print(f"Network error streaming from {self.provider} API: {e}")
+            yield f"Network error: {str(e)}"
+        except Exception as e:
+            print(f"Error streaming from {self.provider} API: {e}")
+            yield f"{self.provider.capitalize()} API error: {str(e)}"
     
-    def _call_mistral_api(self, prompt: str) -> str:
-        """Call Mistral API"""
+    def _post(self, payload: Dict[str, Any], headers: Optional[Dict[str, str]] = None,
+              stream: bool = False) -> requests.Response:
+        """
+        POST payload to the provider, retrying rate limits and transient server errors
+        
+        Retries use exponential backoff with full jitter, or the server's
+        Retry-After when it sends one. The last response is returned either way,
+        so callers still raise_for_status() on a persistent failure. While the
+        provider's circuit breaker is open this raises ProviderUnavailableError
+        without sending anything.
+        """
+        if not self.circuit_breaker.allow():
+            raise ProviderUnavailableError(f"{self.provider} API is failing, skipping calls for now")
+        # Encode once, not again on every retry
+        body = _json_dumps(payload)
+        headers = {**(headers or {}), 'Content-Type': 'application/json'}
+        for attempt in range(self.max_retries + 1):
+            try:
+                response = self.session.post(self.api_url, headers=headers, data=body,
+                                             timeout=self.timeout, stream=stream)
+            except requests.exceptions.RequestException:
+                self.circuit_breaker.record_failure()
+                raise
+            if response.status_code not in RETRY_STATUS_CODES:
+                self.circuit_breaker.record_success()
+                return response
+            if attempt == self.max_retries:
+                self.circuit_breaker.record_failure()
+                return response
+            response.close()
+            retry_after = response.headers.get('Retry-After', '')
+            if retry_after.isdigit():
+                delay = min(float(retry_after), RETRY_MAX_DELAY)
+            else:
+                delay = random.uniform(0, min(RETRY_MAX_DELAY, self.retry_base * 2 ** attempt))
+            print(f"{self.provider} API returned {response.status_code}, retrying in {delay:.1f}s")
+            time.sleep(delay)
+        return response
+    
+    def _request_headers(self) -> Dict[str, str]:
+        """Build request headers for the chat completions providers"""
         headers = {
             "Authorization": f"Bearer {self.api_key}",
             "Content-Type": "application/json"
         }
-        
+        if self.provider == 'openrouter':
+            headers["HTTP-Referer"] = "https://your-app.com"  # Replace with your app URL
+            headers["X-Title"] = "Video Analyzer"  # Replace with your app name
+        return headers
+    
+    def _chat_payload(self, prompt: str, stream: bool = False) -> Dict[str, Any]:
+        """Build the chat completions request body shared by Mistral and OpenRouter"""
         payload = {
             "model": self.model,
             "messages": [{"role": "user", "content": prompt}],
             "temperature": self.temperature,
             "max_tokens": self.max_tokens
         }
-        
-        response = requests.post(self.api_url, headers=headers, json=payload, timeout=self.timeout)
-        response.raise_for_status()
-        
-        result = response.json()
-        return result['choices'][0]['message']['content'].strip()
+        if stream:
+            payload["stream"] = True
+        return payload
     
-    def _call_openrouter_api(self, prompt: str) -> str:
-        """Call OpenRouter API"""
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json",
-            "HTTP-Referer": "https://your-app.com",  # Replace with your app URL
-            "X-Title": "Video Analyzer"  # Replace with your app name
-        }
-        
+    def _stream_chat_completions(self, prompt: str) -> Iterator[str]:
+        """Stream a Mistral/OpenRouter chat completion (server-sent events)"""
+        with self._post(self._chat_payload(prompt, stream=True), self._request_headers(), stream=True) as response:
+            response.raise_for_status()
+            for line in response.iter_lines(decode_unicode=True):
+                # SSE frames look like "data: {...}"; blank lines and comments are keep-alives
+                if not line or not line.startswith('data:'):
+                    continue
+                data = line[len('data:'):].strip()
+                if data == '[DONE]':
+                    break
+                choices = _json_loads(data).get('choices') or [{}]
+                text = choices[0].get('delta', {}).get('content')
+                if text:
+                    yield text
+    
+    def _stream_ollama_api(self, prompt: str) -> Iterator[str]:
+        """Stream an Ollama generation (newline-delimited JSON)"""
         payload = {
             "model": self.model,
-            "messages": [{"role": "user", "content": prompt}],
-            "temperature": self.temperature,
-            "max_tokens": self.max_tokens
+            "prompt": prompt,
+            "stream": True,
+            "options": {
+                "temperature": self.temperature,
+                "num_predict": self.max_tokens
+            }
         }
         
-        response = requests.post(self.api_url, headers=headers, json=payload, timeout=self.timeout)
+        with self._post(payload, stream=True) as response:
+            response.raise_for_status()
+            for line in response.iter_lines(decode_unicode=True):
+                if not line:
+                    continue
+                chunk = _json_loads(line)
+                if chunk.get('response'):
+                    yield chunk['response']
+                if chunk.get('done'):
+                    break
+    
+    def _call_chat_completions(self, prompt: str) -> str:
+        """Call a Mistral/OpenRouter chat completion (both use the OpenAI request/response schema)"""
+        response = self._post(self._chat_payload(prompt), self._request_headers())
         response.raise_for_status()
         
-        result = response.json()
+        result = _json_loads(response.content)
         return result['choices'][0]['message']['content'].strip()
     
     def _call_ollama_api(self, prompt: str) -> str:
@@ -435,10 +852,10 @@ class LLMProcessor:
             }
         }
         
-        response = requests.post(self.api_url, json=payload, timeout=self.timeout)
+        response = self._post(payload)
         response.raise_for_status()
         
-        result = response.json()
+        result = _json_loads(response.content)
         return result.get('response', 'No response from Ollama').strip()
     
     def process_and_save_video(self, video_data: Dict[str, Any]) -> Optional[LLMAnalysisResult]:
@@ -4,6 +4,7 @@ Database models for LLM analysis results
 
 from flask_sqlalchemy import SQLAlchemy
 from datetime import datetime
+from operator import attrgetter
 from typing import Optional, Dict, Any
 import json
 
@@ -45,22 +46,11 @@ class LLMAnalysisResult(db.Model):
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert model to dictionary"""
-        return {
-            'video_id': self.video_id,
-            'video_url': self.video_url,
-            'platform': self.platform,
-            'llm_provider': self.llm_provider,
-            'summary': self.summary,
-            'sentiment': self.sentiment,
-            'confidence_score': self.confidence_score,
-            'topics': json.loads(self.topics) if self.topics else [],
-            'transcript_used': self.transcript_used,
-            'processing_duration_seconds': self.processing_duration_seconds,
-            'error_message': self.error_message,
-            'cached': self.cached,
-            'created_at': self.created_at.isoformat() if self.created_at else None,
-            'updated_at': self.updated_at.isoformat() if self.updated_at else None
-        }
+        data = dict(zip(_RESULT_FIELDS, _get_result_fields(self)))
+        data['topics'] = json.loads(self.topics) if self.topics else []
+        data['created_at'] = self.created_at.isoformat() if self.created_at else None
+        data['updated_at'] = self.updated_at.isoformat() if self.updated_at else None
+        return data
     
     def set_topics(self, topics_list: list):
         """Set topics from a list"""
@@ -73,6 +63,15 @@ class LLMAnalysisResult(db.Model):
         except (json.JSONDecodeError, TypeError):
             return []
 
+# to_dict keys in output order, read in one attrgetter call; topics and the
+# timestamps are converted afterwards
+_RESULT_FIELDS = (
+    'video_id', 'video_url', 'platform', 'llm_provider', 'summary', 'sentiment',
+    'confidence_score', 'topics', 'transcript_used', 'processing_duration_seconds',
+    'error_message', 'cached', 'created_at', 'updated_at'
+)
+_get_result_fields = attrgetter(*_RESULT_FIELDS)
+
 class ScrapingJob(db.Model):
     """
     Model for tracking scraping jobs
@@ -3,7 +3,7 @@ API schemas and data models
 """
 
 from typing import Dict, List, Optional, Any
-from dataclasses import dataclass
+from dataclasses import dataclass, field, fields
 from enum import Enum
 
 
@@ -47,6 +47,31 @@ class ReelData:
     thumbnail_url: Optional[str] = None
 
 
+@dataclass
+class ScrapedContent:
+    """Normalized output of a video or channel/profile scrape"""
+    title: str = ''
+    description: str = ''
+    views: int = 0
+    likes: int = 0
+    comments: int = 0
+    shares: int = 0
+    duration: str = ''
+    upload_date: str = ''
+    channel_name: str = ''
+    video_id: str = ''
+    url: str = ''
+    is_channel: bool = False
+    channel_data: Optional[Dict[str, Any]] = None
+    engagement_metrics: Optional[Dict[str, Any]] = None
+    hashtags: List[str] = field(default_factory=list)
+    api_fallback_used: bool = False
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Shallow dict for the UI/cache layer, omitting optional sections that were not scraped"""
+        return {f.name: getattr(self, f.name) for f in fields(self) if getattr(self, f.name) is not None}
+
+
 @dataclass
 class AnalysisResult:
     """Result of sentiment and content analysis"""
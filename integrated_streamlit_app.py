@@ -6,16 +6,29 @@ Connects with: API, LLM Processor, Scrapers, Resolver, and Analyzer components
 import streamlit as st
 import requests
 import json
-import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
 from datetime import datetime
 import time
 import sys
 import os
-from typing import Dict, List, Any, Optional
+import re
+import sqlite3
+import hashlib
+from collections import Counter, deque
+from typing import Dict, List, Any, Optional, Tuple, Iterator, Callable, TYPE_CHECKING
 import logging
+import asyncio
+import threading
+from functools import lru_cache
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from pathlib import Path
+from urllib.parse import urlsplit, urlunsplit
+
+# pandas, plotly and the Selenium scrapers are imported where they are used to keep start-up fast
+if TYPE_CHECKING:
+    import pandas as pd
+    import plotly.graph_objects as go
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -29,15 +42,94 @@ try:
     # Import all project components
     from api.llm_processor import LLMProcessor
     from analyzer.video_analyzer import VideoAnalyzer
-    from scrapers.youtube_selenium_scraper import YouTubeSeleniumScraper
-    from scrapers.instagram_selenium_scraper import InstagramSeleniumScraper
     from resolver.platform_resolver import PlatformResolver
+    from utils.rate_limiter import RateLimiter
+    from utils.analysis_store import AnalysisStore
+    from api.schemas import ScrapedContent
     logger.info("✅ All project components imported successfully")
 except ImportError as e:
     logger.error(f"❌ Import error: {e}")
     st.error(f"Import Error: {e}")
     st.stop()
 
+# Maximum number of URLs analyzed at the same time in batch mode
+BATCH_CONCURRENCY = int(os.getenv('BATCH_CONCURRENCY', '8'))
+
+# Client-side LLM request budget, to stay under provider rate limits in batch mode
+LLM_REQUESTS_PER_MINUTE = float(os.getenv('LLM_REQUESTS_PER_MINUTE', '60'))
+LLM_REQUEST_BURST = int(os.getenv('LLM_REQUEST_BURST', '5'))
+
+# Scraped items whose LLM prompts are sent together in one round in batch mode
+LLM_BATCH_SIZE = max(1, int(os.getenv('LLM_BATCH_SIZE', '8')))
+
+# Upper bound in seconds for a direct LLMProcessor analysis
+LLM_CALL_TIMEOUT = float(os.getenv('LLM_CALL_TIMEOUT', '20'))
+
+# Seconds an API health check or LLM connection test result is reused before probing again
+API_STATUS_TTL = 30
+
+# Seconds to wait for the background warm start before building the analyzer inline
+WARM_START_TIMEOUT = float(os.getenv('WARM_START_TIMEOUT', '10'))
+
+# Idle Chrome drivers kept warm for the scrapers
+WEBDRIVER_POOL_SIZE = int(os.getenv('WEBDRIVER_POOL_SIZE', '2'))
+
+# Completed analyses kept on disk for reuse and on-request history (a TTL of 0 disables the store)
+ANALYSIS_STORE_PATH = os.getenv('ANALYSIS_STORE_PATH', os.path.join(os.path.expanduser('~'), '.shorty', 'analyses.db'))
+ANALYSIS_STORE_TTL = int(os.getenv('ANALYSIS_STORE_TTL', str(7 * 86400)))
+
+# Analyses kept in memory per session; dashboard totals still count every analysis
+MAX_HISTORY = int(os.getenv('MAX_HISTORY', '500'))
+
+# Downsample large dashboard series with plotly-resampler (optional dependency)
+PLOTLY_RESAMPLER_ENABLED = os.getenv('PLOTLY_RESAMPLER_ENABLED', 'false').lower() == 'true'
+_plotly_resampler_registered = False
+
+# Column layouts for the dashboard charts and table
+ENGAGEMENT_COLUMNS = ['Platform', 'Views', 'Likes', 'Comments']
+RECENT_COLUMNS = ['Platform', 'Views', 'Likes', 'Timestamp']
+RECENT_SOURCE_COLUMNS = ['platform', 'views', 'likes', 'timestamp']
+
+# Columnar copy of the session's analyses that the dashboard reads from
+ANALYSIS_DF_COLUMNS = ['platform', 'is_channel', 'views', 'likes', 'comments', 'timestamp', 'url']
+METRIC_COLUMNS = ['views', 'likes', 'comments']
+
+# Environment variables listed on the System Info tab; secrets are masked
+DISPLAYED_ENV_VARS = (
+    "MISTRAL_API_KEY",
+    "OPENROUTER_API_KEY",
+    "YOUTUBE_API_KEY",
+    "INSTAGRAM_USERNAME",
+    "INSTAGRAM_PASSWORD",
+    "SERVICE_HOST",
+    "SERVICE_PORT",
+    "LLM_PROVIDER",
+    "DEBUG",
+    "MAX_REELS_DEFAULT",
+    "SCRAPING_TIMEOUT"
+)
+SECRET_ENV_VARS = frozenset(var for var in DISPLAYED_ENV_VARS if "API_KEY" in var or "PASSWORD" in var)
+
+# Sidebar settings kept per session and passed to the analyzer; the environment only supplies defaults
+SESSION_SETTINGS = ("MISTRAL_API_KEY", "OPENROUTER_API_KEY", "OLLAMA_API_URL", "YOUTUBE_API_KEY")
+
+# Worker threads for LLMProcessor calls, so a hung provider cannot block the app.
+# Each provider gets its own pool (bulkhead): calls still running against a
+# provider that stopped answering cannot hold the workers another one needs.
+LLM_WORKERS_PER_PROVIDER = int(os.getenv('LLM_WORKERS_PER_PROVIDER', '4'))
+_llm_executors: Dict[str, ThreadPoolExecutor] = {}
+_llm_executors_lock = threading.Lock()
+
+def _llm_executor(provider: str) -> ThreadPoolExecutor:
+    """Worker pool for LLM calls to provider"""
+    with _llm_executors_lock:
+        executor = _llm_executors.get(provider)
+        if executor is None:
+            executor = _llm_executors[provider] = ThreadPoolExecutor(
+                max_workers=LLM_WORKERS_PER_PROVIDER, thread_name_prefix=f'llm-{provider}'
+            )
+        return executor
+
 # Page configuration
 st.set_page_config(
     page_title="Video Sentiment Analysis Platform",
@@ -48,7 +140,9 @@ st.set_page_config(
 
 # Initialize session state
 if 'analysis_results' not in st.session_state:
-    st.session_state.analysis_results = []
+    st.session_state.analysis_results = deque(maxlen=MAX_HISTORY)
+    # Running per-platform totals, so the dashboard does not rescan the history
+    st.session_state.platform_totals = {metric: Counter() for metric in ['count'] + METRIC_COLUMNS}
 if 'llm_processor' not in st.session_state:
     st.session_state.llm_processor = None
 if 'video_analyzer' not in st.session_state:
@@ -63,40 +157,194 @@ if 'instagram_logged_in' not in st.session_state:
     st.session_state.instagram_logged_in = False
 if 'analyzer_instance' not in st.session_state:
     st.session_state.analyzer_instance = None
+if 'current_result' not in st.session_state:
+    st.session_state.current_result = None
+
+# Shared resolver for the cached URL helpers below
+_RESOLVER = PlatformResolver()
+
+# Precompiled URL patterns so classification is a single regex pass per URL
+_YT_CHANNEL_RE = re.compile(r'/(channel/|c/|@|user/)', re.IGNORECASE)
+_YT_ID_RE = re.compile(r'(?:v=|youtu\.be/)([A-Za-z0-9_-]{11})')
+_IG_USER_RE = re.compile(r'^(?:https?://)?(?:www\.)?instagram\.com/(?!p/|reel/|stories/)([A-Za-z0-9_.]+)/?')
+
+# Share/tracking query parameters that do not change which content a URL points to
+_TRACKING_PARAMS = frozenset({'si', 'feature', 'igsh', 'igshid', 'fbclid', 'gclid'})
+
+
+@lru_cache(maxsize=1024)
+def _detect_platform_cached(url: str) -> str:
+    """Detect the platform of a URL, memoized across reruns"""
+    return _RESOLVER.detect_platform(url)
+
+
+def normalize_url(url: str) -> str:
+    """Canonical form of a pasted URL for de-duplication
+    
+    Lowercases the scheme and host, drops the fragment, a trailing slash and
+    tracking parameters. The path and remaining query keep their case, since
+    video IDs are case-sensitive.
+    """
+    parts = urlsplit(url.strip())
+    query = '&'.join(
+        param for param in parts.query.split('&')
+        if param and not param.startswith('utm_') and param.split('=', 1)[0] not in _TRACKING_PARAMS
+    )
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path.rstrip('/'), query, ''))
+
+
+@lru_cache(maxsize=1024)
+def _extract_video_id(url: str) -> str:
+    """Extract video ID from URL"""
+    match = _YT_ID_RE.search(url)
+    return match.group(1) if match else 'unknown'
+
+
+@lru_cache(maxsize=1024)
+def _extract_instagram_username(url: str) -> Optional[str]:
+    """Extract Instagram username from a profile URL (None for post/reel/story URLs)"""
+    match = _IG_USER_RE.match(url)
+    return match.group(1) if match else None
+
+
+# Static parts of the placeholder data returned when scraping fails
+_SAMPLE_CHANNEL_TEMPLATE = {
+    'description': 'This is a sample channel description for analysis purposes.',
+    'views': 150000,  # Total views
+    'likes': 12500,   # Subscribers
+    'comments': 85,   # Total videos
+    'shares': 0,
+    'duration': 'N/A',
+    'upload_date': '',
+    'channel_name': 'Sample Channel',
+    'video_id': 'sample_channel_123',
+    'is_channel': True,
+    'channel_data': {
+        'channel_name': 'Sample Channel',
+        'channel_description': 'This is a sample channel description.',
+        'subscribers': 12500,
+        'total_videos': 85,
+        'total_views': 150000,
+        'average_views': 1765,
+        'recent_videos': []
+    }
+}
+
+_SAMPLE_VIDEO_TEMPLATE = {
+    'description': 'This is a sample video description for analysis purposes.',
+    'views': 15420,
+    'likes': 892,
+    'comments': 45,
+    'shares': 23,
+    'duration': '2:30',
+    'channel_name': 'Sample Channel',
+    'video_id': 'sample_123',
+    'is_channel': False
+}
+
+# Summaries LLMProcessor returns in place of a completion when a call fails
+_LLM_ERROR_SUMMARY_RE = re.compile(
+    r'^(?:Summary unavailable|Unsupported LLM provider|Invalid API response format|Unexpected API response format'
+    r'|Network error:|\w+ API (?:error:|key not configured))'
+)
+
+
+def is_reusable_result(result: Dict[str, Any]) -> bool:
+    """Whether a result may be cached or stored for later requests
+    
+    Placeholder data from a failed scrape and results whose LLM step failed
+    are still shown, but must not be served again in place of a retry.
+    """
+    if result.get('status') != 'success' or result['scraped_data'].get('is_sample_data'):
+        return False
+    llm_analysis = result.get('llm_analysis') or {}
+    if llm_analysis.get('error') or llm_analysis.get('error_message'):
+        return False
+    return not _LLM_ERROR_SUMMARY_RE.match(llm_analysis.get('summary') or '')
+
 
 class IntegratedVideoAnalyzer:
     """Integrated analyzer that combines all project components"""
     
-    def __init__(self):
+    def __init__(self, settings: Optional[Dict[str, str]] = None):
+        # Provider, keys and URLs of the session this analyzer belongs to
+        self.settings = dict(settings or {})
         self.llm_processor = None
         self.video_analyzer = VideoAnalyzer()
         self.platform_resolver = PlatformResolver()
         self.instagram_scraper = None
-        self.youtube_scraper = YouTubeSeleniumScraper()
+        self.instagram_username = None  # Account the Instagram scraper is logged in as
+        self._instagram_password_hash = None  # Digest of that login's password, see initialize_instagram_scraper
+        self.youtube_scraper = None  # Created on the first YouTube URL
+        self._scraper_init_lock = threading.Lock()
         self.api_base_url = f"http://{os.getenv('SERVICE_HOST', '0.0.0.0')}:{os.getenv('SERVICE_PORT', '5001')}"
+        self._http = self._create_http_session()
+        # (checked_at, status) from the last health check, see check_api_connectivity
+        self._api_status: Optional[Tuple[float, Dict[str, str]]] = None
+        # (checked_at, config fingerprint, ok) from the last LLM probe, see test_llm_connection
+        self._llm_test: Optional[Tuple[float, str, bool]] = None
+        self._llm_limiter = RateLimiter.per_minute(LLM_REQUESTS_PER_MINUTE, burst=LLM_REQUEST_BURST)
         self.initialize_llm_processor()
     
+    @staticmethod
+    def _create_http_session() -> requests.Session:
+        """Create a pooled HTTP session that retries transient API failures"""
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=20,
+            max_retries=Retry(
+                total=3,
+                connect=1,  # A server that is down will not come up within the backoff window
+                backoff_factor=0.5,
+                status_forcelist=[429, 500, 502, 503, 504],
+                allowed_methods=["GET", "POST"]
+            )
+        )
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        return session
+    
+    def _setting(self, name: str, default: str = '') -> str:
+        """Session setting this analyzer was built with, falling back to the environment"""
+        return self.settings.get(name) or os.getenv(name, default)
+    
+    def apply_settings(self, settings: Dict[str, str]):
+        """Switch to new session settings, keeping the scrapers and the Instagram login"""
+        self.settings = dict(settings)
+        self.initialize_llm_processor()
+        if self.youtube_scraper is not None:
+            self.youtube_scraper.api_key = self._setting('YOUTUBE_API_KEY') or None
+    
+    def result_variant(self) -> str:
+        """Settings this analyzer's results depend on: provider, keys set and Instagram login
+        
+        Part of the cache and store keys of results, so an analysis made before
+        a key was saved is not served after it, and content scraped through one
+        Instagram account is only served to sessions logged in as that account.
+        The keys themselves are not included.
+        """
+        llm = self.llm_processor
+        provider = llm.provider if llm else self._setting('LLM_PROVIDER', 'mistral')
+        has_llm_key = bool(llm) and (llm.provider == 'ollama' or bool(llm.api_key))
+        has_youtube_key = bool(self._setting('YOUTUBE_API_KEY'))
+        instagram_user = self.instagram_username if self.instagram_scraper is not None else ''
+        return f"{provider}|llm_key={int(has_llm_key)}|youtube_key={int(has_youtube_key)}|ig={instagram_user}"
+    
     def initialize_llm_processor(self):
         """Initialize LLM processor with available providers"""
         try:
-            # Get LLM configuration from environment
-            llm_provider = os.getenv('LLM_PROVIDER', 'mistral')
-            mistral_api_key = os.getenv('MISTRAL_API_KEY')
-            openrouter_api_key = os.getenv('OPENROUTER_API_KEY')
-            ollama_api_url = os.getenv('OLLAMA_API_URL')
-            
-            # Configure LLM processor
-            llm_config = {
-                'provider': llm_provider,
-                'mistral_api_key': mistral_api_key,
-                'openrouter_api_key': openrouter_api_key,
-                'ollama_api_url': ollama_api_url,
-                'max_tokens': int(os.getenv('LLM_MAX_TOKENS', '1000')),
-                'temperature': float(os.getenv('LLM_TEMPERATURE', '0.7')),
-                'timeout': int(os.getenv('LLM_TIMEOUT', '30'))
-            }
-            
-            self.llm_processor = LLMProcessor(llm_config)
+            # Session keys and URLs are passed explicitly; LLMProcessor reads the rest from the environment
+            llm_provider = self._setting('LLM_PROVIDER', 'mistral')
+            # A settings change replaces the processor; release the old one's threads and connections
+            if self.llm_processor is not None:
+                self.llm_processor.close()
+                self.llm_processor = None
+            self.llm_processor = LLMProcessor(
+                llm_provider,
+                api_key=self.settings.get(f'{llm_provider.upper()}_API_KEY') or None,
+                api_url=(self.settings.get('OLLAMA_API_URL') or None) if llm_provider == 'ollama' else None
+            )
             logger.info(f"✅ LLM processor initialized with {llm_provider}")
             
         except Exception as e:
@@ -104,82 +352,204 @@ class IntegratedVideoAnalyzer:
             self.llm_processor = None
     
     def initialize_instagram_scraper(self, username: str, password: str):
-        """Initialize Instagram scraper with login credentials"""
+        """Initialize this analyzer's Instagram scraper with login credentials, reusing a login with the same ones"""
+        # Only a digest of the password is kept to recognize a repeated login
+        password_hash = hashlib.sha256(password.encode('utf-8')).hexdigest()
+        if (self.instagram_scraper is not None and self.instagram_username == username
+                and self._instagram_password_hash == password_hash):
+            logger.info(f"✅ Reusing Instagram login for user: {username}")
+            return True
+        
         try:
-            self.instagram_scraper = InstagramSeleniumScraper()
+            from scrapers.instagram_selenium_scraper import InstagramSeleniumScraper
             
-            # Attempt to login to Instagram
-            login_success = self.instagram_scraper.login(username, password)
-            if login_success:
-                logger.info(f"✅ Instagram scraper initialized and logged in for user: {username}")
-                # Store credentials for future use
-                self.instagram_username = username
-                self.instagram_password = password
-                return True
-            else:
+            scraper = InstagramSeleniumScraper(driver_pool=_get_driver_pool())
+            if not scraper.login(username, password):
+                scraper.close_driver()
                 logger.error(f"❌ Instagram login failed for user: {username}")
-                self.instagram_scraper = None
                 return False
-                
         except Exception as e:
             logger.error(f"❌ Failed to initialize Instagram scraper: {e}")
-            self.instagram_scraper = None
             return False
+        
+        # Hand the previous login's browser back to the pool
+        if self.instagram_scraper is not None:
+            self.instagram_scraper.close_driver()
+        self.instagram_scraper = scraper
+        self.instagram_username = username
+        self._instagram_password_hash = password_hash
+        logger.info(f"✅ Instagram scraper initialized and logged in for user: {username}")
+        return True
     
     def analyze_video(self, url: str, platform: str = None) -> Dict[str, Any]:
         """Analyze a single video or channel/profile using all available components"""
+        return asyncio.run(self.analyze_video_async(url, platform))
+    
+    async def analyze_video_async(self, url: str, platform: str = None) -> Dict[str, Any]:
+        """Analyze a single URL, running local and LLM analysis concurrently after scraping"""
         try:
-            # Detect platform if not provided
-            if not platform:
-                platform = self.platform_resolver.detect_platform(url)
-            
-            logger.info(f"Analyzing {platform} content: {url}")
-            
-            # Scrape video data (now supports channels/profiles)
-            scraped_data = self.scrape_video_data(url, platform)
+            loop = asyncio.get_running_loop()
+            platform, scraped_data = await loop.run_in_executor(None, self._scrape_stage, url, platform)
             if not scraped_data:
                 return {'error': 'Failed to scrape data'}
             
-            # Perform local analysis
-            local_analysis = self.perform_local_analysis(scraped_data)
-            
-            # Perform LLM analysis if available
-            llm_analysis = self.perform_llm_analysis(scraped_data) if self.llm_processor else None
-            
-            # Combine results
-            result = {
-                'url': url,
-                'platform': platform,
-                'timestamp': datetime.now().isoformat(),
-                'scraped_data': scraped_data,
-                'local_analysis': local_analysis,
-                'llm_analysis': llm_analysis,
-                'status': 'success'
-            }
+            # Local analysis (CPU) and LLM analysis (network) only depend on scraped_data
+            local_task = loop.run_in_executor(None, self.perform_local_analysis, scraped_data)
+            if self.llm_processor:
+                llm_task = loop.run_in_executor(None, self.perform_llm_analysis, scraped_data)
+                local_analysis, llm_analysis = await asyncio.gather(local_task, llm_task)
+            else:
+                local_analysis, llm_analysis = await local_task, None
             
-            return result
+            return self._build_result(url, platform, scraped_data, local_analysis, llm_analysis)
             
         except Exception as e:
             logger.error(f"Content analysis error: {e}")
             return {'error': str(e), 'status': 'error'}
     
+    def _scrape_stage(self, url: str, platform: str = None):
+        """Detect the platform if needed and scrape the content, returning (platform, scraped_data)"""
+        # Detect platform if not provided
+        if not platform:
+            platform = _detect_platform_cached(url)
+        
+        logger.info(f"Analyzing {platform} content: {url}")
+        
+        # Scrape video data (now supports channels/profiles)
+        return platform, self.scrape_video_data(url, platform)
+    
+    def _build_result(self, url: str, platform: str, scraped_data: Dict[str, Any],
+                      local_analysis: Dict[str, Any], llm_analysis: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """Combine the stage outputs into the analysis result"""
+        return {
+            'url': url,
+            'platform': platform,
+            'timestamp': datetime.now().isoformat(),
+            'scraped_data': scraped_data,
+            'local_analysis': local_analysis,
+            'llm_analysis': llm_analysis,
+            'status': 'success'
+        }
+    
+    def close_scrapers(self):
+        """Return the scrapers' browsers to the driver pool"""
+        for scraper in (self.youtube_scraper, self.instagram_scraper):
+            if scraper is not None:
+                scraper.close_driver()
+    
+    def _get_youtube_scraper(self):
+        """Create the YouTube scraper on first use"""
+        with self._scraper_init_lock:
+            if self.youtube_scraper is None:
+                from scrapers.youtube_selenium_scraper import YouTubeSeleniumScraper
+                self.youtube_scraper = YouTubeSeleniumScraper(
+                    driver_pool=_get_driver_pool(), api_key=self._setting('YOUTUBE_API_KEY') or None
+                )
+            return self.youtube_scraper
+    
+    async def analyze_videos_batch(self, urls: List[str], concurrency: int = 8,
+                                   progress_callback: Optional[Callable[[int, int], None]] = None) -> List[Dict[str, Any]]:
+        """Analyze several URLs concurrently, returning results in input order
+        
+        All URLs are scraped first, local analysis runs once over the whole
+        batch, and the LLM stage sends the prompts of LLM_BATCH_SIZE items at a
+        time under the rate limiter. progress_callback(done, total) is called
+        as scrapes and LLM chunks finish (two steps per URL).
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+        loop = asyncio.get_running_loop()
+        total_steps = 2 * len(urls)
+        done_steps = 0
+        
+        def step_done(count: int = 1):
+            nonlocal done_steps
+            done_steps += count
+            if progress_callback:
+                progress_callback(done_steps, total_steps)
+        
+        # Stage 1: scrape every URL concurrently
+        scraped = await self._gather_in_order([self._scrape_one_async(url, semaphore) for url in urls], step_done)
+        ok_indices = [i for i, item in enumerate(scraped) if 'error' not in item]
+        # Failed scrapes skip the LLM step
+        if len(ok_indices) < len(urls):
+            step_done(len(urls) - len(ok_indices))
+        
+        # Stage 2: one local analysis call for every successfully scraped URL
+        scraped_list = [scraped[i]['scraped_data'] for i in ok_indices]
+        local_analyses = await loop.run_in_executor(None, self.perform_local_analysis_batch, scraped_list)
+        
+        # Stage 3: LLM analysis, one round of concurrent prompts per chunk of items
+        chunks = [scraped_list[i:i + LLM_BATCH_SIZE] for i in range(0, len(scraped_list), LLM_BATCH_SIZE)]
+        chunk_results = await self._gather_in_order([self._llm_chunk_async(chunk, semaphore, step_done) for chunk in chunks])
+        llm_analyses = [analysis for chunk_result in chunk_results for analysis in chunk_result]
+        
+        results = list(scraped)
+        for i, local_analysis, llm_analysis in zip(ok_indices, local_analyses, llm_analyses):
+            item = scraped[i]
+            results[i] = self._build_result(urls[i], item['platform'], item['scraped_data'], local_analysis, llm_analysis)
+        return results
+    
+    @staticmethod
+    async def _gather_in_order(coros: List[Any], on_done: Optional[Callable[[], None]] = None) -> List[Any]:
+        """Like asyncio.gather, but calls on_done() as each coroutine finishes"""
+        async def indexed(index, coro):
+            return index, await coro
+        
+        results = [None] * len(coros)
+        for next_done in asyncio.as_completed([indexed(i, coro) for i, coro in enumerate(coros)]):
+            index, result = await next_done
+            results[index] = result
+            if on_done:
+                on_done()
+        return results
+    
+    async def _scrape_one_async(self, url: str, semaphore: asyncio.Semaphore) -> Dict[str, Any]:
+        """Scrape one URL in a worker thread"""
+        async with semaphore:
+            loop = asyncio.get_running_loop()
+            try:
+                platform, scraped_data = await loop.run_in_executor(None, self._scrape_stage, url, None)
+                if not scraped_data:
+                    return {'error': 'Failed to scrape data'}
+                return {'platform': platform, 'scraped_data': scraped_data}
+            except Exception as e:
+                logger.error(f"Content analysis error: {e}")
+                return {'error': str(e), 'status': 'error'}
+    
+    async def _llm_chunk_async(self, scraped_list: List[Dict[str, Any]], semaphore: asyncio.Semaphore,
+                               on_done: Callable[[int], None]) -> List[Optional[Dict[str, Any]]]:
+        """Run the LLM analysis for a chunk of scraped items in a worker thread"""
+        if not self.llm_processor:
+            on_done(len(scraped_list))
+            return [None] * len(scraped_list)
+        async with semaphore:
+            # Throttle before the requests instead of retrying after a 429
+            for _ in scraped_list:
+                await self._llm_limiter.acquire()
+            loop = asyncio.get_running_loop()
+            analyses = await loop.run_in_executor(None, self.perform_llm_analysis_batch, scraped_list)
+        on_done(len(scraped_list))
+        return analyses
+    
     def scrape_video_data(self, url: str, platform: str) -> Dict[str, Any]:
         """Scrape video data using enhanced scrapers (now supports channels/profiles)"""
         try:
             if platform == 'youtube':
                 # Use enhanced YouTube scraper with improved selectors
                 logger.info(f"Using enhanced YouTube scraper for: {url}")
+                youtube_scraper = self._get_youtube_scraper()
                 
                 # Determine if this is a channel or video URL
-                is_channel_url = any(pattern in url.lower() for pattern in ['/channel/', '/c/', '/@', '/user/'])
+                is_channel_url = bool(_YT_CHANNEL_RE.search(url))
                 
                 if is_channel_url:
                     # This is a YouTube channel URL
                     logger.info("Detected YouTube channel URL")
                     try:
                         # Scrape channel videos and profile info
-                        videos = self.youtube_scraper.scrape_channel_videos(url, max_videos=5)
-                        profile_data = self.youtube_scraper.scrape_user_profile(url.split('/')[-1])
+                        with youtube_scraper.driver_lock:
+                            videos = youtube_scraper.scrape_channel_videos(url, max_videos=5)
+                            profile_data = youtube_scraper.scrape_user_profile(url.split('/')[-1])
                         
                         if videos or profile_data:
                             # Extract channel info from first video or profile
@@ -203,20 +573,18 @@ class IntegratedVideoAnalyzer:
                             else:
                                 subscribers = 0
                             
-                            return {
-                                'title': f"{channel_name} - YouTube Channel",
-                                'description': channel_description,
-                                'views': total_views,
-                                'likes': subscribers,  # Using likes field for subscribers
-                                'comments': total_videos,  # Using comments field for video count
-                                'shares': 0,
-                                'duration': 'N/A',
-                                'upload_date': '',
-                                'channel_name': channel_name,
-                                'video_id': url.split('/')[-1],
-                                'url': url,
-                                'is_channel': True,
-                                'channel_data': {
+                            return ScrapedContent(
+                                title=f"{channel_name} - YouTube Channel",
+                                description=channel_description,
+                                views=total_views,
+                                likes=subscribers,  # Using likes field for subscribers
+                                comments=total_videos,  # Using comments field for video count
+                                duration='N/A',
+                                channel_name=channel_name,
+                                video_id=url.split('/')[-1],
+                                url=url,
+                                is_channel=True,
+                                channel_data={
                                     'channel_name': channel_name,
                                     'channel_description': channel_description,
                                     'subscribers': subscribers,
@@ -226,7 +594,7 @@ class IntegratedVideoAnalyzer:
                                     'recent_videos': videos[:3] if videos else [],
                                     'profile_data': profile_data
                                 }
-                            }
+                            ).to_dict()
                         else:
                             logger.warning("Failed to scrape YouTube channel data")
                             return self.create_sample_scraped_data(url, platform, is_channel=True)
@@ -239,27 +607,25 @@ class IntegratedVideoAnalyzer:
                     # This is a regular YouTube video
                     logger.info("Detected YouTube video URL")
                     try:
-                        # Use enhanced video details scraping with fallback
-                        video_data = self.youtube_scraper.scrape_video_details_with_fallback(url)
+                        # Plain HTTP first; the Selenium browser only starts if that fails
+                        video_data = youtube_scraper.scrape_video_details_http_first(url)
                         
                         if video_data and not video_data.get('scraping_error'):
-                            return {
-                                'title': video_data.get('title', ''),
-                                'description': video_data.get('description', ''),
-                                'views': video_data.get('views', 0),
-                                'likes': video_data.get('likes', 0),
-                                'comments': video_data.get('comments', 0),
-                                'shares': 0,
-                                'duration': video_data.get('duration', ''),
-                                'upload_date': video_data.get('published_at', ''),
-                                'channel_name': video_data.get('channel', ''),
-                                'video_id': video_data.get('video_id', ''),
-                                'url': url,
-                                'is_channel': False,
-                                'engagement_metrics': video_data.get('engagement_metrics', {}),
-                                'hashtags': video_data.get('hashtags', []),
-                                'api_fallback_used': video_data.get('api_fallback', False)
-                            }
+                            return ScrapedContent(
+                                title=video_data.get('title', ''),
+                                description=video_data.get('description', ''),
+                                views=video_data.get('views', 0),
+                                likes=video_data.get('likes', 0),
+                                comments=video_data.get('comments', 0),
+                                duration=video_data.get('duration', ''),
+                                upload_date=video_data.get('published_at', ''),
+                                channel_name=video_data.get('channel', ''),
+                                video_id=video_data.get('video_id', ''),
+                                url=url,
+                                engagement_metrics=video_data.get('engagement_metrics', {}),
+                                hashtags=video_data.get('hashtags', []),
+                                api_fallback_used=video_data.get('api_fallback', False)
+                            ).to_dict()
                         else:
                             logger.warning("Enhanced YouTube scraper failed, using sample data")
                             return self.create_sample_scraped_data(url, platform)
@@ -272,48 +638,48 @@ class IntegratedVideoAnalyzer:
                 if self.instagram_scraper:
                     # Extract username from URL
                     username = self.extract_instagram_username(url)
-                    if not username:
+                    is_post_url = '/p/' in url or '/reel/' in url
+                    if not username and not is_post_url:
                         logger.warning("Could not extract Instagram username from URL")
                         return self.create_sample_scraped_data(url, platform)
                     
                     # Check if this is a profile URL (not a specific post)
-                    if '/p/' not in url and '/reel/' not in url:
+                    if not is_post_url:
                         # This is a profile URL
-                        profile_data = self.instagram_scraper.scrape_profile(username)
+                        with self.instagram_scraper.driver_lock:
+                            profile_data = self.instagram_scraper.scrape_profile(username)
                         if profile_data:
-                            return {
-                                'title': f"@{username} - Instagram Profile",
-                                'description': profile_data.get('biography', ''),
-                                'views': profile_data.get('media_count', 0),
-                                'likes': profile_data.get('follower_count', 0),
-                                'comments': 0,
-                                'shares': 0,
-                                'duration': 'N/A',
-                                'upload_date': '',
-                                'channel_name': username,
-                                'video_id': username,
-                                'url': url,
-                                'is_channel': True,
-                                'channel_data': profile_data
-                            }
+                            return ScrapedContent(
+                                title=f"@{username} - Instagram Profile",
+                                description=profile_data.get('biography', ''),
+                                views=profile_data.get('media_count', 0),
+                                likes=profile_data.get('follower_count', 0),
+                                duration='N/A',
+                                channel_name=username,
+                                video_id=username,
+                                url=url,
+                                is_channel=True,
+                                channel_data=profile_data
+                            ).to_dict()
                     
                     # For posts/reels, get specific post data
-                    post_data = self.instagram_scraper.scrape_post(url)
+                    with self.instagram_scraper.driver_lock:
+                        post_data = self.instagram_scraper.scrape_post(url)
                     if post_data:
-                        return {
-                            'title': post_data.get('caption', '')[:100],
-                            'description': post_data.get('caption', ''),
-                            'views': post_data.get('view_count', 0),
-                            'likes': post_data.get('like_count', 0),
-                            'comments': post_data.get('comment_count', 0),
-                            'shares': 0,
-                            'duration': 'N/A',
-                            'upload_date': post_data.get('timestamp', ''),
-                            'channel_name': username,
-                            'video_id': url.split('/')[-2] if url.split('/')[-2] != 'p' else url.split('/')[-1],
-                            'url': url,
-                            'is_channel': False
-                        }
+                        caption = post_data.get('caption', '')
+                        url_parts = url.split('/')
+                        return ScrapedContent(
+                            title=caption[:100],
+                            description=caption,
+                            views=post_data.get('view_count', 0),
+                            likes=post_data.get('like_count', 0),
+                            comments=post_data.get('comment_count', 0),
+                            duration='N/A',
+                            upload_date=post_data.get('timestamp', ''),
+                            channel_name=username or '',
+                            video_id=url_parts[-2] if url_parts[-2] != 'p' else url_parts[-1],
+                            url=url
+                        ).to_dict()
                     
                     logger.warning("Failed to scrape Instagram data")
                     return self.create_sample_scraped_data(url, platform)
@@ -331,89 +697,43 @@ class IntegratedVideoAnalyzer:
     
     def _extract_video_id(self, url: str) -> str:
         """Extract video ID from URL"""
-        try:
-            if 'youtube.com/watch?v=' in url:
-                return url.split('v=')[-1].split('&')[0]
-            elif 'youtu.be/' in url:
-                return url.split('/')[-1]
-            else:
-                return 'unknown'
-        except Exception as e:
-            logger.error(f"Error extracting video ID: {e}")
-            return 'unknown'
+        return _extract_video_id(url)
     
     def extract_instagram_username(self, url: str) -> str:
         """Extract Instagram username from URL"""
-        try:
-            # Handle different Instagram URL formats
-            if '/p/' in url:
-                # It's a post URL, we need to get the username from the profile
-                return None  # We'll need to implement this properly
-            elif '/' in url:
-                # Extract username from profile URL
-                parts = url.split('/')
-                for part in parts:
-                    if part and not part.startswith('http') and 'instagram.com' not in part:
-                        return part
-            return None
-        except Exception as e:
-            logger.error(f"Error extracting Instagram username: {e}")
-            return None
+        return _extract_instagram_username(url)
     
     def create_sample_scraped_data(self, url: str, platform: str, is_channel: bool = False) -> Dict[str, Any]:
         """Create sample scraped data when scraper fails"""
         if is_channel:
-            return {
-                'title': f'Sample {platform.title()} Channel',
-                'description': 'This is a sample channel description for analysis purposes.',
-                'views': 150000,  # Total views
-                'likes': 12500,   # Subscribers
-                'comments': 85,   # Total videos
-                'shares': 0,
-                'duration': 'N/A',
-                'upload_date': '',
-                'channel_name': 'Sample Channel',
-                'video_id': 'sample_channel_123',
-                'url': url,
-                'is_channel': True,
-                'channel_data': {
-                    'channel_name': 'Sample Channel',
-                    'channel_description': 'This is a sample channel description.',
-                    'subscribers': 12500,
-                    'total_videos': 85,
-                    'total_views': 150000,
-                    'average_views': 1765,
-                    'recent_videos': []
-                }
-            }
+            data = _SAMPLE_CHANNEL_TEMPLATE.copy()
+            data['channel_data'] = {**_SAMPLE_CHANNEL_TEMPLATE['channel_data'], 'recent_videos': []}
+            data['title'] = f'Sample {platform.title()} Channel'
         else:
-            return {
-                'title': f'Sample {platform.title()} Video',
-                'description': 'This is a sample video description for analysis purposes.',
-                'views': 15420,
-                'likes': 892,
-                'comments': 45,
-                'shares': 23,
-                'duration': '2:30',
-                'upload_date': datetime.now().strftime('%Y-%m-%d'),
-                'channel_name': 'Sample Channel',
-                'video_id': 'sample_123',
-                'url': url,
-                'is_channel': False
-            }
+            data = _SAMPLE_VIDEO_TEMPLATE.copy()
+            data['title'] = f'Sample {platform.title()} Video'
+            data['upload_date'] = datetime.now().strftime('%Y-%m-%d')
+        data['url'] = url
+        data['is_sample_data'] = True
+        return data
+    
+    @staticmethod
+    def _to_reel_data(scraped_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Map scraped data onto the reel structure VideoAnalyzer expects"""
+        return {
+            'title': scraped_data.get('title', ''),
+            'description': scraped_data.get('description', ''),
+            'views': scraped_data.get('views', 0),
+            'likes': scraped_data.get('likes', 0),
+            'comments': scraped_data.get('comments', 0),
+            'shares': scraped_data.get('shares', 0)
+        }
     
     def perform_local_analysis(self, scraped_data: Dict[str, Any]) -> Dict[str, Any]:
         """Perform local analysis using VideoAnalyzer"""
         try:
             # Create a mock reels structure for analysis
-            reels_data = [{
-                'title': scraped_data.get('title', ''),
-                'description': scraped_data.get('description', ''),
-                'views': scraped_data.get('views', 0),
-                'likes': scraped_data.get('likes', 0),
-                'comments': scraped_data.get('comments', 0),
-                'shares': scraped_data.get('shares', 0)
-            }]
+            reels_data = [self._to_reel_data(scraped_data)]
             
             # Use VideoAnalyzer for analysis
             analysis_result = self.video_analyzer.analyze_reels_batch(reels_data)
@@ -423,64 +743,116 @@ class IntegratedVideoAnalyzer:
             logger.error(f"Local analysis error: {e}")
             return {'error': str(e)}
     
+    def perform_local_analysis_batch(self, scraped_list: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Perform local analysis for many scraped items in one VideoAnalyzer call"""
+        if not scraped_list:
+            return []
+        try:
+            batch_result = self.video_analyzer.analyze_reels_batch([self._to_reel_data(s) for s in scraped_list])
+            return self.video_analyzer.split_batch_result(batch_result)
+        except Exception as e:
+            logger.error(f"Local analysis error: {e}")
+            return [{'error': str(e)} for _ in scraped_list]
+    
     def check_api_connectivity(self) -> dict:
-        """Check connectivity to the API server"""
+        """Check connectivity to the API server, reusing the last result for API_STATUS_TTL seconds"""
+        if self._api_status and time.monotonic() - self._api_status[0] < API_STATUS_TTL:
+            return self._api_status[1]
+        
         try:
-            import requests
-            response = requests.get(f"{self.api_base_url}/health", timeout=5)
+            response = self._http.get(f"{self.api_base_url}/health", timeout=(2, 3))
             if response.status_code == 200:
-                return {"status": "connected", "message": "API server is running"}
+                status = {"status": "connected", "message": "API server is running"}
             else:
-                return {"status": "error", "message": f"API returned status {response.status_code}"}
+                status = {"status": "error", "message": f"API returned status {response.status_code}"}
         except Exception as e:
-            return {"status": "disconnected", "message": f"API connection failed: {str(e)}"}
+            status = {"status": "disconnected", "message": f"API connection failed: {str(e)}"}
+        
+        self._api_status = (time.monotonic(), status)
+        return status
+    
+    def test_llm_connection(self) -> bool:
+        """Probe the LLM provider, reusing the last result for API_STATUS_TTL seconds
+        
+        The result is tied to the provider, model and a hash of the API key, so
+        a configuration change always probes again.
+        """
+        llm = self.llm_processor
+        fingerprint = hashlib.sha256(f"{llm.provider}|{llm.model}|{llm.api_key or ''}".encode('utf-8')).hexdigest()
+        if self._llm_test and self._llm_test[1] == fingerprint and time.monotonic() - self._llm_test[0] < API_STATUS_TTL:
+            return self._llm_test[2]
+        
+        ok = llm.test_connection()
+        self._llm_test = (time.monotonic(), fingerprint, ok)
+        return ok
 
-    def perform_llm_analysis(self, scraped_data: Dict[str, Any]) -> Dict[str, Any]:
-        """Perform LLM analysis using LLMProcessor or API (now supports channels/profiles)"""
+    @staticmethod
+    def _llm_metadata(scraped_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Prepare metadata for LLM analysis (includes channel/profile data)"""
+        metadata = {
+            'title': scraped_data.get('title', ''),
+            'description': scraped_data.get('description', ''),
+            'views': scraped_data.get('views', 0),
+            'likes': scraped_data.get('likes', 0),
+            'comments': scraped_data.get('comments', 0)
+        }
+        
+        # Add channel/profile data if available
+        if scraped_data.get('is_channel', False) and scraped_data.get('channel_data'):
+            metadata['is_channel'] = True
+            metadata['channel_data'] = scraped_data['channel_data']
+        return metadata
+    
+    def stream_llm_summary(self, scraped_data: Dict[str, Any]) -> Iterator[str]:
+        """Stream the LLM summary for scraped content chunk by chunk"""
+        video_url = scraped_data.get('url', '')
+        return self.llm_processor.stream_process_video(
+            self._extract_video_id(video_url), video_url, 'youtube', None, self._llm_metadata(scraped_data)
+        )
+    
+    def perform_llm_analysis(self, scraped_data: Dict[str, Any], summary: Optional[str] = None) -> Dict[str, Any]:
+        """Perform LLM analysis using LLMProcessor or API (now supports channels/profiles)
+        
+        A summary that was already streamed to the user can be passed in so it
+        is not generated a second time.
+        """
         try:
             if self.llm_processor:
                 # Extract video ID from URL
                 video_url = scraped_data.get('url', '')
                 video_id = self._extract_video_id(video_url)
+                metadata = self._llm_metadata(scraped_data)
                 
-                # Prepare metadata for LLM analysis (now includes channel/profile data)
-                metadata = {
-                    'title': scraped_data.get('title', ''),
-                    'description': scraped_data.get('description', ''),
-                    'views': scraped_data.get('views', 0),
-                    'likes': scraped_data.get('likes', 0),
-                    'comments': scraped_data.get('comments', 0)
-                }
-                
-                # Add channel/profile data if available
-                if scraped_data.get('is_channel', False) and scraped_data.get('channel_data'):
-                    metadata['is_channel'] = True
-                    metadata['channel_data'] = scraped_data['channel_data']
-                
-                # Perform LLM analysis
-                llm_result = self.llm_processor.process_video(video_id, video_url, 'youtube', None, metadata)
+                # Perform LLM analysis, bounded so a slow provider cannot stall the session
+                future = _llm_executor(self.llm_processor.provider).submit(self.llm_processor.process_video, video_id, video_url, 'youtube', None, metadata, summary)
+                try:
+                    llm_result = future.result(timeout=LLM_CALL_TIMEOUT)
+                except FutureTimeoutError:
+                    logger.warning(f"LLM analysis timed out after {LLM_CALL_TIMEOUT}s")
+                    return {'error': f'LLM analysis timed out after {LLM_CALL_TIMEOUT:.0f}s'}
                 return llm_result
             
             # If LLM processor not available, try API
             elif self.check_api_connectivity()["status"] == "connected":
-                import requests
-                
                 # Prepare request data (now includes channel/profile data)
                 request_data = {
                     "video_url": scraped_data.get('url', ''),
                     "analysis_type": "sentiment",
-                    "metadata": scraped_data
+                    "metadata": scraped_data,
+                    "max_output_tokens": int(os.getenv('LLM_MAX_TOKENS', '1000'))
                 }
                 
-                response = requests.post(
+                response = self._http.post(
                     f"{self.api_base_url}/analyze",
                     json=request_data,
-                    timeout=30
+                    timeout=(5, 15)
                 )
                 
                 if response.status_code == 200:
                     return response.json()
                 else:
+                    # Re-check the API before the next request instead of trusting the cached status
+                    self._api_status = None
                     return {'error': f"API analysis failed: {response.status_code}"}
             
             else:
@@ -488,14 +860,208 @@ class IntegratedVideoAnalyzer:
                 
         except Exception as e:
             logger.error(f"LLM analysis error: {e}")
+            self._api_status = None
             return {'error': str(e)}
 
+    def perform_llm_analysis_batch(self, scraped_list: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Perform LLM analysis for several scraped items with one LLMProcessor call"""
+        if not self.llm_processor:
+            return [self.perform_llm_analysis(scraped_data) for scraped_data in scraped_list]
+        
+        videos = []
+        for scraped_data in scraped_list:
+            video_url = scraped_data.get('url', '')
+            videos.append({
+                'video_id': self._extract_video_id(video_url),
+                'video_url': video_url,
+                'platform': 'youtube',
+                'metadata': self._llm_metadata(scraped_data)
+            })
+        
+        try:
+            # The chunk's requests run concurrently, so it gets the same bound as a single analysis
+            future = _llm_executor(self.llm_processor.provider).submit(self.llm_processor.process_videos_batch, videos)
+            return future.result(timeout=LLM_CALL_TIMEOUT)
+        except FutureTimeoutError:
+            logger.warning(f"LLM batch analysis timed out after {LLM_CALL_TIMEOUT}s")
+            return [{'error': f'LLM analysis timed out after {LLM_CALL_TIMEOUT:.0f}s'} for _ in scraped_list]
+        except Exception as e:
+            logger.error(f"LLM batch analysis error: {e}")
+            return [{'error': str(e)} for _ in scraped_list]
+
+class AnalysisFailedError(Exception):
+    """Raised by cached_analyze so failed or placeholder analyses are not cached"""
+    
+    def __init__(self, result: Dict[str, Any]):
+        super().__init__(result.get('error', 'Unknown error'))
+        self.result = result
+
+@st.cache_resource(show_spinner=False)
+def _get_driver_pool():
+    """Chrome drivers shared by every scraper in this process, kept warm across reruns"""
+    from scrapers.selenium_scraper import WebDriverPool
+    return WebDriverPool(max_size=WEBDRIVER_POOL_SIZE)
+
+@st.cache_resource(show_spinner=False)
+def _get_analysis_store() -> Optional[AnalysisStore]:
+    """Process-wide store of completed analyses, or None when it is disabled or unavailable"""
+    if ANALYSIS_STORE_TTL <= 0:
+        return None
+    try:
+        return AnalysisStore(ANALYSIS_STORE_PATH, ttl=ANALYSIS_STORE_TTL)
+    except (sqlite3.Error, OSError) as e:
+        logger.warning(f"⚠️ Analysis store unavailable: {e}")
+        return None
+
+def stored_analysis(url: str) -> Optional[Dict[str, Any]]:
+    """Earlier result for url made under the session's current settings, if one is on disk"""
+    store = _get_analysis_store()
+    if store is None:
+        return None
+    result = store.get(url, st.session_state.analyzer_instance.result_variant())
+    # Rows saved before placeholder and LLM-error results were filtered out
+    return result if result and is_reusable_result(result) else None
+
+@st.cache_resource(show_spinner=False)
+def _warm_start_future() -> Future:
+    """Load the scrapers and start the driver pool on a background thread
+    
+    Only process-wide resources without credentials are warmed up here. Each
+    session builds its own analyzer, see _create_analyzer.
+    """
+    future = Future()
+    
+    def _warm_start():
+        try:
+            # Import the scraper modules now; the browsers themselves still start on first use
+            import scrapers.youtube_selenium_scraper  # noqa: F401
+            import scrapers.instagram_selenium_scraper  # noqa: F401
+            _get_driver_pool()
+        except Exception as e:
+            logger.warning(f"Scraper warm-up failed: {e}")
+        future.set_result(None)
+    
+    threading.Thread(target=_warm_start, name="analyzer-warm-start", daemon=True).start()
+    return future
+
+def _create_analyzer(settings: Dict[str, str]) -> IntegratedVideoAnalyzer:
+    """Create an analyzer for this session's settings
+    
+    The analyzer holds the session's scrapers and Instagram login, so it is
+    kept in st.session_state rather than shared through st.cache_resource.
+    """
+    try:
+        _warm_start_future().result(timeout=WARM_START_TIMEOUT)
+    except Exception as e:
+        logger.warning(f"Warm start unavailable ({e}), loading scrapers inline")
+    analyzer = IntegratedVideoAnalyzer(settings)
+    logger.info("✅ Integrated analyzer initialized")
+    return analyzer
+
+def reset_analyzer():
+    """Drop this session's analyzer so the next run rebuilds it from the current settings
+    
+    Only the session's own scrapers are closed; process-wide resources such
+    as the driver pool and the warm start stay up for the other sessions.
+    """
+    analyzer = st.session_state.analyzer_instance
+    if analyzer is not None:
+        analyzer.close_scrapers()
+        if analyzer.llm_processor is not None:
+            analyzer.llm_processor.close()
+    st.session_state.analyzer_instance = None
+    # The Instagram session belonged to the old analyzer, whose browsers were just released
+    st.session_state.instagram_logged_in = False
+
+# Start warming up as soon as the script loads, before the page is rendered
+_warm_start_future()
+
+@st.cache_data(ttl=3600, max_entries=512, show_spinner=False)
+def cached_analyze(_analyzer: IntegratedVideoAnalyzer, url: str, platform: Optional[str],
+                   analysis_types: Tuple[str, ...] = (), variant: str = '') -> Dict[str, Any]:
+    """Analyze a URL, reusing the result for repeated requests within an hour
+    
+    _analyzer is the calling session's analyzer; the leading underscore keeps
+    it out of the cache key. analysis_types and variant (the analyzer's
+    result_variant) are not used by the analysis itself; they are part of the
+    cache key so changing the analysis types, provider or keys analyzes again.
+    """
+    result = _analyzer.analyze_video(url, platform)
+    if not is_reusable_result(result):
+        raise AnalysisFailedError(result)
+    return result
+
+def _local_sentiment_label(local_analysis: Dict[str, Any]) -> Optional[str]:
+    """Sentiment of the first analyzed item, for the in-progress view"""
+    reels = (local_analysis or {}).get('reels_analysis') or [{}]
+    return reels[0].get('sentiment', {}).get('sentiment')
+
+def analyze_with_streamed_summary(analyzer: IntegratedVideoAnalyzer, url: str, platform: Optional[str]) -> Dict[str, Any]:
+    """Analyze a URL, rendering each stage (scrape, local sentiment, LLM summary) as it completes"""
+    try:
+        platform, scraped_data = analyzer._scrape_stage(url, platform)
+        if not scraped_data:
+            return {'error': 'Failed to scrape data'}
+        
+        # Show each stage as it finishes, then clear the view once the full result is rendered
+        live_view = st.empty()
+        with live_view.container():
+            render_content_info(platform, scraped_data)
+            
+            local_analysis = analyzer.perform_local_analysis(scraped_data)
+            sentiment = _local_sentiment_label(local_analysis)
+            if sentiment and not scraped_data.get('is_channel', False):
+                st.caption(f"🔍 Local sentiment: {sentiment.title()}")
+            
+            st.subheader("🤖 LLM Summary")
+            summary = st.write_stream(analyzer.stream_llm_summary(scraped_data))
+        llm_analysis = analyzer.perform_llm_analysis(scraped_data, summary=summary)
+        live_view.empty()
+        
+        return analyzer._build_result(url, platform, scraped_data, local_analysis, llm_analysis)
+    except Exception as e:
+        logger.error(f"Content analysis error: {e}")
+        return {'error': str(e), 'status': 'error'}
+
+def get_setting(name: str, default: str = '') -> str:
+    """Sidebar setting saved in this session, falling back to the environment"""
+    return st.session_state.get(name) or os.getenv(name, default)
+
+def analyzer_settings() -> Dict[str, str]:
+    """This session's provider, keys and URLs, passed to its analyzer explicitly"""
+    settings = {name: get_setting(name) for name in SESSION_SETTINGS}
+    settings['LLM_PROVIDER'] = st.session_state.get('llm_provider') or os.getenv('LLM_PROVIDER', 'mistral')
+    return settings
+
+def save_setting(name: str, value: str, label: str):
+    """Save a sidebar setting and rebuild the analyzer with it, without rerunning the app
+    
+    The value stays in this session; os.environ is shared by every session.
+    """
+    st.session_state[name] = value
+    reset_analyzer()
+    initialize_system()
+    st.toast(f"✅ {label} saved!")
+
+def current_analyzer() -> IntegratedVideoAnalyzer:
+    """This session's analyzer, brought up to date with the sidebar settings
+    
+    The provider is picked in a fragment, so the analysis form checks again
+    at click time instead of relying on the last full run.
+    """
+    settings = analyzer_settings()
+    analyzer = st.session_state.analyzer_instance
+    if analyzer is None:
+        analyzer = st.session_state.analyzer_instance = _create_analyzer(settings)
+    elif analyzer.settings != settings:
+        # A provider switch only rebuilds the LLM processor; scrapers and the login are kept
+        analyzer.apply_settings(settings)
+    return analyzer
+
 def initialize_system():
     """Initialize the integrated system"""
     try:
-        if st.session_state.analyzer_instance is None:
-            st.session_state.analyzer_instance = IntegratedVideoAnalyzer()
-            logger.info("✅ Integrated analyzer initialized")
+        current_analyzer()
         
         if st.session_state.platform_resolver is None:
             st.session_state.platform_resolver = PlatformResolver()
@@ -506,41 +1072,169 @@ def initialize_system():
         logger.error(f"❌ System initialization error: {e}")
         return False
 
-def display_analysis_results(result: Dict[str, Any]):
-    """Display analysis results in a structured format (now supports channels/profiles)"""
+def record_analysis_results(results: List[Dict[str, Any]], persist: bool = True) -> "pd.DataFrame":
+    """Append successful analyses to the session, returning their columnar rows
     
-    if 'error' in result:
-        st.error(f"Analysis Error: {result['error']}")
+    The result dicts stay in analysis_results for display_analysis_results; the
+    dashboard reads the analysis_df columns instead of re-walking every dict.
+    Both keep the last MAX_HISTORY analyses, while platform_totals counts all
+    of them. With persist, the results are also saved for later sessions,
+    except placeholder data and results whose LLM step failed.
+    """
+    import pandas as pd
+    
+    rows = pd.DataFrame(
+        [(r['platform'],
+          r['scraped_data'].get('is_channel', False),
+          r['scraped_data'].get('views', 0),
+          r['scraped_data'].get('likes', 0),
+          r['scraped_data'].get('comments', 0),
+          r['timestamp'],
+          r['url']) for r in results],
+        columns=ANALYSIS_DF_COLUMNS
+    )
+    rows[METRIC_COLUMNS] = rows[METRIC_COLUMNS].apply(pd.to_numeric, errors='coerce').fillna(0).astype('int64')
+    
+    st.session_state.analysis_results.extend(results)
+    store = _get_analysis_store()
+    reusable = [result for result in results if is_reusable_result(result)] if persist and store is not None else []
+    if reusable:
+        store.save_many(reusable, st.session_state.analyzer_instance.result_variant())
+    # One concat per single analysis or batch, not per row
+    analysis_df = st.session_state.get('analysis_df')
+    analysis_df = rows if analysis_df is None else pd.concat([analysis_df, rows], ignore_index=True)
+    if len(analysis_df) > MAX_HISTORY:
+        analysis_df = analysis_df.iloc[-MAX_HISTORY:].reset_index(drop=True)
+    st.session_state.analysis_df = analysis_df
+    # The recent analyses table stays resident and only changes when results land
+    st.session_state.recent_df = analysis_df[RECENT_SOURCE_COLUMNS].tail(10).set_axis(RECENT_COLUMNS, axis=1)
+    
+    # Only the new rows are added to the running totals
+    totals = st.session_state.platform_totals
+    totals['count'].update(rows['platform'])
+    for metric in METRIC_COLUMNS:
+        for platform, value in rows.groupby('platform')[metric].sum().items():
+            totals[metric][platform] += int(value)
+    return rows
+
+def _results_signature(analysis_df: "pd.DataFrame") -> Tuple[int, Optional[str]]:
+    """Cheap identity for the session's results: the running total and last timestamp"""
+    total = sum(st.session_state.platform_totals['count'].values())
+    return (total, analysis_df['timestamp'].iat[-1] if len(analysis_df) else None)
+
+def dashboard_snapshot(analysis_df: "pd.DataFrame") -> Dict[str, tuple]:
+    """Hashable dashboard rows, rebuilt only when this session's results change"""
+    signature = _results_signature(analysis_df)
+    cached = st.session_state.get('dashboard_snapshot')
+    if cached and cached[0] == signature:
+        return cached[1]
+    
+    totals = st.session_state.platform_totals
+    platform_counts = tuple(totals['count'].most_common())
+    snapshot = {
+        'platform_counts': platform_counts,
+        # Averages from the running totals, covering analyses already dropped from the history
+        'engagement_rows': tuple(
+            (platform, *(round(totals[metric][platform] / count) for metric in METRIC_COLUMNS))
+            for platform, count in platform_counts
+        ),
+        # Engagement history across the analyses kept in this session
+        'timeline_rows': tuple(zip(analysis_df['timestamp'], analysis_df['views'], analysis_df['likes'])),
+    }
+    st.session_state.dashboard_snapshot = (signature, snapshot)
+    return snapshot
+
+@st.cache_resource(show_spinner=False, max_entries=32)
+def build_platform_figure(platform_counts: Tuple[Tuple[str, int], ...]) -> "go.Figure":
+    """Build the platform distribution pie chart from (platform, count) pairs"""
+    import plotly.express as px
+    
+    names, values = zip(*platform_counts)
+    return px.pie(values=values, names=names, title="Videos by Platform")
+
+@st.cache_resource(show_spinner=False, max_entries=32)
+def build_engagement_figure(engagement_rows: Tuple[Tuple[str, int, int, int], ...]) -> "go.Figure":
+    """Build the engagement bar chart from (platform, views, likes, comments) rows"""
+    import pandas as pd
+    import plotly.express as px
+    
+    df = pd.DataFrame(engagement_rows, columns=ENGAGEMENT_COLUMNS)
+    return px.bar(df, x='Platform', y=['Views', 'Likes', 'Comments'],
+                  title="Average Engagement by Platform", barmode='group')
+
+def _register_plotly_resampler():
+    """Register plotly-resampler once, if enabled and installed"""
+    global _plotly_resampler_registered
+    if not PLOTLY_RESAMPLER_ENABLED or _plotly_resampler_registered:
         return
+    try:
+        from plotly_resampler import register_plotly_resampler
+        register_plotly_resampler(mode='auto', default_n_shown_samples=2000)
+        logger.info("✅ plotly-resampler registered")
+    except ImportError:
+        logger.warning("⚠️ PLOTLY_RESAMPLER_ENABLED is set but plotly-resampler is not installed")
+    _plotly_resampler_registered = True
+
+@st.cache_resource(show_spinner=False, max_entries=32)
+def build_engagement_timeline_figure(timeline_rows: Tuple[Tuple[str, int, int], ...]) -> "go.Figure":
+    """Build the engagement-over-time chart from (timestamp, views, likes) rows"""
+    import numpy as np
+    import plotly.graph_objects as go
     
-    # Check if this is a channel/profile or regular video
-    is_channel_profile = result['scraped_data'].get('is_channel', False)
+    _register_plotly_resampler()
+    
+    # numpy arrays (not lists) so plotly-resampler can downsample the series
+    timestamps = np.asarray([row[0] for row in timeline_rows], dtype='datetime64[ms]')
+    views = np.asarray([row[1] for row in timeline_rows], dtype=np.int64)
+    likes = np.asarray([row[2] for row in timeline_rows], dtype=np.int64)
+    
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(x=timestamps, y=views, mode='lines+markers', name='Views'))
+    fig.add_trace(go.Scatter(x=timestamps, y=likes, mode='lines+markers', name='Likes'))
+    fig.update_layout(title="Engagement Over Time", xaxis_title="Analyzed At")
+    return fig
+
+def _preview_json(data: Any, max_list: int = 3, max_str: int = 200) -> Any:
+    """Truncate nested lists and long strings so large payloads stay cheap to render"""
+    if isinstance(data, dict):
+        return {key: _preview_json(value, max_list, max_str) for key, value in data.items()}
+    if isinstance(data, list):
+        preview = [_preview_json(item, max_list, max_str) for item in data[:max_list]]
+        if len(data) > max_list:
+            preview.append(f"... {len(data) - max_list} more")
+        return preview
+    if isinstance(data, str) and len(data) > max_str:
+        return data[:max_str] + "..."
+    return data
+
+def render_content_info(platform: str, scraped_data: Dict[str, Any]):
+    """Basic content info (different for channels/profiles vs videos), available as soon as scraping finishes"""
+    is_channel_profile = scraped_data.get('is_channel', False)
     
-    # Basic content info (different for channels/profiles vs videos)
     with st.expander(f"{'📺 Channel/Profile Information' if is_channel_profile else '📹 Video Information'}", expanded=True):
         col1, col2, col3 = st.columns(3)
         with col1:
-            st.metric("Platform", result['platform'].title())
+            st.metric("Platform", platform.title())
         with col2:
             if is_channel_profile:
-                if result['platform'] == 'youtube':
-                    st.metric("Subscribers", f"{result['scraped_data'].get('likes', 0):,}")
+                if platform == 'youtube':
+                    st.metric("Subscribers", f"{scraped_data.get('likes', 0):,}")
                 else:  # Instagram
-                    st.metric("Followers", f"{result['scraped_data'].get('likes', 0):,}")
+                    st.metric("Followers", f"{scraped_data.get('likes', 0):,}")
             else:
-                st.metric("Views", f"{result['scraped_data'].get('views', 0):,}")
+                st.metric("Views", f"{scraped_data.get('views', 0):,}")
         with col3:
             if is_channel_profile:
-                if result['platform'] == 'youtube':
-                    st.metric("Total Videos", f"{result['scraped_data'].get('comments', 0):,}")
+                if platform == 'youtube':
+                    st.metric("Total Videos", f"{scraped_data.get('comments', 0):,}")
                 else:  # Instagram
-                    st.metric("Posts Count", f"{result['scraped_data'].get('views', 0):,}")
+                    st.metric("Posts Count", f"{scraped_data.get('views', 0):,}")
             else:
-                st.metric("Likes", f"{result['scraped_data'].get('likes', 0):,}")
+                st.metric("Likes", f"{scraped_data.get('likes', 0):,}")
         
         # Show channel/profile specific data if available
-        if is_channel_profile and result['scraped_data'].get('channel_data'):
-            channel_data = result['scraped_data']['channel_data']
+        if is_channel_profile and scraped_data.get('channel_data'):
+            channel_data = scraped_data['channel_data']
             col1, col2 = st.columns(2)
             with col1:
                 if channel_data.get('is_verified') is not None:
@@ -552,6 +1246,18 @@ def display_analysis_results(result: Dict[str, Any]):
                     st.metric("Channel Created", channel_data['channel_created'])
                 if channel_data.get('average_views'):
                     st.metric("Avg Views", f"{channel_data['average_views']:,}")
+
+def display_analysis_results(result: Dict[str, Any]):
+    """Display analysis results in a structured format (now supports channels/profiles)"""
+    
+    if 'error' in result:
+        st.error(f"Analysis Error: {result['error']}")
+        return
+    
+    # Check if this is a channel/profile or regular video
+    is_channel_profile = result['scraped_data'].get('is_channel', False)
+    
+    render_content_info(result['platform'], result['scraped_data'])
     
     # Enhanced scraper information
     if result['platform'] == 'youtube' and result['scraped_data'].get('api_fallback_used'):
@@ -581,7 +1287,11 @@ def display_analysis_results(result: Dict[str, Any]):
     
     # Scraped data
     with st.expander(f"📊 Scraped {'Channel/Profile' if is_channel_profile else 'Video'} Data"):
-        st.json(result['scraped_data'])
+        # Only send the full payload (e.g. every recent video) to the browser on request
+        if st.toggle("Show full JSON", key="show_full_scraped_json"):
+            st.json(result['scraped_data'])
+        else:
+            st.json(_preview_json(result['scraped_data']))
     
     # Local analysis (only for regular videos, not channels/profiles)
     if result.get('local_analysis') and not is_channel_profile:
@@ -619,22 +1329,390 @@ def display_analysis_results(result: Dict[str, Any]):
         with st.expander(f"🤖 LLM Analysis {'(Channel/Profile)' if is_channel_profile else '(Video)'}"):
             llm_data = result['llm_analysis']
             if isinstance(llm_data, dict):
+                # Build the text sections into one markdown element instead of a widget per line
+                sections = []
                 if 'summary' in llm_data:
-                    st.write("**Summary:**")
-                    st.write(llm_data['summary'])
+                    sections.append(f"**Summary:**\n\n{llm_data['summary']}")
                 if 'sentiment' in llm_data:
-                    st.write(f"**Sentiment:** {llm_data['sentiment']}")
+                    sections.append(f"**Sentiment:** {llm_data['sentiment']}")
                 if 'topics' in llm_data:
-                    st.write("**Topics:**")
-                    for topic in llm_data['topics']:
-                        st.badge(topic)
+                    sections.append("**Topics:** " + " ".join(f"`{topic}`" for topic in llm_data['topics']))
+                if sections:
+                    st.markdown("\n\n".join(sections))
                 if 'key_insights' in llm_data:
-                    st.write("**Key Insights:**")
-                    for insight in llm_data['key_insights']:
-                        st.write(f"• {insight}")
+                    st.markdown("**Key Insights:**\n\n" + "\n".join(f"- {insight}" for insight in llm_data['key_insights']))
             else:
                 st.write(llm_data)
 
+@st.fragment
+def render_analysis_form(platform: str, analysis_types: Tuple[str, ...]):
+    """URL input and analyze button; typing here only reruns this fragment"""
+    col1, col2 = st.columns([2, 1])
+    
+    with col1:
+        video_url = st.text_input(
+            "Video/Channel URL",
+            placeholder=f"Enter {platform} video, channel, or profile URL...",
+            help="Paste the complete video, channel, or profile URL here. Supports YouTube channels and Instagram profiles."
+        )
+    
+    with col2:
+        analyze_button = st.button("🚀 Analyze Content", type="primary", use_container_width=True)
+        stream_summary = st.checkbox("⚡ Stream LLM summary", value=True, key="stream_llm_summary")
+        force_refresh = st.checkbox("🔄 Force refresh", value=False, key="force_refresh",
+                                    help="Ignore the cached result for this URL and analyze it again")
+    
+    if analyze_button and video_url:
+        with st.spinner(f"Analyzing {platform} content..."):
+            try:
+                analyzer = current_analyzer()
+                saved_result = None if force_refresh else stored_analysis(video_url)
+                if saved_result:
+                    result = saved_result
+                elif stream_summary and analyzer.llm_processor:
+                    result = analyze_with_streamed_summary(analyzer, video_url, platform)
+                elif force_refresh:
+                    result = analyzer.analyze_video(video_url, platform)
+                else:
+                    try:
+                        result = cached_analyze(analyzer, video_url, platform, analysis_types,
+                                                analyzer.result_variant())
+                    except AnalysisFailedError as e:
+                        result = e.result
+                
+                if result.get('status') == 'success':
+                    record_analysis_results([result], persist=saved_result is None)
+                    st.session_state.current_result = result
+                    # Refresh the app once so the results fragment picks up the new result
+                    st.rerun()
+                else:
+                    st.error(f"Analysis failed: {result.get('error', 'Unknown error')}")
+                    
+            except Exception as e:
+                st.error(f"Analysis error: {str(e)}")
+                logger.error(f"Analysis exception: {e}")
+
+@st.fragment
+def render_latest_result():
+    """Render the latest single analysis; its widgets only rerun this fragment"""
+    result = st.session_state.get('current_result')
+    if not result:
+        return
+    
+    # Show appropriate success message based on content type
+    is_channel_profile = result['scraped_data'].get('is_channel', False)
+    if is_channel_profile:
+        st.success(f"✅ {'Channel' if result['platform'] == 'youtube' else 'Profile'} Analysis Complete!")
+    else:
+        st.success("✅ Video Analysis Complete!")
+    
+    display_analysis_results(result)
+
+@st.fragment
+def render_instagram_login():
+    """Instagram login panel; typing credentials only reruns this fragment"""
+    st.divider()
+    st.header("🔐 Instagram Login")
+    
+    # Check if Instagram credentials are available in environment
+    env_username = os.getenv('INSTAGRAM_USERNAME')
+    env_password = os.getenv('INSTAGRAM_PASSWORD')
+    use_env_credentials = st.checkbox("Use environment credentials", value=bool(env_username and env_password))
+    
+    with st.expander("Instagram Configuration"):
+        if use_env_credentials and env_username and env_password:
+            instagram_username = st.text_input(
+                "Instagram Username",
+                value=env_username,
+                help="Your Instagram username",
+                disabled=True
+            )
+            instagram_password = st.text_input(
+                "Instagram Password",
+                value="***",
+                type="password",
+                help="Your Instagram password",
+                disabled=True
+            )
+            st.info("Using credentials from environment variables")
+        else:
+            instagram_username = st.text_input(
+                "Instagram Username",
+                value=os.getenv('INSTAGRAM_USERNAME', ''),
+                help="Your Instagram username"
+            )
+            instagram_password = st.text_input(
+                "Instagram Password",
+                type="password",
+                help="Your Instagram password"
+            )
+        
+        login_button = st.button("🚀 Login to Instagram")
+        
+        if login_button:
+            username = env_username if use_env_credentials and env_username else instagram_username
+            password = env_password if use_env_credentials and env_password else instagram_password
+            
+            if username and password:
+                with st.spinner("Logging in to Instagram..."):
+                    success = st.session_state.analyzer_instance.initialize_instagram_scraper(
+                        username, password
+                    )
+                    if success:
+                        st.session_state.instagram_logged_in = True
+                        st.session_state.instagram_username = username
+                        st.success("✅ Instagram login successful!")
+                        # Refresh the rest of the app (status panels) with the new login
+                        st.rerun()
+                    else:
+                        st.error("❌ Instagram login failed")
+            else:
+                st.warning("Please enter both username and password")
+        
+        if st.session_state.instagram_logged_in:
+            st.success(f"✅ Logged in to Instagram as {st.session_state.get('instagram_username', 'User')}")
+            if st.button("Logout from Instagram"):
+                st.session_state.instagram_logged_in = False
+                st.session_state.pop('instagram_username', None)
+                if st.session_state.analyzer_instance.instagram_scraper is not None:
+                    st.session_state.analyzer_instance.instagram_scraper.close_driver()
+                st.session_state.analyzer_instance.instagram_scraper = None
+                st.session_state.analyzer_instance.instagram_username = None
+                st.rerun()
+        else:
+            st.info("ℹ️ Not logged in to Instagram")
+
+@st.fragment
+def render_api_configuration():
+    """API key/provider panel; typing keys only reruns this fragment"""
+    # API Configuration Section
+    st.header("🔑 API Configuration")
+    
+    with st.expander("Configure API Keys", expanded=True):
+        # LLM Provider selection
+        providers = ["mistral", "openrouter", "ollama"]
+        # Start from the provider the analyzer is built with by default
+        default_provider = os.getenv('LLM_PROVIDER', 'mistral')
+        llm_provider = st.selectbox(
+            "LLM Provider",
+            providers,
+            index=providers.index(default_provider) if default_provider in providers else 0,
+            key="llm_provider",
+            help="Select your preferred LLM provider"
+        )
+        
+        # API Key inputs based on provider
+        if llm_provider == "mistral":
+            mistral_api_key = st.text_input(
+                "Mistral API Key",
+                type="password",
+                value=get_setting('MISTRAL_API_KEY'),
+                help="Enter your Mistral AI API key"
+            )
+            if mistral_api_key and mistral_api_key != get_setting('MISTRAL_API_KEY'):
+                if st.button("Save Mistral API Key"):
+                    save_setting('MISTRAL_API_KEY', mistral_api_key, "Mistral API Key")
+                    
+        elif llm_provider == "openrouter":
+            openrouter_api_key = st.text_input(
+                "OpenRouter API Key",
+                type="password",
+                value=get_setting('OPENROUTER_API_KEY'),
+                help="Enter your OpenRouter API key"
+            )
+            if openrouter_api_key and openrouter_api_key != get_setting('OPENROUTER_API_KEY'):
+                if st.button("Save OpenRouter API Key"):
+                    save_setting('OPENROUTER_API_KEY', openrouter_api_key, "OpenRouter API Key")
+                    
+        elif llm_provider == "ollama":
+            ollama_url = st.text_input(
+                "Ollama API URL",
+                value=get_setting('OLLAMA_API_URL', 'http://localhost:11434/api/generate'),
+                help="Enter your Ollama API URL"
+            )
+            if ollama_url and ollama_url != get_setting('OLLAMA_API_URL'):
+                if st.button("Save Ollama URL"):
+                    save_setting('OLLAMA_API_URL', ollama_url, "Ollama URL")
+            # Server-side settings: concurrent LLM requests only overlap if the Ollama server allows it
+            st.caption(
+                f"Ollama server parallelism: OLLAMA_NUM_PARALLEL={os.getenv('OLLAMA_NUM_PARALLEL', 'default')}, "
+                f"OLLAMA_MAX_LOADED_MODELS={os.getenv('OLLAMA_MAX_LOADED_MODELS', 'default')}. "
+                "Set these where `ollama serve` runs to process concurrent requests in parallel."
+            )
+        
+        # YouTube API Key for enhanced scraper
+        st.divider()
+        st.subheader("🎬 YouTube API Configuration")
+        youtube_api_key = st.text_input(
+            "YouTube Data API Key (Optional)",
+            type="password",
+            value=get_setting('YOUTUBE_API_KEY'),
+            help="Enter your YouTube Data API key for enhanced scraping reliability"
+        )
+        if youtube_api_key and youtube_api_key != get_setting('YOUTUBE_API_KEY'):
+            if st.button("Save YouTube API Key"):
+                save_setting('YOUTUBE_API_KEY', youtube_api_key, "YouTube API Key")
+                st.info("🔄 Enhanced YouTube scraper will now use API fallback when needed")
+        
+        if get_setting('YOUTUBE_API_KEY'):
+            st.success("✅ YouTube API Key configured")
+            st.caption("Enhanced scraper will use API fallback when Selenium fails")
+        else:
+            st.info("ℹ️ YouTube API Key not configured")
+            st.caption("Scraper will use Selenium-only mode")
+        
+        # Test API connection
+        if st.button("🧪 Test API Connection"):
+            try:
+                if st.session_state.analyzer_instance and st.session_state.analyzer_instance.llm_processor:
+                    # Test the LLM connection (repeat clicks within API_STATUS_TTL reuse the result)
+                    test_result = st.session_state.analyzer_instance.test_llm_connection()
+                    if test_result:
+                        st.success("✅ API Connection Successful!")
+                    else:
+                        st.error("❌ API Connection Failed")
+                else:
+                    st.warning("⚠️ LLM Processor not initialized")
+            except Exception as e:
+                st.error(f"❌ API Test Error: {str(e)}")
+
+@st.fragment
+def render_system_info():
+    """System information tab, isolated from the dashboard and analysis tabs"""
+    st.header("📊 System Information")
+    
+    # Component Status
+    st.subheader("🔧 Component Status")
+    
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        if st.session_state.analyzer_instance.llm_processor:
+            st.success("✅ LLM Processor: Active")
+        else:
+            st.error("❌ LLM Processor: Inactive")
+            
+        if st.session_state.analyzer_instance.video_analyzer:
+            st.success("✅ Video Analyzer: Active")
+        else:
+            st.error("❌ Video Analyzer: Inactive")
+    
+    with col2:
+        if st.session_state.analyzer_instance.youtube_scraper:
+            st.success("✅ YouTube Scraper: Enhanced (v2.0)")
+            # Show enhanced features
+            st.caption("🔧 Multiple selector fallbacks")
+            st.caption("🔄 API fallback integration")
+            st.caption("📊 Advanced engagement extraction")
+        else:
+            st.info("ℹ️ YouTube Scraper: Starts on first YouTube URL")
+            
+        if st.session_state.analyzer_instance.instagram_scraper:
+            st.success("✅ Instagram Scraper: Active")
+        else:
+            st.error("❌ Instagram Scraper: Inactive")
+    
+    with col3:
+        if st.session_state.analyzer_instance.platform_resolver:
+            st.success("✅ Platform Resolver: Active")
+        else:
+            st.error("❌ Platform Resolver: Inactive")
+        
+        # API Connectivity Status
+        api_status = st.session_state.analyzer_instance.check_api_connectivity()
+        if api_status["status"] == "connected":
+            st.success("✅ API Server: Connected")
+        else:
+            st.warning(f"⚠️ API Server: {api_status['message']}")
+
+    # LLM Response Cache
+    st.subheader("🗄️ LLM Response Cache")
+    response_cache = getattr(st.session_state.analyzer_instance.llm_processor, 'response_cache', None)
+    if response_cache:
+        cache_stats = response_cache.stats()
+        col1, col2, col3 = st.columns(3)
+        col1.metric("Cache hits", cache_stats['hits'])
+        col2.metric("Cache misses", cache_stats['misses'])
+        col3.metric("Stored responses", cache_stats['entries'])
+        st.caption(f"Stored in {cache_stats['path']}")
+    else:
+        st.info("ℹ️ LLM response cache disabled (LLM_CACHE_TTL=0)")
+
+    # Saved Analyses
+    st.subheader("💾 Saved Analyses")
+    analysis_store = _get_analysis_store()
+    if analysis_store:
+        st.metric("Analyses on disk", analysis_store.count())
+        st.caption(f"Stored in {analysis_store.path}")
+        # The store is shared by every session, so its history is only loaded on request
+        if not st.session_state.get('analyses_restored') and st.button("Load saved analyses"):
+            st.session_state.analyses_restored = True
+            saved_results = analysis_store.load(limit=MAX_HISTORY)
+            if saved_results:
+                record_analysis_results(saved_results, persist=False)
+            st.toast(f"📥 Loaded {len(saved_results)} saved analyses")
+            # Refresh the dashboard with the loaded history
+            st.rerun()
+        if st.button("Clear persistent cache"):
+            removed = analysis_store.clear()
+            cached_analyze.clear()
+            st.toast(f"🗑️ Removed {removed} saved analyses")
+    else:
+        st.info("ℹ️ Analysis store disabled (ANALYSIS_STORE_TTL=0)")
+
+    # Environment Variables
+    st.subheader("🌍 Environment Configuration")
+    
+    env = os.environ
+    st.text("\n".join(
+        f"{var}: {'Not set' if var not in env else '***' if var in SECRET_ENV_VARS else env[var]}"
+        for var in DISPLAYED_ENV_VARS
+    ))
+    
+    # Instagram Login Status
+    st.subheader("📱 Instagram Login Status")
+    if st.session_state.instagram_logged_in:
+        st.success(f"✅ Logged in as: {st.session_state.get('instagram_username', 'User')}")
+    else:
+        st.info("ℹ️ Not logged in to Instagram")
+    
+    # System Capabilities
+    st.subheader("🎯 System Capabilities")
+    
+    capabilities = [
+        "✅ Single Video Analysis",
+        "✅ Batch Video Analysis", 
+        "✅ Multi-Platform Support (YouTube, Instagram, TikTok)",
+        "✅ Enhanced YouTube Scraper with Multiple Selector Fallbacks",
+        "✅ YouTube API Integration for Reliable Data Extraction",
+        "✅ Advanced Engagement Metrics Extraction",
+        "✅ Channel and Profile Analysis Support",
+        "✅ Local Sentiment Analysis",
+        "✅ LLM-Powered Analysis",
+        "✅ Interactive Dashboard",
+        "✅ System Monitoring",
+        "✅ Instagram Login Integration",
+        "✅ API Server Integration",
+        "✅ Environment Configuration"
+    ]
+    
+    for capability in capabilities:
+        st.write(capability)
+        
+    # Debug Information
+    if os.getenv('DEBUG', 'false').lower() == 'true':
+        st.subheader("🔍 Debug Information")
+        st.json({
+            "session_state_keys": list(st.session_state.keys()),
+            "analyzer_components": {
+                "llm_processor": str(type(st.session_state.analyzer_instance.llm_processor)) if st.session_state.analyzer_instance.llm_processor else None,
+                "video_analyzer": str(type(st.session_state.analyzer_instance.video_analyzer)),
+                "platform_resolver": str(type(st.session_state.analyzer_instance.platform_resolver)),
+                "youtube_scraper": str(type(st.session_state.analyzer_instance.youtube_scraper)) if st.session_state.analyzer_instance.youtube_scraper else None,
+                "instagram_scraper": str(type(st.session_state.analyzer_instance.instagram_scraper)) if st.session_state.analyzer_instance.instagram_scraper else None
+            }
+        })
+
 def main():
     """Main application function"""
     
@@ -693,162 +1771,10 @@ def main():
         
         # Instagram login section
         if platform == "instagram":
-            st.divider()
-            st.header("🔐 Instagram Login")
-            
-            # Check if Instagram credentials are available in environment
-            env_username = os.getenv('INSTAGRAM_USERNAME')
-            env_password = os.getenv('INSTAGRAM_PASSWORD')
-            use_env_credentials = st.checkbox("Use environment credentials", value=bool(env_username and env_password))
-            
-            with st.expander("Instagram Configuration"):
-                if use_env_credentials and env_username and env_password:
-                    instagram_username = st.text_input(
-                        "Instagram Username",
-                        value=env_username,
-                        help="Your Instagram username",
-                        disabled=True
-                    )
-                    instagram_password = st.text_input(
-                        "Instagram Password",
-                        value="***",
-                        type="password",
-                        help="Your Instagram password",
-                        disabled=True
-                    )
-                    st.info("Using credentials from environment variables")
-                else:
-                    instagram_username = st.text_input(
-                        "Instagram Username",
-                        value=os.getenv('INSTAGRAM_USERNAME', ''),
-                        help="Your Instagram username"
-                    )
-                    instagram_password = st.text_input(
-                        "Instagram Password",
-                        type="password",
-                        help="Your Instagram password"
-                    )
-                
-                login_button = st.button("🚀 Login to Instagram")
-                
-                if login_button:
-                    username = env_username if use_env_credentials and env_username else instagram_username
-                    password = env_password if use_env_credentials and env_password else instagram_password
-                    
-                    if username and password:
-                        with st.spinner("Logging in to Instagram..."):
-                            success = st.session_state.analyzer_instance.initialize_instagram_scraper(
-                                username, password
-                            )
-                            if success:
-                                st.session_state.instagram_logged_in = True
-                                st.session_state.instagram_username = username
-                                st.success("✅ Instagram login successful!")
-                            else:
-                                st.error("❌ Instagram login failed")
-                    else:
-                        st.warning("Please enter both username and password")
-                
-                if st.session_state.instagram_logged_in:
-                    st.success(f"✅ Logged in to Instagram as {st.session_state.get('instagram_username', 'User')}")
-                    if st.button("Logout from Instagram"):
-                        st.session_state.instagram_logged_in = False
-                        st.session_state.pop('instagram_username', None)
-                        st.session_state.analyzer_instance.instagram_scraper = None
-                        st.rerun()
-                else:
-                    st.info("ℹ️ Not logged in to Instagram")
+            render_instagram_login()
         
         st.divider()
-        
-        # API Configuration Section
-        st.header("🔑 API Configuration")
-        
-        with st.expander("Configure API Keys", expanded=True):
-            # LLM Provider selection
-            llm_provider = st.selectbox(
-                "LLM Provider",
-                ["mistral", "openrouter", "ollama"],
-                index=0,
-                help="Select your preferred LLM provider"
-            )
-            
-            # API Key inputs based on provider
-            if llm_provider == "mistral":
-                mistral_api_key = st.text_input(
-                    "Mistral API Key",
-                    type="password",
-                    value=os.getenv('MISTRAL_API_KEY', ''),
-                    help="Enter your Mistral AI API key"
-                )
-                if mistral_api_key and mistral_api_key != os.getenv('MISTRAL_API_KEY'):
-                    if st.button("Save Mistral API Key"):
-                        os.environ['MISTRAL_API_KEY'] = mistral_api_key
-                        st.success("✅ Mistral API Key saved!")
-                        st.rerun()
-                        
-            elif llm_provider == "openrouter":
-                openrouter_api_key = st.text_input(
-                    "OpenRouter API Key",
-                    type="password",
-                    value=os.getenv('OPENROUTER_API_KEY', ''),
-                    help="Enter your OpenRouter API key"
-                )
-                if openrouter_api_key and openrouter_api_key != os.getenv('OPENROUTER_API_KEY'):
-                    if st.button("Save OpenRouter API Key"):
-                        os.environ['OPENROUTER_API_KEY'] = openrouter_api_key
-                        st.success("✅ OpenRouter API Key saved!")
-                        st.rerun()
-                        
-            elif llm_provider == "ollama":
-                ollama_url = st.text_input(
-                    "Ollama API URL",
-                    value=os.getenv('OLLAMA_API_URL', 'http://localhost:11434/api/generate'),
-                    help="Enter your Ollama API URL"
-                )
-                if ollama_url and ollama_url != os.getenv('OLLAMA_API_URL'):
-                    if st.button("Save Ollama URL"):
-                        os.environ['OLLAMA_API_URL'] = ollama_url
-                        st.success("✅ Ollama URL saved!")
-                        st.rerun()
-            
-            # YouTube API Key for enhanced scraper
-            st.divider()
-            st.subheader("🎬 YouTube API Configuration")
-            youtube_api_key = st.text_input(
-                "YouTube Data API Key (Optional)",
-                type="password",
-                value=os.getenv('YOUTUBE_API_KEY', ''),
-                help="Enter your YouTube Data API key for enhanced scraping reliability"
-            )
-            if youtube_api_key and youtube_api_key != os.getenv('YOUTUBE_API_KEY'):
-                if st.button("Save YouTube API Key"):
-                    os.environ['YOUTUBE_API_KEY'] = youtube_api_key
-                    st.success("✅ YouTube API Key saved!")
-                    st.info("🔄 Enhanced YouTube scraper will now use API fallback when needed")
-                    st.rerun()
-            
-            if os.getenv('YOUTUBE_API_KEY'):
-                st.success("✅ YouTube API Key configured")
-                st.caption("Enhanced scraper will use API fallback when Selenium fails")
-            else:
-                st.info("ℹ️ YouTube API Key not configured")
-                st.caption("Scraper will use Selenium-only mode")
-            
-            # Test API connection
-            if st.button("🧪 Test API Connection"):
-                try:
-                    if st.session_state.analyzer_instance and st.session_state.analyzer_instance.llm_processor:
-                        # Test the LLM connection
-                        test_result = st.session_state.analyzer_instance.llm_processor.test_connection()
-                        if test_result:
-                            st.success("✅ API Connection Successful!")
-                        else:
-                            st.error("❌ API Connection Failed")
-                    else:
-                        st.warning("⚠️ LLM Processor not initialized")
-                except Exception as e:
-                    st.error(f"❌ API Test Error: {str(e)}")
+        render_api_configuration()
         
         st.divider()
         
@@ -878,40 +1804,8 @@ def main():
     with tab1:
         st.header("Single Video/Channel Analysis")
         
-        col1, col2 = st.columns([2, 1])
-        
-        with col1:
-            video_url = st.text_input(
-                "Video/Channel URL",
-                placeholder=f"Enter {platform} video, channel, or profile URL...",
-                help="Paste the complete video, channel, or profile URL here. Supports YouTube channels and Instagram profiles."
-            )
-        
-        with col2:
-            analyze_button = st.button("🚀 Analyze Content", type="primary", use_container_width=True)
-        
-        if analyze_button and video_url:
-            with st.spinner(f"Analyzing {platform} content..."):
-                try:
-                    result = st.session_state.analyzer_instance.analyze_video(video_url, platform)
-                    
-                    if result.get('status') == 'success':
-                        st.session_state.analysis_results.append(result)
-                        
-                        # Show appropriate success message based on content type
-                        is_channel_profile = result['scraped_data'].get('is_channel', False)
-                        if is_channel_profile:
-                            st.success(f"✅ {'Channel' if result['platform'] == 'youtube' else 'Profile'} Analysis Complete!")
-                        else:
-                            st.success("✅ Video Analysis Complete!")
-                            
-                        display_analysis_results(result)
-                    else:
-                        st.error(f"Analysis failed: {result.get('error', 'Unknown error')}")
-                        
-                except Exception as e:
-                    st.error(f"Analysis error: {str(e)}")
-                    logger.error(f"Analysis exception: {e}")
+        render_analysis_form(platform, tuple(sorted(analysis_type)))
+        render_latest_result()
     
     with tab2:
         st.header("Batch Video/Channel Analysis")
@@ -924,23 +1818,46 @@ def main():
         
         if st.button("🚀 Analyze Batch", type="primary"):
             if video_urls:
-                urls = [url.strip() for url in video_urls.split('\n') if url.strip()]
-                
-                progress_bar = st.progress(0)
-                results = []
+                # Pasted lists often repeat a URL (or differ only in tracking params); analyze each once
+                urls = list(dict.fromkeys(normalize_url(url) for url in video_urls.split('\n') if url.strip()))
                 
-                for i, url in enumerate(urls):
-                    with st.spinner(f"Analyzing content {i+1} of {len(urls)}..."):
-                        try:
-                            result = st.session_state.analyzer_instance.analyze_video(url)
-                            if result.get('status') == 'success':
-                                results.append(result)
-                            progress_bar.progress((i + 1) / len(urls))
-                        except Exception as e:
-                            logger.error(f"Batch analysis error for {url}: {e}")
-                            continue
+                # One status container for the whole batch; the progress bar only moves when a step completes
+                with st.status(f"Analyzing {len(urls)} items...", expanded=True) as batch_status:
+                    progress_bar = st.progress(0.0)
+                    
+                    def update_progress(done: int, total: int):
+                        progress_bar.progress(done / total, text=f"{done}/{total} steps")
+                    
+                    try:
+                        batch_results = asyncio.run(
+                            st.session_state.analyzer_instance.analyze_videos_batch(
+                                urls, concurrency=BATCH_CONCURRENCY, progress_callback=update_progress
+                            )
+                        )
+                    except Exception as e:
+                        logger.error(f"Batch analysis error: {e}")
+                        batch_results = []
+                    progress_bar.empty()
+                    
+                    outcome_lines = []
+                    for url, result in zip(urls, batch_results):
+                        if result.get('status') == 'success':
+                            outcome_lines.append(f"- ✅ {url}")
+                        else:
+                            error = result.get('error', 'Unknown error')
+                            logger.error(f"Batch analysis error for {url}: {error}")
+                            outcome_lines.append(f"- ❌ {url}: {error}")
+                    # A single write for every URL instead of one frontend update each
+                    if outcome_lines:
+                        st.markdown("\n".join(outcome_lines))
+                    results = [result for result in batch_results if result.get('status') == 'success']
+                    batch_status.update(
+                        label=f"Analyzed {len(results)} of {len(urls)} items",
+                        state="complete" if results else "error",
+                        expanded=False
+                    )
                 
-                st.session_state.analysis_results.extend(results)
+                results_df = record_analysis_results(results)
                 
                 # Count different content types
                 channels_profiles = sum(1 for r in results if r['scraped_data'].get('is_channel', False))
@@ -957,196 +1874,59 @@ def main():
                         platforms = [r['platform'] for r in results]
                         st.write(f"**Platforms:** {', '.join(set(platforms))}")
                         
-                        # Average metrics (separate for channels/profiles vs videos)
-                        if channels_profiles > 0:
-                            channel_results = [r for r in results if r['scraped_data'].get('is_channel', False)]
-                            avg_subscribers = sum(r['scraped_data'].get('likes', 0) for r in channel_results) / len(channel_results)
-                            avg_content_count = sum(r['scraped_data'].get('views', 0) for r in channel_results) / len(channel_results)
-                            
+                        # Average metrics (separate for channels/profiles vs videos) from the batch's columnar rows
+                        averages = results_df.groupby('is_channel')[['views', 'likes']].mean()
+                        
+                        if True in averages.index:
+                            # Channels/profiles store subscribers in likes and content count in views
                             col1, col2 = st.columns(2)
                             with col1:
-                                st.metric("Avg Subscribers/Followers", f"{avg_subscribers:,.0f}")
+                                st.metric("Avg Subscribers/Followers", f"{averages.loc[True, 'likes']:,.0f}")
                             with col2:
-                                st.metric("Avg Content Count", f"{avg_content_count:,.0f}")
+                                st.metric("Avg Content Count", f"{averages.loc[True, 'views']:,.0f}")
                         
-                        if videos > 0:
-                            video_results = [r for r in results if not r['scraped_data'].get('is_channel', False)]
-                            avg_views = sum(r['scraped_data'].get('views', 0) for r in video_results) / len(video_results)
-                            avg_likes = sum(r['scraped_data'].get('likes', 0) for r in video_results) / len(video_results)
-                            
+                        if False in averages.index:
                             col1, col2 = st.columns(2)
                             with col1:
-                                st.metric("Average Views", f"{avg_views:,.0f}")
+                                st.metric("Average Views", f"{averages.loc[False, 'views']:,.0f}")
                             with col2:
-                                st.metric("Average Likes", f"{avg_likes:,.0f}")
+                                st.metric("Average Likes", f"{averages.loc[False, 'likes']:,.0f}")
     
     with tab3:
         st.header("Analysis Dashboard")
         
-        if st.session_state.analysis_results:
-            st.success(f"📊 Total Analyses: {len(st.session_state.analysis_results)}")
+        # Columnar copy of the results, appended to as analyses complete
+        analysis_df = st.session_state.get('analysis_df')
+        
+        if analysis_df is not None and len(analysis_df):
+            st.success(f"📊 Total Analyses: {sum(st.session_state.platform_totals['count'].values())}")
             
-            # Platform distribution
-            platforms = [result['platform'] for result in st.session_state.analysis_results]
-            platform_counts = pd.Series(platforms).value_counts()
+            # Hashable snapshots of the results let the cached builders skip unchanged figures
+            snapshot = dashboard_snapshot(analysis_df)
             
             col1, col2 = st.columns(2)
             
             with col1:
                 st.subheader("Platform Distribution")
-                fig = px.pie(values=platform_counts.values, names=platform_counts.index, 
-                           title="Videos by Platform")
-                st.plotly_chart(fig, use_container_width=True)
+                st.plotly_chart(build_platform_figure(snapshot['platform_counts']), use_container_width=True)
             
             with col2:
                 st.subheader("Engagement Metrics")
-                engagement_data = []
-                for result in st.session_state.analysis_results:
-                    scraped = result['scraped_data']
-                    engagement_data.append({
-                        'Platform': result['platform'],
-                        'Views': scraped.get('views', 0),
-                        'Likes': scraped.get('likes', 0),
-                        'Comments': scraped.get('comments', 0)
-                    })
-                
-                if engagement_data:
-                    df = pd.DataFrame(engagement_data)
-                    fig = px.bar(df, x='Platform', y=['Views', 'Likes', 'Comments'],
-                               title="Average Engagement by Platform", barmode='group')
-                    st.plotly_chart(fig, use_container_width=True)
+                st.plotly_chart(build_engagement_figure(snapshot['engagement_rows']), use_container_width=True)
+            
+            # Engagement history across the analyses kept in this session
+            st.subheader("Engagement Over Time")
+            st.plotly_chart(build_engagement_timeline_figure(snapshot['timeline_rows']), use_container_width=True)
             
             # Recent analyses table
             st.subheader("Recent Analyses")
-            recent_data = []
-            for result in st.session_state.analysis_results[-10:]:  # Last 10 analyses
-                recent_data.append({
-                    'Platform': result['platform'],
-                    'Views': result['scraped_data'].get('views', 0),
-                    'Likes': result['scraped_data'].get('likes', 0),
-                    'Timestamp': result['timestamp']
-                })
-            
-            if recent_data:
-                df = pd.DataFrame(recent_data)
-                st.dataframe(df, use_container_width=True)
+            st.dataframe(st.session_state.recent_df, use_container_width=True)
         
         else:
             st.info("📈 No analysis data available. Start analyzing videos to see dashboard data.")
     
     with tab4:
-        st.header("📊 System Information")
-        
-        # Component Status
-        st.subheader("🔧 Component Status")
-        
-        col1, col2, col3 = st.columns(3)
-        
-        with col1:
-            if st.session_state.analyzer_instance.llm_processor:
-                st.success("✅ LLM Processor: Active")
-            else:
-                st.error("❌ LLM Processor: Inactive")
-                
-            if st.session_state.analyzer_instance.video_analyzer:
-                st.success("✅ Video Analyzer: Active")
-            else:
-                st.error("❌ Video Analyzer: Inactive")
-        
-        with col2:
-            if st.session_state.analyzer_instance.youtube_scraper:
-                st.success("✅ YouTube Scraper: Enhanced (v2.0)")
-                # Show enhanced features
-                st.caption("🔧 Multiple selector fallbacks")
-                st.caption("🔄 API fallback integration")
-                st.caption("📊 Advanced engagement extraction")
-            else:
-                st.error("❌ YouTube Scraper: Inactive")
-                
-            if st.session_state.analyzer_instance.instagram_scraper:
-                st.success("✅ Instagram Scraper: Active")
-            else:
-                st.error("❌ Instagram Scraper: Inactive")
-        
-        with col3:
-            if st.session_state.analyzer_instance.platform_resolver:
-                st.success("✅ Platform Resolver: Active")
-            else:
-                st.error("❌ Platform Resolver: Inactive")
-            
-            # API Connectivity Status
-            api_status = st.session_state.analyzer_instance.check_api_connectivity()
-            if api_status["status"] == "connected":
-                st.success("✅ API Server: Connected")
-            else:
-                st.warning(f"⚠️ API Server: {api_status['message']}")
-        
-        # Environment Variables
-        st.subheader("🌍 Environment Configuration")
-        
-        env_vars = [
-            "MISTRAL_API_KEY",
-            "OPENROUTER_API_KEY",
-            "YOUTUBE_API_KEY",
-            "INSTAGRAM_USERNAME",
-            "INSTAGRAM_PASSWORD",
-            "SERVICE_HOST",
-            "SERVICE_PORT",
-            "LLM_PROVIDER",
-            "DEBUG",
-            "MAX_REELS_DEFAULT",
-            "SCRAPING_TIMEOUT"
-        ]
-        
-        for var in env_vars:
-            value = os.getenv(var, "Not set")
-            if "API_KEY" in var or "PASSWORD" in var:
-                value = "***" if value != "Not set" else "Not set"
-            st.text(f"{var}: {value}")
-        
-        # Instagram Login Status
-        st.subheader("📱 Instagram Login Status")
-        if st.session_state.instagram_logged_in:
-            st.success(f"✅ Logged in as: {st.session_state.get('instagram_username', 'User')}")
-        else:
-            st.info("ℹ️ Not logged in to Instagram")
-        
-        # System Capabilities
-        st.subheader("🎯 System Capabilities")
-        
-        capabilities = [
-            "✅ Single Video Analysis",
-            "✅ Batch Video Analysis", 
-            "✅ Multi-Platform Support (YouTube, Instagram, TikTok)",
-            "✅ Enhanced YouTube Scraper with Multiple Selector Fallbacks",
-            "✅ YouTube API Integration for Reliable Data Extraction",
-            "✅ Advanced Engagement Metrics Extraction",
-            "✅ Channel and Profile Analysis Support",
-            "✅ Local Sentiment Analysis",
-            "✅ LLM-Powered Analysis",
-            "✅ Interactive Dashboard",
-            "✅ System Monitoring",
-            "✅ Instagram Login Integration",
-            "✅ API Server Integration",
-            "✅ Environment Configuration"
-        ]
-        
-        for capability in capabilities:
-            st.write(capability)
-            
-        # Debug Information
-        if os.getenv('DEBUG', 'false').lower() == 'true':
-            st.subheader("🔍 Debug Information")
-            st.json({
-                "session_state_keys": list(st.session_state.keys()),
-                "analyzer_components": {
-                    "llm_processor": str(type(st.session_state.analyzer_instance.llm_processor)) if st.session_state.analyzer_instance.llm_processor else None,
-                    "video_analyzer": str(type(st.session_state.analyzer_instance.video_analyzer)),
-                    "platform_resolver": str(type(st.session_state.analyzer_instance.platform_resolver)),
-                    "youtube_scraper": str(type(st.session_state.analyzer_instance.youtube_scraper)) if st.session_state.analyzer_instance.youtube_scraper else None,
-                    "instagram_scraper": str(type(st.session_state.analyzer_instance.instagram_scraper)) if st.session_state.analyzer_instance.instagram_scraper else None
-                }
-            })
+        render_system_info()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -9,13 +9,30 @@ import time
 import sys
 import os
 import signal
+import select
 import requests
+from requests.adapters import HTTPAdapter
 import webbrowser
 from threading import Thread
+from collections import deque
 import json
+import re
+from importlib import metadata
 from datetime import datetime
 import psutil
 
+# Seconds between status line refreshes; child exits are reported immediately
+STATUS_REFRESH_INTERVAL = 5
+
+# API start-up wait: seconds in total, and the first/maximum delay between health checks
+API_START_TIMEOUT = 30
+API_CHECK_INITIAL_DELAY = 0.05
+API_CHECK_MAX_DELAY = 1.0
+
+# Most recent output lines kept per child; written to <name>.log on shutdown
+LOG_BUFFER_LINES = 1000
+output_buffers = {}
+
 def check_python_version():
     """Check if Python version is compatible"""
     if sys.version_info < (3, 8):
@@ -23,6 +40,10 @@ def check_python_version():
         sys.exit(1)
     print(f"✅ Python {sys.version_info.major}.{sys.version_info.minor} detected")
 
+def _normalize_package_name(name):
+    """PEP 503 normalized distribution name, so 'Flask_Cors' and 'flask-cors' compare equal"""
+    return re.sub(r'[-_.]+', '-', name).lower()
+
 def check_dependencies():
     """Check if all required dependencies are installed"""
     required_packages = [
@@ -31,12 +52,10 @@ def check_dependencies():
         'plotly', 'requests', 'beautifulsoup4', 'psutil'
     ]
     
-    missing_packages = []
-    for package in required_packages:
-        try:
-            __import__(package)
-        except ImportError:
-            missing_packages.append(package)
+    # Read installed distribution names instead of importing (and initializing) every package
+    installed = {_normalize_package_name(dist.metadata['Name'] or '') for dist in metadata.distributions()}
+    missing_packages = [package for package in required_packages
+                        if _normalize_package_name(package) not in installed]
     
     if missing_packages:
         print(f"❌ Missing packages: {', '.join(missing_packages)}")
@@ -45,15 +64,21 @@ def check_dependencies():
     
     print("✅ All dependencies available")
 
-def check_api_server(host='localhost', port=5000):
+def create_http_session():
+    """HTTP session with a single kept-alive connection for the local health checks"""
+    session = requests.Session()
+    session.mount('http://', HTTPAdapter(pool_connections=1, pool_maxsize=1, max_retries=0))
+    return session
+
+def check_api_server(host='localhost', port=5000, session=None):
     """Check if API server is running"""
     try:
-        response = requests.get(f'http://{host}:{port}/health', timeout=2)
+        response = (session or requests).get(f'http://{host}:{port}/health', timeout=2)
         return response.status_code == 200
     except requests.exceptions.RequestException:
         return False
 
-def start_api_server():
+def start_api_server(session=None):
     """Start the Flask API server"""
     print("🚀 Starting API server...")
     
@@ -62,15 +87,25 @@ def start_api_server():
     ], cwd=os.getcwd(),
     stdout=subprocess.PIPE,
     stderr=subprocess.PIPE,
-    text=True
+    text=True,
+    # Own process group, so shutdown also reaches the processes it spawns
+    start_new_session=True
     )
     
-    # Wait for server to start
-    for i in range(30):  # Wait up to 30 seconds
-        if check_api_server():
+    drain_output(api_process, 'api')
+    
+    # Wait for server to start, checking often at first and backing off to once a second
+    session = session or create_http_session()
+    deadline = time.monotonic() + API_START_TIMEOUT
+    delay = API_CHECK_INITIAL_DELAY
+    while time.monotonic() < deadline:
+        if check_api_server(session=session):
             print("✅ API server started successfully")
             return api_process
-        time.sleep(1)
+        if api_process.poll() is not None:
+            break  # The server exited, so it will never answer
+        time.sleep(min(delay, max(0, deadline - time.monotonic())))
+        delay = min(delay * 1.7, API_CHECK_MAX_DELAY)
     
     print("❌ Failed to start API server")
     return None
@@ -87,44 +122,188 @@ def start_streamlit_app():
     ], cwd=os.getcwd(),
     stdout=subprocess.PIPE,
     stderr=subprocess.PIPE,
-    text=True
+    text=True,
+    # Own process group, so shutdown also reaches the processes it spawns
+    start_new_session=True
     )
     
+    drain_output(streamlit_process, 'streamlit')
+    
     # Wait for Streamlit to start
     time.sleep(5)
     print("✅ Streamlit application started")
     return streamlit_process
 
+def drain_output(process, name):
+    """Read a child's stdout and stderr into a bounded buffer
+    
+    Nothing else reads the pipes, and a child blocks on write() once one
+    fills, so each stream gets a daemon reader thread.
+    """
+    buffer = output_buffers[name] = deque(maxlen=LOG_BUFFER_LINES)
+    
+    def read(stream):
+        for line in stream:
+            buffer.append(line)
+    
+    for stream in (process.stdout, process.stderr):
+        Thread(target=read, args=(stream,), daemon=True).start()
+
+def save_output_logs():
+    """Write each child's buffered output to <name>.log"""
+    for name, buffer in output_buffers.items():
+        with open(f'{name}.log', 'w') as f:
+            f.writelines(list(buffer))
+
+class ExitWatcher:
+    """Block until a watched child process exits, without polling it on a timer
+    
+    Uses pidfds on Linux and kqueue NOTE_EXIT on BSD/macOS, so the waiting
+    thread sleeps in the kernel. Falls back to short poll() sleeps elsewhere.
+    Each exit is reported by wait() once.
+    """
+    
+    def __init__(self, processes):
+        self.processes = processes
+        self._poller = None
+        self._kqueue = None
+        self._fds = []
+        # Processes that exited before they could be registered
+        self._exited_early = 0
+        
+        if hasattr(os, 'pidfd_open'):
+            try:
+                self._poller = select.poll()
+                for process in processes:
+                    try:
+                        fd = os.pidfd_open(process.pid)
+                    except ProcessLookupError:
+                        self._exited_early += 1
+                        continue
+                    self._fds.append(fd)
+                    self._poller.register(fd, select.POLLIN)
+                return
+            except OSError:
+                self.close()
+                self._exited_early = 0
+        
+        if hasattr(select, 'kqueue'):
+            self._kqueue = select.kqueue()
+            for process in processes:
+                event = select.kevent(process.pid, filter=select.KQ_FILTER_PROC,
+                                      flags=select.KQ_EV_ADD | select.KQ_EV_ONESHOT,
+                                      fflags=select.KQ_NOTE_EXIT)
+                try:
+                    self._kqueue.control([event], 0, 0)
+                except ProcessLookupError:
+                    self._exited_early += 1
+        else:
+            self._reported = set()
+    
+    def wait(self, timeout=None):
+        """Wait up to timeout seconds (forever if None), returning True if a watched process exited"""
+        if self._exited_early:
+            self._exited_early = 0
+            return True
+        if self._poller is not None:
+            ready = self._poller.poll(None if timeout is None else timeout * 1000)
+            # An exited child's pidfd stays readable, so stop watching it
+            for fd, _ in ready:
+                self._poller.unregister(fd)
+            return bool(ready)
+        if self._kqueue is not None:
+            return bool(self._kqueue.control(None, len(self.processes), timeout))
+        
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while deadline is None or time.monotonic() < deadline:
+            exited = {process.pid for process in self.processes if process.poll() is not None}
+            if exited - self._reported:
+                self._reported |= exited
+                return True
+            time.sleep(2 if deadline is None else min(2, max(0, deadline - time.monotonic())))
+        return False
+    
+    def close(self):
+        """Release the pidfds or kqueue"""
+        for fd in self._fds:
+            os.close(fd)
+        self._fds = []
+        self._poller = None
+        if self._kqueue is not None:
+            self._kqueue.close()
+            self._kqueue = None
+
+def stop_processes(processes, timeout=5):
+    """Terminate processes and their process groups, killing any still running after timeout seconds"""
+    running = [process for process in processes if process is not None and process.poll() is None]
+    for process in running:
+        _signal_group(process, signal.SIGTERM, process.terminate)
+    
+    # Sleep until the children exit instead of Popen.wait(timeout)'s sleep-and-poll loop
+    watcher = ExitWatcher(running)
+    deadline = time.monotonic() + timeout
+    while any(process.poll() is None for process in running):
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
+        watcher.wait(remaining)
+    watcher.close()
+    
+    for process in running:
+        if process.poll() is None:
+            _signal_group(process, signal.SIGKILL, process.kill)
+            process.wait()
+
+def _signal_group(process, sig, fallback):
+    """Signal a child's whole process group where supported, else call fallback()"""
+    if hasattr(os, 'killpg'):
+        try:
+            os.killpg(process.pid, sig)
+            return
+        except OSError:
+            pass
+    fallback()
+
+def _process_handle(process):
+    """psutil handle for a child process, or None if it is already gone"""
+    try:
+        return psutil.Process(process.pid)
+    except psutil.Error:
+        return None
+
+def _memory_mb(process, handle):
+    """Resident memory of a running child in whole MB (0 once it has stopped)"""
+    if handle is None or process.poll() is not None:
+        return 0
+    try:
+        return handle.memory_info().rss >> 20
+    except psutil.Error:
+        return 0
+
 def monitor_processes(api_process, streamlit_process):
     """Monitor running processes"""
     def monitor():
+        watcher = ExitWatcher([api_process, streamlit_process])
+        # Build the psutil handles once; each refresh only reads memory_info()
+        api_handle = _process_handle(api_process)
+        streamlit_handle = _process_handle(streamlit_process)
         while True:
             api_status = "Running" if api_process.poll() is None else "Stopped"
             streamlit_status = "Running" if streamlit_process.poll() is None else "Stopped"
             
             # Get memory usage
-            api_memory = 0
-            streamlit_memory = 0
-            
-            if api_process.poll() is None:
-                try:
-                    api_memory = psutil.Process(api_process.pid).memory_info().rss / 1024 / 1024
-                except:
-                    pass
-            
-            if streamlit_process.poll() is None:
-                try:
-                    streamlit_memory = psutil.Process(streamlit_process.pid).memory_info().rss / 1024 / 1024
-                except:
-                    pass
+            api_memory = _memory_mb(api_process, api_handle)
+            streamlit_memory = _memory_mb(streamlit_process, streamlit_handle)
             
             # Clear line and print status
-            print(f"\r🔄 API: {api_status} ({api_memory:.1f}MB) | Streamlit: {streamlit_status} ({streamlit_memory:.1f}MB)", end='', flush=True)
+            print(f"\r🔄 API: {api_status} ({api_memory}MB) | Streamlit: {streamlit_status} ({streamlit_memory}MB)", end='', flush=True)
             
             if api_process.poll() is not None and streamlit_process.poll() is not None:
                 break
             
-            time.sleep(2)
+            # Sleep until the next refresh, waking early only if a process exits
+            watcher.wait(STATUS_REFRESH_INTERVAL)
+        watcher.close()
     
     monitor_thread = Thread(target=monitor, daemon=True)
     monitor_thread.start()
@@ -155,11 +334,16 @@ def create_system_info():
         ]
     }
     
-    with open('system_info.json', 'w') as f:
-        json.dump(info, f, indent=2)
+    # Nothing at startup reads the file back, so write it without holding up the launch
+    Thread(target=_write_system_info, args=(info,)).start()
     
     return info
 
+def _write_system_info(info):
+    """Write the system information file"""
+    with open('system_info.json', 'w') as f:
+        json.dump(info, f, indent=2)
+
 def signal_handler(signum, frame):
     """Handle shutdown signals"""
     print("\n\n🛑 Shutting down gracefully...")
@@ -219,17 +403,18 @@ def main():
         
         print("\n🔧 Available Commands:")
         print("   Press Ctrl+C to shutdown gracefully")
-        print("   API logs: Check terminal output")
-        print("   Streamlit logs: Check terminal output")
+        print("   API logs: api.log (written on shutdown)")
+        print("   Streamlit logs: streamlit.log (written on shutdown)")
         
-        # Wait for processes
+        # Wait for processes: block until either one exits (or a signal interrupts the wait)
+        watcher = ExitWatcher([api_process, streamlit_process])
         try:
-            while True:
-                time.sleep(1)
-                if api_process.poll() is not None or streamlit_process.poll() is not None:
-                    break
+            while api_process.poll() is None and streamlit_process.poll() is None:
+                watcher.wait()
         except KeyboardInterrupt:
             pass
+        finally:
+            watcher.close()
         
     except Exception as e:
         print(f"\n❌ Error: {e}")
@@ -238,19 +423,8 @@ def main():
         # Cleanup
         print("\n🧹 Cleaning up...")
         
-        if 'api_process' in locals():
-            try:
-                api_process.terminate()
-                api_process.wait(timeout=5)
-            except:
-                api_process.kill()
-        
-        if 'streamlit_process' in locals():
-            try:
-                streamlit_process.terminate()
-                streamlit_process.wait(timeout=5)
-            except:
-                streamlit_process.kill()
+        stop_processes([locals().get('api_process'), locals().get('streamlit_process')])
+        save_output_logs()
         
         print("✅ Cleanup complete")
         print("👋 Thank you for using Video Sentiment Analysis System!")
@@ -7,10 +7,61 @@ for additional platforms.
 """
 
 import re
-from urllib.parse import urlparse
 from typing import Dict, List, Optional
 
 
+# Domains checked (against the host and its parent domains) when no URL pattern matches
+DOMAIN_PLATFORMS = {
+    'youtube.com': 'youtube',
+    'youtu.be': 'youtube',
+    'instagram.com': 'instagram',
+    'instagr.am': 'instagram',
+    'tiktok.com': 'tiktok',
+    'twitter.com': 'twitter',
+    'x.com': 'twitter',
+    'facebook.com': 'facebook',
+    'fb.com': 'facebook',
+    'linkedin.com': 'linkedin',
+    'snapchat.com': 'snapchat',
+    'pinterest.com': 'pinterest',
+    'reddit.com': 'reddit',
+    'twitch.tv': 'twitch',
+    'discord.com': 'discord',
+    'discordapp.com': 'discord',
+    'telegram.org': 'telegram',
+    't.me': 'telegram',
+    'whatsapp.com': 'whatsapp',
+    'wa.me': 'whatsapp',
+    'vimeo.com': 'vimeo',
+    'dailymotion.com': 'dailymotion',
+}
+
+# Host of an absolute URL, without userinfo, port or a leading 'www.'
+_HOST_RE = re.compile(r'[a-z][a-z0-9+.-]*://(?:[^/?#@]*@)?(?:www\.)?([^/?#:]*)', re.IGNORECASE)
+
+# Exact domains that make a detection high confidence
+HIGH_CONFIDENCE_DOMAINS = {
+    'youtube.com': 'youtube',
+    'youtu.be': 'youtube',
+    'instagram.com': 'instagram',
+    'instagr.am': 'instagram',
+    'tiktok.com': 'tiktok',
+    'twitter.com': 'twitter',
+    'x.com': 'twitter',
+    'facebook.com': 'facebook',
+    'linkedin.com': 'linkedin',
+    'snapchat.com': 'snapchat',
+    'pinterest.com': 'pinterest',
+    'reddit.com': 'reddit',
+    'twitch.tv': 'twitch',
+    'discord.com': 'discord',
+    'telegram.org': 'telegram',
+    'whatsapp.com': 'whatsapp',
+    'vimeo.com': 'vimeo',
+    'dailymotion.com': 'dailymotion',
+}
+
+
 class PlatformResolver:
     """
     A class to detect social media platforms from URLs.
@@ -23,6 +74,20 @@ class PlatformResolver:
     def __init__(self):
         """Initialize the PlatformResolver with platform patterns."""
         self.platform_patterns = self._initialize_patterns()
+        self._compile_patterns()
+    
+    def _compile_patterns(self) -> None:
+        """
+        Compile each platform's URL patterns into a single case-insensitive regex.
+        
+        Called whenever platforms are added or removed, so detect_platform does
+        one search per platform instead of compiling and matching every pattern.
+        """
+        self._compiled_patterns = {
+            platform: re.compile('|'.join(f'(?:{pattern})' for pattern in patterns), re.IGNORECASE)
+            for platform, patterns in self.platform_patterns.items()
+            if patterns
+        }
     
     def _initialize_patterns(self) -> Dict[str, List[str]]:
         """
@@ -345,54 +410,22 @@ class PlatformResolver:
             if not url.startswith(('http://', 'https://')):
                 url = 'https://' + url
             
-            # Parse URL to get domain
-            parsed_url = urlparse(url)
-            domain = parsed_url.netloc.lower()
-            
-            # Check if URL is valid
+            # Check if URL has a host
+            domain = _HOST_RE.match(url).group(1).lower()
             if not domain:
                 return 'unknown'
             
-            # Remove 'www.' prefix for cleaner matching
-            domain = domain.replace('www.', '')
-            
             # Check each platform's patterns
-            for platform, patterns in self.platform_patterns.items():
-                for pattern in patterns:
-                    # Create full pattern with domain
-                    full_pattern = pattern.replace('\\.', '.')
-                    if re.search(pattern, url, re.IGNORECASE):
-                        return platform
-            
-            # Additional check for domain-based detection
-            domain_platforms = {
-                'youtube.com': 'youtube',
-                'youtu.be': 'youtube',
-                'instagram.com': 'instagram',
-                'instagr.am': 'instagram',
-                'tiktok.com': 'tiktok',
-                'twitter.com': 'twitter',
-                'x.com': 'twitter',
-                'facebook.com': 'facebook',
-                'fb.com': 'facebook',
-                'linkedin.com': 'linkedin',
-                'snapchat.com': 'snapchat',
-                'pinterest.com': 'pinterest',
-                'reddit.com': 'reddit',
-                'twitch.tv': 'twitch',
-                'discord.com': 'discord',
-                'discordapp.com': 'discord',
-                'telegram.org': 'telegram',
-                't.me': 'telegram',
-                'whatsapp.com': 'whatsapp',
-                'wa.me': 'whatsapp',
-                'vimeo.com': 'vimeo',
-                'dailymotion.com': 'dailymotion',
-            }
+            for platform, pattern in self._compiled_patterns.items():
+                if pattern.search(url):
+                    return platform
             
-            # Check if domain matches any known platform
-            for known_domain, platform in domain_platforms.items():
-                if known_domain in domain:
+            # Additional check for domain-based detection: the host or one of
+            # its parent domains, most specific first (m.youtube.com -> youtube.com)
+            labels = domain.split('.')
+            for i in range(len(labels) - 1):
+                platform = DOMAIN_PLATFORMS.get('.'.join(labels[i:]))
+                if platform:
                     return platform
             
             return 'unknown'
@@ -517,32 +550,12 @@ class PlatformResolver:
     def _determine_confidence(self, platform: str, url: str) -> str:
         """Determine the confidence level of the platform detection."""
         try:
-            parsed_url = urlparse(url)
-            domain = parsed_url.netloc.lower().replace('www.', '')
+            match = _HOST_RE.match(url)
+            domain = match.group(1).lower() if match else ''
             
             # High confidence if domain exactly matches known platform
-            domain_platforms = {
-                'youtube.com': 'youtube',
-                'youtu.be': 'youtube',
-                'instagram.com': 'instagram',
-                'instagr.am': 'instagram',
-                'tiktok.com': 'tiktok',
-                'twitter.com': 'twitter',
-                'x.com': 'twitter',
-                'facebook.com': 'facebook',
-                'linkedin.com': 'linkedin',
-                'snapchat.com': 'snapchat',
-                'pinterest.com': 'pinterest',
-                'reddit.com': 'reddit',
-                'twitch.tv': 'twitch',
-                'discord.com': 'discord',
-                'telegram.org': 'telegram',
-                'whatsapp.com': 'whatsapp',
-                'vimeo.com': 'vimeo',
-                'dailymotion.com': 'dailymotion',
-            }
             
-            if domain in domain_platforms and domain_platforms[domain] == platform:
+            if HIGH_CONFIDENCE_DOMAINS.get(domain) == platform:
                 return 'high'
             else:
                 return 'medium'
@@ -559,6 +572,7 @@ class PlatformResolver:
             patterns (List[str]): List of regex patterns for the platform
         """
         self.platform_patterns[platform_name.lower()] = patterns
+        self._compile_patterns()
     
     def remove_platform(self, platform_name: str) -> None:
         """
@@ -569,6 +583,7 @@ class PlatformResolver:
         """
         if platform_name.lower() in self.platform_patterns:
             del self.platform_patterns[platform_name.lower()]
+            self._compile_patterns()
     
     def list_platforms(self) -> List[str]:
         """
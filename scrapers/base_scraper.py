@@ -6,9 +6,26 @@ from abc import ABC, abstractmethod
 from typing import Dict, List, Any, Optional
 import time
 import random
+import re
 from datetime import datetime
 
 
+# Compiled once at import rather than looked up in re's cache on every call
+_NUMBER_RE = re.compile(r'\d+(?:\.\d+)?')
+_HASHTAG_RE = re.compile(r'#\w+')
+_MENTION_RE = re.compile(r'@\w+')
+
+# Count suffixes such as "1.2k" or "3M"
+_COUNT_MULTIPLIERS = {
+    'k': 1000,
+    'm': 1000000,
+    'b': 1000000000
+}
+
+# Zero-width characters that clean_text removes
+_ZERO_WIDTH_TABLE = dict.fromkeys(map(ord, '\u200b\u200c\u200d'))
+
+
 class BaseScraper(ABC):
     """
     Abstract base class for social media scrapers
@@ -100,13 +117,7 @@ class BaseScraper(ABC):
             return int(float(count_text.replace(',', '')))
         
         # Handle K, M, B suffixes
-        multipliers = {
-            'k': 1000,
-            'm': 1000000,
-            'b': 1000000000
-        }
-        
-        for suffix, multiplier in multipliers.items():
+        for suffix, multiplier in _COUNT_MULTIPLIERS.items():
             if count_text.endswith(suffix):
                 number_part = count_text[:-1].replace(',', '')
                 try:
@@ -115,8 +126,7 @@ class BaseScraper(ABC):
                     return 0
         
         # Try to extract number from text
-        import re
-        numbers = re.findall(r'\d+(?:\.\d+)?', count_text)
+        numbers = _NUMBER_RE.findall(count_text)
         if numbers:
             try:
                 return int(float(numbers[0]))
@@ -135,8 +145,7 @@ class BaseScraper(ABC):
         Returns:
             List of hashtags
         """
-        import re
-        hashtags = re.findall(r'#\w+', text)
+        hashtags = _HASHTAG_RE.findall(text)
         return [tag.lower() for tag in hashtags]
     
     def extract_mentions(self, text: str) -> List[str]:
@@ -149,8 +158,7 @@ class BaseScraper(ABC):
         Returns:
             List of mentions
         """
-        import re
-        mentions = re.findall(r'@\w+', text)
+        mentions = _MENTION_RE.findall(text)
         return [mention.lower() for mention in mentions]
     
     def clean_text(self, text: str) -> str:
@@ -169,10 +177,8 @@ class BaseScraper(ABC):
         # Remove extra whitespace
         text = ' '.join(text.split())
         
-        # Remove special characters that might cause issues
-        text = text.replace('\u200b', '')  # Zero-width space
-        text = text.replace('\u200c', '')  # Zero-width non-joiner
-        text = text.replace('\u200d', '')  # Zero-width joiner
+        # Remove zero-width space, non-joiner and joiner in one pass
+        text = text.translate(_ZERO_WIDTH_TABLE)
         
         return text.strip()
     
@@ -22,9 +22,9 @@ class InstagramSeleniumScraper(SeleniumScraper):
     Instagram-specific Selenium scraper
     """
     
-    def __init__(self):
-        """Initialize Instagram scraper"""
-        super().__init__("instagram", rate_limit_delay=2.0)
+    def __init__(self, driver_pool=None):
+        """Initialize Instagram scraper (optionally leasing its driver from a WebDriverPool)"""
+        super().__init__("instagram", rate_limit_delay=2.0, driver_pool=driver_pool)
         self.base_url = "https://www.instagram.com"
         self.is_logged_in = False
         
@@ -13,6 +13,8 @@ from bs4 import BeautifulSoup
 import time
 import random
 import logging
+import threading
+from contextlib import contextmanager
 from typing import Dict, List, Any, Optional
 import json
 import re
@@ -23,23 +25,165 @@ from scrapers.base_scraper import BaseScraper
 logger = logging.getLogger(__name__)
 
 
+def create_chrome_driver(headless: bool = True, user_agent: str = None) -> webdriver.Chrome:
+    """
+    Start a Chrome WebDriver with optimal settings
+    
+    Args:
+        headless: Run in headless mode
+        user_agent: Custom user agent
+        
+    Returns:
+        Started WebDriver
+    """
+    chrome_options = Options()
+    
+    if headless:
+        chrome_options.add_argument('--headless')
+    
+    # Essential arguments for stability
+    chrome_options.add_argument('--no-sandbox')
+    chrome_options.add_argument('--disable-dev-shm-usage')
+    chrome_options.add_argument('--disable-blink-features=AutomationControlled')
+    chrome_options.add_argument('--disable-extensions')
+    chrome_options.add_argument('--disable-plugins')
+    chrome_options.add_argument('--disable-images')  # Speed up loading
+    chrome_options.add_argument('--disable-javascript')  # Optional, can be enabled per platform
+    
+    # Window size for consistent rendering
+    chrome_options.add_argument('--window-size=1920,1080')
+    
+    # User agent
+    if user_agent:
+        chrome_options.add_argument(f'user-agent={user_agent}')
+    else:
+        # Default user agent that looks like a real browser
+        chrome_options.add_argument('user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
+    
+    # Exclude automation switches
+    chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
+    chrome_options.add_experimental_option('useAutomationExtension', False)
+    
+    # Preferences to reduce detection
+    prefs = {
+        "profile.managed_default_content_settings.images": 2,  # Block images for speed
+        "profile.default_content_setting_values.notifications": 2,  # Block notifications
+        "profile.managed_default_content_settings.stylesheets": 2,  # Block CSS for speed (optional)
+    }
+    chrome_options.add_experimental_option("prefs", prefs)
+    
+    driver = webdriver.Chrome(options=chrome_options)
+    
+    # Execute script to remove webdriver property
+    driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+    return driver
+
+
+class WebDriverPool:
+    """
+    Pool of started Chrome WebDrivers shared between scraper instances
+    
+    Starting Chrome takes 1-3s, so scrapers lease an idle driver instead of
+    launching a new one and hand it back (cookies cleared) when they close.
+    Pooled drivers use the pool's headless/user agent settings.
+    """
+    
+    def __init__(self, max_size: int = 2, headless: bool = True, user_agent: str = None):
+        """
+        Initialize the pool
+        
+        Args:
+            max_size: Maximum number of idle drivers kept alive
+            headless: Run pooled drivers in headless mode
+            user_agent: Custom user agent for pooled drivers
+        """
+        self.max_size = max_size
+        self.headless = headless
+        self.user_agent = user_agent
+        self._idle = []
+        self._lock = threading.Lock()
+    
+    def acquire(self) -> webdriver.Chrome:
+        """Take an idle driver, starting a new one if none is available"""
+        with self._lock:
+            while self._idle:
+                driver = self._idle.pop()
+                if self._is_alive(driver):
+                    return driver
+                self._quit(driver)
+        return create_chrome_driver(self.headless, self.user_agent)
+    
+    def release(self, driver: webdriver.Chrome) -> None:
+        """Reset a driver and return it to the pool (or quit it if the pool is full)"""
+        try:
+            driver.delete_all_cookies()
+            driver.get('about:blank')
+        except WebDriverException:
+            self._quit(driver)
+            return
+        
+        with self._lock:
+            if len(self._idle) < self.max_size:
+                self._idle.append(driver)
+                return
+        self._quit(driver)
+    
+    @contextmanager
+    def lease(self):
+        """Context manager that acquires a driver and releases it on exit"""
+        driver = self.acquire()
+        try:
+            yield driver
+        finally:
+            self.release(driver)
+    
+    def close_all(self) -> None:
+        """Quit every idle driver"""
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for driver in idle:
+            self._quit(driver)
+    
+    @staticmethod
+    def _is_alive(driver: webdriver.Chrome) -> bool:
+        """Check that the browser session still responds"""
+        try:
+            driver.current_url
+            return True
+        except WebDriverException:
+            return False
+    
+    @staticmethod
+    def _quit(driver: webdriver.Chrome) -> None:
+        """Quit a driver, ignoring errors from dead sessions"""
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+
 class SeleniumScraper(BaseScraper):
     """
     Enhanced scraper using Selenium WebDriver and BeautifulSoup
     """
     
-    def __init__(self, platform_name: str, rate_limit_delay: float = 1.0):
+    def __init__(self, platform_name: str, rate_limit_delay: float = 1.0,
+                 driver_pool: Optional[WebDriverPool] = None):
         """
         Initialize Selenium scraper
         
         Args:
             platform_name: Name of the platform
             rate_limit_delay: Delay between requests
+            driver_pool: Optional pool to lease the WebDriver from instead of starting one
         """
         super().__init__(platform_name, rate_limit_delay)
+        self.driver_pool = driver_pool
         self.driver = None
         self.wait = None
         self.session_data = {}
+        # A WebDriver is not thread-safe; callers sharing a scraper across threads hold this
+        self.driver_lock = threading.Lock()
         
     def setup_driver(self, headless: bool = True, user_agent: str = None) -> bool:
         """
@@ -53,48 +197,12 @@ class SeleniumScraper(BaseScraper):
             True if setup successful
         """
         try:
-            chrome_options = Options()
-            
-            if headless:
-                chrome_options.add_argument('--headless')
-            
-            # Essential arguments for stability
-            chrome_options.add_argument('--no-sandbox')
-            chrome_options.add_argument('--disable-dev-shm-usage')
-            chrome_options.add_argument('--disable-blink-features=AutomationControlled')
-            chrome_options.add_argument('--disable-extensions')
-            chrome_options.add_argument('--disable-plugins')
-            chrome_options.add_argument('--disable-images')  # Speed up loading
-            chrome_options.add_argument('--disable-javascript')  # Optional, can be enabled per platform
-            
-            # Window size for consistent rendering
-            chrome_options.add_argument('--window-size=1920,1080')
-            
-            # User agent
-            if user_agent:
-                chrome_options.add_argument(f'user-agent={user_agent}')
+            if self.driver_pool is not None:
+                self.driver = self.driver_pool.acquire()
             else:
-                # Default user agent that looks like a real browser
-                chrome_options.add_argument('user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
-            
-            # Exclude automation switches
-            chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
-            chrome_options.add_experimental_option('useAutomationExtension', False)
-            
-            # Preferences to reduce detection
-            prefs = {
-                "profile.managed_default_content_settings.images": 2,  # Block images for speed
-                "profile.default_content_setting_values.notifications": 2,  # Block notifications
-                "profile.managed_default_content_settings.stylesheets": 2,  # Block CSS for speed (optional)
-            }
-            chrome_options.add_experimental_option("prefs", prefs)
-            
-            self.driver = webdriver.Chrome(options=chrome_options)
+                self.driver = create_chrome_driver(headless, user_agent)
             self.wait = WebDriverWait(self.driver, 10)
             
-            # Execute script to remove webdriver property
-            self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-            
             logger.info(f"WebDriver initialized successfully for {self.platform_name}")
             return True
             
@@ -498,7 +606,10 @@ class SeleniumScraper(BaseScraper):
         """Close the WebDriver and cleanup"""
         if self.driver:
             try:
-                self.driver.quit()
+                if self.driver_pool is not None:
+                    self.driver_pool.release(self.driver)
+                else:
+                    self.driver.quit()
                 self.driver = None
                 self.wait = None
                 logger.info("WebDriver closed successfully")
@@ -7,6 +7,7 @@ import random
 import logging
 import re
 import json
+import requests
 from typing import Dict, List, Any, Optional
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
@@ -18,6 +19,21 @@ from scrapers.selenium_scraper import SeleniumScraper
 
 logger = logging.getLogger(__name__)
 
+# Embedded JSON blobs on a YouTube watch page, used by the HTTP scraping path
+PLAYER_RESPONSE_PATTERN = re.compile(r'ytInitialPlayerResponse\s*=\s*(\{.+?\})\s*;\s*(?:var\s|</script>)', re.DOTALL)
+LIKE_COUNT_PATTERN = re.compile(r'"likeCountIfIndifferentNumber"\s*:\s*"(\d+)"')
+COMMENT_COUNT_PATTERN = re.compile(r'"commentCount"\s*:\s*\{\s*"simpleText"\s*:\s*"([^"]+)"')
+
+# Common social media profile links in channel descriptions
+SOCIAL_LINK_PATTERNS = [re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'instagram\.com/[^\s]+',
+    r'twitter\.com/[^\s]+',
+    r'tiktok\.com/[^\s]+',
+    r'facebook\.com/[^\s]+',
+    r'linkedin\.com/[^\s]+',
+    r't\.me/[^\s]+'  # Telegram
+)]
+
 # YouTube API fallback (optional)
 try:
     from googleapiclient.discovery import build
@@ -33,9 +49,14 @@ class YouTubeSeleniumScraper(SeleniumScraper):
     YouTube-specific Selenium scraper
     """
     
-    def __init__(self):
-        """Initialize YouTube scraper"""
-        super().__init__("youtube", rate_limit_delay=1.5)
+    def __init__(self, driver_pool=None, api_key: Optional[str] = None):
+        """Initialize YouTube scraper (optionally leasing its driver from a WebDriverPool)
+        
+        api_key is the YouTube Data API key for the API fallback; YOUTUBE_API_KEY
+        from the environment is used when it is not given.
+        """
+        super().__init__("youtube", rate_limit_delay=1.5, driver_pool=driver_pool)
+        self.api_key = api_key
         self.base_url = "https://www.youtube.com"
         # Initialize driver on first use
         self._driver_initialized = False
@@ -963,29 +984,18 @@ class YouTubeSeleniumScraper(SeleniumScraper):
         Returns:
             List of social media URLs
         """
-        import re
-        
-        # Common social media patterns
-        social_patterns = [
-            r'instagram\.com/[^\s]+',
-            r'twitter\.com/[^\s]+',
-            r'tiktok\.com/[^\s]+',
-            r'facebook\.com/[^\s]+',
-            r'linkedin\.com/[^\s]+',
-            r't\.me/[^\s]+'  # Telegram
-        ]
-        
         social_links = []
-        for pattern in social_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
+        for pattern in SOCIAL_LINK_PATTERNS:
+            matches = pattern.findall(text)
             social_links.extend(matches)
         
         return social_links
 
     def close(self):
-        """Close the WebDriver"""
+        """Close the WebDriver (or return it to the pool)"""
         if hasattr(self, 'driver') and self.driver:
-            self.driver.quit()
+            self.close_driver()
+            self._driver_initialized = False
 
     def _create_fallback_video_data(self, video_url: str, error_message: str) -> Dict[str, Any]:
         """
@@ -1036,13 +1046,13 @@ class YouTubeSeleniumScraper(SeleniumScraper):
     
     def _get_youtube_api_key(self) -> Optional[str]:
         """
-        Get YouTube API key from environment variables
+        Get YouTube API key given to the scraper, or from environment variables
         
         Returns:
             API key or None
         """
         import os
-        return os.getenv('YOUTUBE_API_KEY')
+        return self.api_key or os.getenv('YOUTUBE_API_KEY')
     
     def _scrape_with_api_fallback(self, video_id: str) -> Optional[Dict[str, Any]]:
         """
@@ -1158,6 +1168,103 @@ class YouTubeSeleniumScraper(SeleniumScraper):
             logger.warning(f"Error parsing duration {duration}: {str(e)}")
             return duration
     
+    def _scrape_with_watch_page(self, video_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Scrape video details from the watch page HTML without a browser
+        
+        Args:
+            video_id: YouTube video ID
+            
+        Returns:
+            Video data or None
+        """
+        try:
+            if not hasattr(self, 'http_session'):
+                self.http_session = requests.Session()
+                self.http_session.headers.update({
+                    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+                    'Accept-Language': 'en-US,en;q=0.9'
+                })
+            
+            response = self.http_session.get(f"{self.base_url}/watch?v={video_id}", timeout=10)
+            if response.status_code == 429:
+                logger.warning("YouTube rate limited the HTTP request")
+                return None
+            response.raise_for_status()
+            
+            match = PLAYER_RESPONSE_PATTERN.search(response.text)
+            if not match:
+                logger.warning(f"No player response found for video: {video_id}")
+                return None
+            
+            player_response = json.loads(match.group(1))
+            details = player_response.get('videoDetails', {})
+            if not details.get('title'):
+                return None
+            microformat = player_response.get('microformat', {}).get('playerMicroformatRenderer', {})
+            
+            # Likes and comment counts live in ytInitialData; best effort only
+            like_match = LIKE_COUNT_PATTERN.search(response.text)
+            comment_match = COMMENT_COUNT_PATTERN.search(response.text)
+            views = int(details.get('viewCount', 0) or 0)
+            likes = int(like_match.group(1)) if like_match else 0
+            comments = self.parse_count(comment_match.group(1)) if comment_match else 0
+            length = int(details.get('lengthSeconds', 0) or 0)
+            description = details.get('shortDescription', '')
+            
+            return {
+                'platform': 'youtube',
+                'video_id': video_id,
+                'title': details.get('title', ''),
+                'description': description,
+                'channel': details.get('author', ''),
+                'channel_url': f"https://www.youtube.com/channel/{details.get('channelId', '')}",
+                'views': views,
+                'likes': likes,
+                'comments': comments,
+                'duration': f"{length // 3600}:{length % 3600 // 60:02d}:{length % 60:02d}" if length >= 3600 else f"{length // 60}:{length % 60:02d}",
+                'published_at': microformat.get('publishDate', ''),
+                'url': f"https://www.youtube.com/watch?v={video_id}",
+                'scraped_at': time.strftime('%Y-%m-%d %H:%M:%S'),
+                'hashtags': self.extract_hashtags(description),
+                'mentions': self.extract_mentions(description),
+                'engagement_metrics': {
+                    'views': views,
+                    'likes': likes,
+                    'comments': comments,
+                    'shares': 0
+                }
+            }
+            
+        except Exception as e:
+            logger.warning(f"HTTP scraping failed for video {video_id}: {str(e)}")
+            return None
+    
+    def scrape_video_details_http_first(self, video_url: str) -> Optional[Dict[str, Any]]:
+        """
+        Scrape video details over plain HTTP, starting a browser only if that fails
+        
+        Tries the YouTube Data API (when YOUTUBE_API_KEY is set), then the
+        watch page HTML, and finally Selenium with API fallback.
+        
+        Args:
+            video_url: YouTube video URL
+            
+        Returns:
+            Video data or None
+        """
+        video_id = self._extract_video_id_from_url(video_url)
+        if video_id:
+            video_data = self._scrape_with_api_fallback(video_id) if self._get_youtube_api_key() else None
+            if not video_data:
+                video_data = self._scrape_with_watch_page(video_id)
+            if video_data:
+                return video_data
+        
+        logger.info("HTTP scraping failed, falling back to Selenium...")
+        with self.driver_lock:
+            return self.scrape_video_details_with_fallback(video_url)
+    
     def scrape_video_details_with_fallback(self, video_url: str) -> Optional[Dict[str, Any]]:
         """
         Scrape video details with API fallback
@@ -53,7 +53,8 @@ def test_analyzer_initialization():
         analyzer = IntegratedVideoAnalyzer()
         print("✅ IntegratedVideoAnalyzer initialized successfully")
         
-        # Check components
+        # Check components (the YouTube scraper is created on first use)
+        analyzer._get_youtube_scraper()
         if analyzer.youtube_scraper:
             print("✅ YouTube scraper component initialized")
         else:
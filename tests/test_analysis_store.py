@@ -0,0 +1,84 @@
+"""
+Unit tests for the persistent analysis store.
+"""
+
+import os
+import shutil
+import tempfile
+import time
+import unittest
+import sys
+
+# Add the parent directory to the path to import the utils package
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.analysis_store import AnalysisStore
+
+
+def _result(url, views=0):
+    return {
+        "url": url,
+        "platform": "youtube",
+        "scraped_data": {"views": views},
+        "status": "success",
+    }
+
+
+class TestAnalysisStore(unittest.TestCase):
+    """Test cases for the AnalysisStore class."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmpdir, "analyses.db")
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+    def test_results_persist_across_instances(self):
+        """A new store on the same file loads earlier results in insertion order."""
+        AnalysisStore(self.path).save_many([_result("a"), _result("b")])
+        self.assertEqual(
+            [r["url"] for r in AnalysisStore(self.path).load()], ["a", "b"]
+        )
+
+    def test_same_url_is_replaced(self):
+        """Saving a URL again keeps only the latest result."""
+        store = AnalysisStore(self.path)
+        store.save_many([_result("a", views=1)])
+        store.save_many([_result("a", views=2)])
+        self.assertEqual(store.count(), 1)
+        self.assertEqual(store.get("a")["scraped_data"]["views"], 2)
+
+    def test_load_limit_keeps_newest(self):
+        """load(limit) returns only the newest results, still oldest first."""
+        store = AnalysisStore(self.path)
+        store.save_many([_result("a"), _result("b")])
+        store.save_many([_result("c")])
+        self.assertEqual([r["url"] for r in store.load(limit=2)], ["b", "c"])
+
+    def test_get_matches_provider(self):
+        """Results are only reused for the provider that produced them."""
+        store = AnalysisStore(self.path)
+        store.save_many([_result("a")], provider="mistral")
+        self.assertIsNotNone(store.get("a", "mistral"))
+        self.assertIsNone(store.get("a", "ollama"))
+
+    def test_expired_results_are_dropped(self):
+        """Results past the TTL are neither returned nor kept."""
+        store = AnalysisStore(self.path, ttl=0)
+        store.save_many([_result("a")])
+        time.sleep(0.01)
+        self.assertIsNone(store.get("a"))
+        self.assertEqual(store.load(), [])
+        self.assertEqual(store.count(), 0)
+
+    def test_clear(self):
+        """clear removes every stored result."""
+        store = AnalysisStore(self.path)
+        store.save_many([_result("a"), _result("b")])
+        self.assertEqual(store.clear(), 2)
+        self.assertEqual(store.load(), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,76 @@
+"""
+Unit tests for the LLM response cache.
+"""
+
+import os
+import shutil
+import tempfile
+import time
+import unittest
+import sys
+
+# Add the parent directory to the path to import the api package
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from api.llm_cache import LLMResponseCache
+
+
+class TestLLMResponseCache(unittest.TestCase):
+    """Test cases for the LLMResponseCache class."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmpdir, "cache.db")
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+    def test_key_depends_on_all_params(self):
+        """Changing any sampling parameter changes the key."""
+        key = LLMResponseCache.make_key("mistral", "m", "prompt", 0.0, 100)
+        self.assertEqual(
+            key, LLMResponseCache.make_key("mistral", "m", "prompt", 0.0, 100)
+        )
+        self.assertNotEqual(
+            key, LLMResponseCache.make_key("ollama", "m", "prompt", 0.0, 100)
+        )
+        self.assertNotEqual(
+            key, LLMResponseCache.make_key("mistral", "m", "prompt", 0.7, 100)
+        )
+        self.assertNotEqual(
+            key, LLMResponseCache.make_key("mistral", "m", "prompt", 0.0, 200)
+        )
+
+    def test_hit_and_miss_counters(self):
+        """get counts misses until a response is stored, then hits."""
+        cache = LLMResponseCache(self.path)
+        self.assertIsNone(cache.get("k"))
+        cache.set("k", "response")
+        self.assertEqual(cache.get("k"), "response")
+        stats = cache.stats()
+        self.assertEqual((stats["hits"], stats["misses"], stats["entries"]), (1, 1, 1))
+
+    def test_persists_across_instances(self):
+        """A new cache on the same file sees earlier responses."""
+        LLMResponseCache(self.path).set("k", "response")
+        self.assertEqual(LLMResponseCache(self.path).get("k"), "response")
+
+    def test_expired_entries_are_misses(self):
+        """Entries past their TTL are not returned and can be purged."""
+        cache = LLMResponseCache(self.path, ttl=0)
+        cache.set("k", "response")
+        time.sleep(0.01)
+        self.assertIsNone(cache.get("k"))
+        self.assertEqual(cache.purge_expired(), 1)
+
+    def test_memory_tier_is_bounded(self):
+        """The in-memory tier evicts least recently used entries."""
+        cache = LLMResponseCache(self.path, memory_size=2)
+        for key in ("a", "b", "c"):
+            cache.set(key, key)
+        self.assertEqual(list(cache._memory), ["b", "c"])
+        self.assertEqual(cache.get("a"), "a")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -216,7 +216,21 @@ class TestPlatformResolver(unittest.TestCase):
             with self.subTest(url=url):
                 result = self.resolver.detect_platform(url)
                 self.assertEqual(result, 'unknown', f"Should return 'unknown' for URL: {url}")
-    
+
+    def test_domain_fallback_matches_whole_labels(self):
+        """Test domain fallback matches parent domains, not host substrings."""
+        test_cases = [
+            ("https://netflix.com/title/123", "unknown"),
+            ("https://notyoutube.com/about", "unknown"),
+            ("https://M.YouTube.com/about", "youtube"),
+            ("https://user@www.twitch.tv:443/directory", "twitch"),
+        ]
+
+        for url, expected_platform in test_cases:
+            with self.subTest(url=url):
+                result = self.resolver.detect_platform(url)
+                self.assertEqual(result, expected_platform, f"Wrong platform for URL: {url}")
+
     def test_url_type_detection(self):
         """Test URL type detection for different platforms."""
         test_cases = [
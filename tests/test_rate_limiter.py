@@ -0,0 +1,72 @@
+"""
+Unit tests for the token bucket rate limiter.
+"""
+
+import asyncio
+import time
+import unittest
+import sys
+import os
+
+# Add the parent directory to the path to import the utils package
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.rate_limiter import RateLimiter
+
+
+class TestRateLimiter(unittest.TestCase):
+    """Test cases for the RateLimiter class."""
+
+    def test_burst_is_not_delayed(self):
+        """Requests within the burst size are granted immediately."""
+        limiter = RateLimiter(rate=1, burst=3)
+        delays = [limiter._reserve() for _ in range(3)]
+        self.assertEqual(delays, [0.0, 0.0, 0.0])
+
+    def test_requests_beyond_burst_are_spaced(self):
+        """Each request past the burst waits one more refill interval."""
+        limiter = RateLimiter(rate=10, burst=1)
+        self.assertEqual(limiter._reserve(), 0.0)
+        self.assertAlmostEqual(limiter._reserve(), 0.1, places=2)
+        self.assertAlmostEqual(limiter._reserve(), 0.2, places=2)
+
+    def test_per_minute(self):
+        """per_minute converts a per-minute budget to a per-second rate."""
+        limiter = RateLimiter.per_minute(120, burst=2)
+        self.assertEqual(limiter.rate, 2.0)
+        self.assertEqual(limiter.burst, 2)
+
+    def test_invalid_rate(self):
+        """A non-positive rate is rejected."""
+        with self.assertRaises(ValueError):
+            RateLimiter(rate=0)
+
+    def test_acquire_waits(self):
+        """acquire sleeps for the reserved delay."""
+        limiter = RateLimiter(rate=20, burst=1)
+
+        async def acquire_three():
+            for _ in range(3):
+                await limiter.acquire()
+
+        start = time.monotonic()
+        asyncio.run(acquire_three())
+        self.assertGreaterEqual(time.monotonic() - start, 0.09)
+
+    def test_weighted_reservation(self):
+        """A request costing several tokens waits for all of them to refill."""
+        limiter = RateLimiter(rate=100, burst=10)
+        self.assertEqual(limiter._reserve(10), 0.0)
+        self.assertAlmostEqual(limiter._reserve(5), 0.05, places=2)
+
+    def test_wait_blocks(self):
+        """wait sleeps the calling thread for the reserved delay."""
+        limiter = RateLimiter(rate=20, burst=1)
+        start = time.monotonic()
+        for _ in range(3):
+            limiter.wait()
+        self.assertGreaterEqual(time.monotonic() - start, 0.09)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,97 @@
+"""
+SQLite store of completed analyses so they survive across app sessions
+"""
+
+import json
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+from utils.sqlite import open_sqlite
+
+try:
+    import orjson
+
+    def _encode_result(result: Dict[str, Any]) -> str:
+        return orjson.dumps(result, default=str, option=orjson.OPT_NON_STR_KEYS).decode('utf-8')
+
+    _decode_result = orjson.loads
+except ImportError:
+    # One encoder for every row; json.dumps(default=...) would build a new one per call
+    _encode_result = json.JSONEncoder(default=str).encode
+    _decode_result = json.loads
+
+
+class AnalysisStore:
+    """
+    Completed analysis results keyed by URL
+
+    Each row holds the JSON-encoded result and the LLM provider that produced
+    it. Rows older than `ttl` seconds are ignored and removed on load. The
+    SQLite connection is shared across threads and guarded by a lock.
+    """
+
+    def __init__(self, path: str, ttl: int = 7 * 86400):
+        """
+        Initialize the store
+
+        Args:
+            path: SQLite database file
+            ttl: Seconds a stored analysis stays valid
+        """
+        self.path = path
+        self.ttl = ttl
+        self._lock = threading.Lock()
+
+        self._conn = open_sqlite(path)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS analyses "
+            "(url TEXT PRIMARY KEY, provider TEXT NOT NULL, result TEXT NOT NULL, analyzed_at REAL NOT NULL)"
+        )
+        # load() orders by and expires on analyzed_at
+        self._conn.execute("CREATE INDEX IF NOT EXISTS ix_analyses_analyzed_at ON analyses (analyzed_at)")
+        self._conn.commit()
+
+    def save_many(self, results: List[Dict[str, Any]], provider: str = ''):
+        """Insert or replace the given results in one transaction"""
+        now = time.time()
+        rows = [(result['url'], provider, _encode_result(result), now) for result in results]
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO analyses (url, provider, result, analyzed_at) VALUES (?, ?, ?, ?)",
+                rows
+            )
+            self._conn.commit()
+
+    def get(self, url: str, provider: str = '') -> Optional[Dict[str, Any]]:
+        """Return the stored result for url from the same provider, or None"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT result FROM analyses WHERE url = ? AND provider = ? AND analyzed_at > ?",
+                (url, provider, time.time() - self.ttl)
+            ).fetchone()
+        return _decode_result(row[0]) if row else None
+
+    def load(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Drop expired rows and return the newest `limit` of the rest (all by default), oldest first"""
+        with self._lock:
+            self._conn.execute("DELETE FROM analyses WHERE analyzed_at <= ?", (time.time() - self.ttl,))
+            self._conn.commit()
+            # SQLite treats a negative LIMIT as no limit
+            rows = self._conn.execute(
+                "SELECT result FROM analyses ORDER BY analyzed_at DESC, rowid DESC LIMIT ?",
+                (-1 if limit is None else limit,)
+            ).fetchall()
+        return [_decode_result(row[0]) for row in reversed(rows)]
+
+    def clear(self) -> int:
+        """Delete every stored analysis, returning how many were removed"""
+        with self._lock:
+            cursor = self._conn.execute("DELETE FROM analyses")
+            self._conn.commit()
+            return cursor.rowcount
+
+    def count(self) -> int:
+        """Number of stored analyses"""
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM analyses").fetchone()[0]
@@ -0,0 +1,62 @@
+"""
+Circuit breaker for failing fast while an LLM/API backend is down
+"""
+
+import threading
+import time
+
+
+class CircuitBreaker:
+    """
+    Closed/open/half-open circuit breaker
+
+    After `failure_threshold` consecutive failures the circuit opens and
+    allow() refuses calls for `recovery_timeout` seconds. The first call
+    after that is let through as a probe (half-open): success closes the
+    circuit again, failure reopens it for another window. State is guarded
+    by a thread lock so one breaker can be shared across worker threads.
+    """
+
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+    def __init__(self, failure_threshold: int = 5, recovery_timeout: float = 60.0):
+        """
+        Initialize the circuit breaker
+
+        Args:
+            failure_threshold: Consecutive failures that open the circuit
+            recovery_timeout: Seconds to refuse calls before probing again
+        """
+        self.failure_threshold = max(1, failure_threshold)
+        self.recovery_timeout = recovery_timeout
+        self.state = self.CLOSED
+        self.failures = 0
+        self._opened_at = 0.0
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        """Return whether a call may be made now"""
+        with self._lock:
+            if self.state == self.CLOSED:
+                return True
+            if self.state == self.OPEN and time.monotonic() - self._opened_at >= self.recovery_timeout:
+                # Let exactly one probe through; others are refused until it reports back
+                self.state = self.HALF_OPEN
+                return True
+            return False
+
+    def record_success(self):
+        """Close the circuit after a call that reached the backend"""
+        with self._lock:
+            self.state = self.CLOSED
+            self.failures = 0
+
+    def record_failure(self):
+        """Count a failed call, opening the circuit at the threshold or on a failed probe"""
+        with self._lock:
+            self.failures += 1
+            if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+                self.state = self.OPEN
+                self._opened_at = time.monotonic()
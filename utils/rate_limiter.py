@@ -0,0 +1,69 @@
+"""
+Token bucket rate limiter for throttling outbound LLM/API requests
+"""
+
+import asyncio
+import threading
+import time
+
+
+class RateLimiter:
+    """
+    Token bucket that allows `rate` requests per second with bursts of up to `burst`
+
+    Callers that arrive when the bucket is empty reserve the next free slot and
+    wait for it, so requests are spread out instead of failing with HTTP 429.
+    The bucket state is guarded by a thread lock (not an asyncio primitive) so
+    one limiter can be shared across event loops and worker threads.
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        """
+        Initialize the rate limiter
+
+        Args:
+            rate: Sustained requests per second
+            burst: Maximum number of requests allowed back to back
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def per_minute(cls, requests_per_minute: float, burst: int = 1) -> "RateLimiter":
+        """Create a limiter from a requests-per-minute budget"""
+        return cls(requests_per_minute / 60.0, burst)
+
+    def _reserve(self, tokens: float = 1) -> float:
+        """
+        Take tokens and return how long the caller must wait before using them
+
+        Args:
+            tokens: Cost of the request, e.g. its estimated LLM tokens for a
+                tokens-per-minute budget (may exceed the burst size)
+
+        Returns:
+            Delay in seconds (0 when the tokens were immediately available)
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= tokens
+            return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+    async def acquire(self, tokens: float = 1):
+        """Wait until a request may be sent"""
+        delay = self._reserve(tokens)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def wait(self, tokens: float = 1):
+        """Block the calling thread until a request may be sent"""
+        delay = self._reserve(tokens)
+        if delay > 0:
+            time.sleep(delay)
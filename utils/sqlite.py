@@ -0,0 +1,32 @@
+"""
+Shared SQLite connection setup for the on-disk caches and stores
+"""
+
+import os
+import sqlite3
+
+
+def open_sqlite(path: str) -> sqlite3.Connection:
+    """
+    Open a SQLite database shared across threads, creating its directory
+
+    The connection uses write-ahead logging, so the app and the API server
+    can read while the other one writes. With synchronous=NORMAL, a commit
+    does not wait for an fsync. Callers guard the returned connection with
+    their own lock.
+
+    Args:
+        path: SQLite database file
+
+    Returns:
+        Configured connection
+    """
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    conn = sqlite3.connect(path, check_same_thread=False)
+    conn.executescript(
+        "PRAGMA journal_mode=WAL; PRAGMA synchronous=NORMAL; "
+        "PRAGMA mmap_size=268435456; PRAGMA temp_store=MEMORY;"
+    )
+    return conn
@@ -12,6 +12,15 @@ from typing import Dict, Any, Optional
 from datetime import datetime
 import os
 
+try:
+    import orjson
+
+    def _format_json(data: Any) -> str:
+        return orjson.dumps(data, default=str, option=orjson.OPT_INDENT_2).decode('utf-8')
+except ImportError:
+    def _format_json(data: Any) -> str:
+        return json.dumps(data, indent=2, default=str)
+
 # Page configuration
 st.set_page_config(
     page_title="Video Analysis Platform",
@@ -319,8 +328,7 @@ def render_llm_analysis(data: Dict[str, Any]):
         st.markdown("#### 🔍 Key Insights")
         insights = llm_analysis['key_insights']
         if isinstance(insights, list):
-            for insight in insights:
-                st.markdown(f"- {insight}")
+            st.markdown("\n".join(f"- {insight}" for insight in insights))
         else:
             st.write(insights)
 
@@ -380,9 +388,10 @@ def render_results(results: Dict[str, Any]):
     st.divider()
     render_llm_analysis(results)
     
-    # Raw data expander
-    with st.expander("🔧 View Raw Data"):
-        st.json(results)
+    # Raw data is only serialized when requested; an expander would still
+    # render (and send) the full JSON on every rerun while collapsed
+    if st.checkbox("🔧 View Raw Data", key="show_raw_data"):
+        st.code(_format_json(results), language="json")
 
 def main():
     """Main application logic"""
@@ -10,6 +10,12 @@ from typing import Optional, Dict
 from .base_fetcher import BaseVideoFetcher, VideoMetadata
 
 
+# Post, reel and IGTV links, plus instagr.am short links; m.instagram.com is
+# matched by the instagram.com branch
+URL_PATTERN = re.compile(r'instagram\.com/(?:p|reel|tv)/|instagr\.am/(?:p|reel)/')
+USERNAME_PATTERN = re.compile(r'instagram\.com/([^/]+)')
+
+
 class InstagramFetcher(BaseVideoFetcher):
     """Fetcher for Instagram video metadata."""
     
@@ -18,16 +24,7 @@ class InstagramFetcher(BaseVideoFetcher):
     
     def can_fetch(self, url: str) -> bool:
         """Check if this fetcher can handle the given URL."""
-        instagram_patterns = [
-            r'instagram\.com/p/',
-            r'instagram\.com/reel/',
-            r'instagram\.com/tv/',
-            r'm\.instagram\.com/p/',
-            r'm\.instagram\.com/reel/',
-            r'instagr\.am/p/',
-            r'instagr\.am/reel/'
-        ]
-        return any(re.search(pattern, url) for pattern in instagram_patterns)
+        return URL_PATTERN.search(url) is not None
     
     def fetch_metadata(self, url: str) -> VideoMetadata:
         """
@@ -111,7 +108,7 @@ class InstagramFetcher(BaseVideoFetcher):
         thumbnail_url = get_meta_content('image')
         
         # Extract username from URL if possible
-        username_match = re.search(r'instagram\.com/([^/]+)', url)
+        username_match = USERNAME_PATTERN.search(url)
         username = username_match.group(1) if username_match else ''
         
         # Try to extract view count from meta tags
@@ -144,7 +141,7 @@ class InstagramFetcher(BaseVideoFetcher):
                 title = h2.get_text(strip=True)
         
         # Extract username from URL
-        username_match = re.search(r'instagram\.com/([^/]+)', url)
+        username_match = USERNAME_PATTERN.search(url)
         username = username_match.group(1) if username_match else ''
         
         # Try to find description
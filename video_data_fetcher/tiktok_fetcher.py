@@ -10,6 +10,13 @@ from typing import Optional, Dict
 from .base_fetcher import BaseVideoFetcher, VideoMetadata
 
 
+# Profile, video and short links, including vm. and m.tiktok.com
+URL_PATTERN = re.compile(r'tiktok\.com/(?:@|video/|t/)|m\.tiktok\.com/v/|vm\.tiktok\.com/')
+USERNAME_PATTERN = re.compile(r'tiktok\.com/@([^/]+)')
+VIEWS_TEXT_PATTERN = re.compile(r'(\d+(?:\.\d+)?[KMB]?) views?', re.I)
+VIEWS_COUNT_PATTERN = re.compile(r'(\d+(?:\.\d+)?[KMB]?)')
+
+
 class TikTokFetcher(BaseVideoFetcher):
     """Fetcher for TikTok video metadata."""
     
@@ -18,14 +25,7 @@ class TikTokFetcher(BaseVideoFetcher):
     
     def can_fetch(self, url: str) -> bool:
         """Check if this fetcher can handle the given URL."""
-        tiktok_patterns = [
-            r'tiktok\.com/@',
-            r'tiktok\.com/video/',
-            r'm\.tiktok\.com/v/',
-            r'vm\.tiktok\.com/',
-            r'tiktok\.com/t/'
-        ]
-        return any(re.search(pattern, url) for pattern in tiktok_patterns)
+        return URL_PATTERN.search(url) is not None
     
     def fetch_metadata(self, url: str) -> VideoMetadata:
         """
@@ -99,7 +99,7 @@ class TikTokFetcher(BaseVideoFetcher):
         thumbnail_url = get_meta_content('image')
         
         # Extract username from URL if possible
-        username_match = re.search(r'tiktok\.com/@([^/]+)', url)
+        username_match = USERNAME_PATTERN.search(url)
         username = username_match.group(1) if username_match else ''
         
         # Try to extract view count from meta tags
@@ -132,7 +132,7 @@ class TikTokFetcher(BaseVideoFetcher):
                 title = h2.get_text(strip=True)
         
         # Extract username from URL
-        username_match = re.search(r'tiktok\.com/@([^/]+)', url)
+        username_match = USERNAME_PATTERN.search(url)
         username = username_match.group(1) if username_match else ''
         
         # Try to find description
@@ -171,10 +171,10 @@ class TikTokFetcher(BaseVideoFetcher):
         
         # Try to extract view count from text
         views = None
-        view_elements = soup.find_all(text=re.compile(r'(\d+(?:\.\d+)?[KMB]?) views?', re.I))
+        view_elements = soup.find_all(text=VIEWS_TEXT_PATTERN)
         if view_elements:
             views_text = view_elements[0]
-            views_match = re.search(r'(\d+(?:\.\d+)?[KMB]?)', views_text)
+            views_match = VIEWS_COUNT_PATTERN.search(views_text)
             if views_match:
                 views = self.format_views(views_match.group(1))
         
@@ -10,6 +10,14 @@ from typing import Optional, Dict
 from .base_fetcher import BaseVideoFetcher, VideoMetadata
 
 
+# Status links on twitter.com or x.com; mobile. and m.twitter.com are matched
+# by the twitter.com branch
+URL_PATTERN = re.compile(r'(?:twitter|x)\.com/[^/]+/status/')
+USERNAME_PATTERN = re.compile(r'(?:twitter|x)\.com/([^/]+)')
+VIEWS_TEXT_PATTERN = re.compile(r'(\d+(?:\.\d+)?[KMB]?) views?', re.I)
+VIEWS_COUNT_PATTERN = re.compile(r'(\d+(?:\.\d+)?[KMB]?)')
+
+
 class TwitterFetcher(BaseVideoFetcher):
     """Fetcher for Twitter/X video metadata."""
     
@@ -18,13 +26,7 @@ class TwitterFetcher(BaseVideoFetcher):
     
     def can_fetch(self, url: str) -> bool:
         """Check if this fetcher can handle the given URL."""
-        twitter_patterns = [
-            r'twitter\.com/[^/]+/status/',
-            r'x\.com/[^/]+/status/',
-            r'mobile\.twitter\.com/[^/]+/status/',
-            r'm\.twitter\.com/[^/]+/status/'
-        ]
-        return any(re.search(pattern, url) for pattern in twitter_patterns)
+        return URL_PATTERN.search(url) is not None
     
     def fetch_metadata(self, url: str) -> VideoMetadata:
         """
@@ -96,7 +98,7 @@ class TwitterFetcher(BaseVideoFetcher):
         thumbnail_url = get_meta_content('image')
         
         # Extract username from URL if possible
-        username_match = re.search(r'(?:twitter|x)\.com/([^/]+)', url)
+        username_match = USERNAME_PATTERN.search(url)
         username = username_match.group(1) if username_match else ''
         
         return VideoMetadata(
@@ -122,7 +124,7 @@ class TwitterFetcher(BaseVideoFetcher):
                 title = h2.get_text(strip=True)
         
         # Extract username from URL
-        username_match = re.search(r'(?:twitter|x)\.com/([^/]+)', url)
+        username_match = USERNAME_PATTERN.search(url)
         username = username_match.group(1) if username_match else ''
         
         # Try to find description (tweet content)
@@ -162,10 +164,10 @@ class TwitterFetcher(BaseVideoFetcher):
         
         # Try to extract engagement metrics
         views = None
-        engagement_elements = soup.find_all(text=re.compile(r'(\d+(?:\.\d+)?[KMB]?) views?', re.I))
+        engagement_elements = soup.find_all(text=VIEWS_TEXT_PATTERN)
         if engagement_elements:
             views_text = engagement_elements[0]
-            views_match = re.search(r'(\d+(?:\.\d+)?[KMB]?)', views_text)
+            views_match = VIEWS_COUNT_PATTERN.search(views_text)
             if views_match:
                 views = self.format_views(views_match.group(1))
         
@@ -11,6 +11,13 @@ from urllib.parse import parse_qs, urlparse
 from .base_fetcher import BaseVideoFetcher, VideoMetadata
 
 
+# Watch, Shorts and youtu.be links; m.youtube.com is matched by the youtube.com branch
+URL_PATTERN = re.compile(r'youtube\.com/(?:watch\?v=|shorts/)|youtu\.be/')
+VIDEO_ID_PATTERN = re.compile(r'(?:youtube\.com/(?:watch\?v=|shorts/)|youtu\.be/)([a-zA-Z0-9_-]{11})')
+VIEWS_TEXT_PATTERN = re.compile(r'(\d+(?:\.\d+)?[KMB]?) views?', re.I)
+VIEWS_COUNT_PATTERN = re.compile(r'(\d+(?:\.\d+)?[KMB]?)')
+
+
 class YouTubeFetcher(BaseVideoFetcher):
     """Fetcher for YouTube video metadata."""
     
@@ -20,13 +27,7 @@ class YouTubeFetcher(BaseVideoFetcher):
     
     def can_fetch(self, url: str) -> bool:
         """Check if this fetcher can handle the given URL."""
-        youtube_patterns = [
-            r'youtube\.com/watch\?v=',
-            r'youtube\.com/shorts/',
-            r'youtu\.be/',
-            r'm\.youtube\.com/watch\?v='
-        ]
-        return any(re.search(pattern, url) for pattern in youtube_patterns)
+        return URL_PATTERN.search(url) is not None
     
     def fetch_metadata(self, url: str) -> VideoMetadata:
         """
@@ -51,19 +52,8 @@ class YouTubeFetcher(BaseVideoFetcher):
     
     def _extract_video_id(self, url: str) -> Optional[str]:
         """Extract video ID from YouTube URL."""
-        patterns = [
-            r'youtube\.com/watch\?v=([a-zA-Z0-9_-]{11})',
-            r'youtube\.com/shorts/([a-zA-Z0-9_-]{11})',
-            r'youtu\.be/([a-zA-Z0-9_-]{11})',
-            r'm\.youtube\.com/watch\?v=([a-zA-Z0-9_-]{11})'
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, url)
-            if match:
-                return match.group(1)
-        
-        return None
+        match = VIDEO_ID_PATTERN.search(url)
+        return match.group(1) if match else None
     
     def _fetch_with_api(self, url: str) -> VideoMetadata:
         """Fetch metadata using YouTube Data API v3."""
@@ -160,10 +150,10 @@ class YouTubeFetcher(BaseVideoFetcher):
         
         # Try to extract view count from page
         views = None
-        view_elements = soup.find_all(string=re.compile(r'(\d+(?:\.\d+)?[KMB]?) views?', re.I))
+        view_elements = soup.find_all(string=VIEWS_TEXT_PATTERN)
         if view_elements:
             views_text = view_elements[0]
-            views_match = re.search(r'(\d+(?:\.\d+)?[KMB]?)', views_text)
+            views_match = VIEWS_COUNT_PATTERN.search(views_text)
             if views_match:
                 views = self.format_views(views_match.group(1))
         